@@ -1,3 +1,5 @@
 import controller.admin_controller as controller
 
-controller.main()
\ No newline at end of file
+# parse workers re-import this script when they start, only the real entry point runs the app
+if __name__ == "__main__":
+    controller.main()
@@ -6,6 +6,7 @@ import time
 
 from model.model_factory import ModelFactory
 import controller.commands as commands
+from controller.async_runtime import AsyncRuntime
 from log_config.logger_configurer import configure_logger, resolve_class_module_name
 
 logger = logging.getLogger(__name__)
@@ -17,6 +18,9 @@ class TerminalInterface:
     def __init__(self):
         logger.debug("Initializing TerminalInterface", extra={"tags": ["debug", "event", "startup"]})
         self.commands = self.get_commands()
+        # one event loop for the whole admin session, so sessions, pools and caches outlive a single command
+        self.runtime = AsyncRuntime()
+        self.runtime.add_shutdown_callback(self._shutdown_handlers)
         logger.info("TerminalInterface initialized with commands", extra={
             "tags": ["info", "event"],
             "event_type": "startup",
@@ -40,6 +44,32 @@ class TerminalInterface:
 
     def run(self):
         logger.info("TerminalInterface run loop started", extra={"tags": ["info", "event"], "event_type": "run_loop"})
+        self.runtime.start()
+        try:
+            self._run_loop()
+        finally:
+            self.runtime.stop()
+
+    async def _shutdown_handlers(self):
+        from model.scrapers.request_handler import RequestHandler, PlaywrightRequestHandler
+        from model.scrapers.parse_executor import ParseExecutor
+
+        for handler_class in (RequestHandler, PlaywrightRequestHandler):
+            handler = handler_class._instance
+            if handler is not None and handler._is_configured:
+                await handler.shutdown()
+
+        if ParseExecutor._instance is not None:
+            ParseExecutor._instance.shutdown()
+
+    def _begin_run(self):
+        from model.scrapers.request_handler import RequestHandler
+
+        handler = RequestHandler._instance
+        if handler is not None and handler._is_configured:
+            handler.begin_run()
+
+    def _run_loop(self):
         while True:
             try:
                 command_line = input(">> Enter command:\t")
@@ -95,6 +125,7 @@ class TerminalInterface:
                 })
 
                 command_obj = self.commands[command](*args)
+                self._begin_run()
                 command_obj.execute_command()
 
                 logger.info("Command executed successfully", extra={
@@ -0,0 +1,98 @@
+import asyncio, logging, threading
+from threading import Lock
+
+logger = logging.getLogger(__name__)
+
+class AsyncRuntime:
+    _instance = None
+    _lock = Lock()
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                logger.debug("Creating a new instance of AsyncRuntime", extra={"tags": ["singleton", "init"]})
+                cls._instance = super(AsyncRuntime, cls).__new__(cls)
+                cls._instance._loop = None
+                cls._instance._thread = None
+                cls._instance._shutdown_callbacks = []
+        return cls._instance
+
+    @classmethod
+    def reset(cls):
+        logger.info("Resetting AsyncRuntime singleton instance", extra={"tags": ["reset"]})
+        cls._instance = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._loop is not None and self._loop.is_running()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop | None:
+        return self._loop
+
+    def start(self):
+        if self.is_running:
+            return
+
+        self._loop = asyncio.new_event_loop()
+        started = threading.Event()
+        self._loop.call_soon(started.set)
+        self._thread = threading.Thread(target=self._loop.run_forever, name="async-runtime", daemon=True)
+        self._thread.start()
+        started.wait()
+        logger.info("Async runtime started", extra={"tags": ["runtime", "startup"]})
+
+    def add_shutdown_callback(self, callback):
+        # async callables awaited on the runtime loop before it stops, e.g. closing http sessions
+        self._shutdown_callbacks.append(callback)
+
+    def run(self, coro, timeout: float | None = None):
+        if not self.is_running:
+            # outside the admin interface (tests, one-off scripts) each call still gets its own loop
+            return asyncio.run(coro)
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("AsyncRuntime.run() can't be called from the runtime loop itself, await the coroutine instead")
+
+        # call_soon_threadsafe copies the caller's context, so context variables such as the request priority carry over
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            # covers KeyboardInterrupt and timeouts: the command is abandoned, so is its coroutine
+            future.cancel()
+            raise
+
+    def stop(self, timeout: float = 30):
+        if not self.is_running:
+            return
+
+        logger.info("Stopping async runtime", extra={"tags": ["runtime", "shutdown"]})
+        try:
+            asyncio.run_coroutine_threadsafe(self._drain(), self._loop).result(timeout)
+        except Exception as e:
+            logger.error("Async runtime did not drain cleanly", extra={"tags": ["runtime", "shutdown"], "error": str(e)})
+
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout)
+        self._loop.close()
+        self._loop = None
+        self._thread = None
+        logger.info("Async runtime stopped", extra={"tags": ["runtime", "shutdown"]})
+
+    async def _drain(self):
+        for callback in self._shutdown_callbacks:
+            try:
+                await callback()
+            except Exception as e:
+                logger.error("Runtime shutdown callback failed", extra={"tags": ["runtime", "shutdown"], "error": str(e)})
+
+        current = asyncio.current_task()
+        remaining = [task for task in asyncio.all_tasks() if task is not current]
+        for task in remaining:
+            task.cancel()
+        await asyncio.gather(*remaining, return_exceptions=True)
+
+
+def run_coroutine(coro, timeout: float | None = None):
+    return AsyncRuntime().run(coro, timeout)
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
-import os, sys, asyncio, inspect, subprocess, time
+import os, sys, json, asyncio, inspect, subprocess, time
 from sqlite3 import IntegrityError
 from model.model_factory import ModelFactory
+from model.scrapers.request_queue import Priority, request_priority
+from controller.async_runtime import run_coroutine
 from log_config.logger_configurer import configure_logger, resolve_class_module_name
 import logging, traceback
 
@@ -84,9 +86,9 @@ class DatabaseUpdate(ICommand):
         configure_logger(resolve_class_module_name(ClubDataScraper))
         configure_logger(resolve_class_module_name(ClubUrlsScraper))
 
-        database_model = ModelFactory.create_model('teams')
-
         async def coro():
+            # created on the runtime loop's thread, sqlite connections can't cross threads
+            database_model = ModelFactory.create_model('teams')
             try:
                 club_urls_scraper = ClubUrlsScraper()
                 await club_urls_scraper.initialize()
@@ -106,45 +108,82 @@ class DatabaseUpdate(ICommand):
                         database_model.update_record(club_data)
                         logger.warning("Duplicate club data updated", extra={"tags": ["warning"], "error": str(e), "resource": "teams"})
 
-                tasks = [asyncio.wait_for(scrape_club_data_and_save_to_database(url), timeout=2) for url in club_page_urls]
+                tasks = [scrape_club_data_and_save_to_database(url) for url in club_page_urls]
                 await asyncio.gather(*tasks)
             except Exception as e:
                 logger.error("Failed to update teams", extra={"tags": ["exception"], "error": traceback.format_exc()})
 
-        asyncio.run(coro())
+        run_coroutine(coro())
 
     def update_matches_model(self):
         from model.scrapers.match_data_scraper import MatchDataScraper
         from model.scrapers.match_urls_scraper import MatchUrlsScraper
+        from model.scrapers.match_scraping_pipeline import MatchScrapingPipeline
+        from model.scrapers.club_name_resolver import ClubNameResolver
 
         configure_logger(resolve_class_module_name(MatchUrlsScraper))
         configure_logger(resolve_class_module_name(MatchDataScraper))
-
-        database_model = ModelFactory.create_model('matches')
+        configure_logger(resolve_class_module_name(MatchScrapingPipeline))
 
         async def coro():
+            database_model = ModelFactory.create_model('matches')
             try:
+                teams_model = ModelFactory.create_model('teams')
+                ClubNameResolver().configure(teams_model)
+                club_ids = self._get_club_ids(teams_model)
+
                 match_urls_scraper = MatchUrlsScraper()
                 await match_urls_scraper.initialize()
                 match_page_urls = await match_urls_scraper.get_match_urls()
                 logger.debug("Match URLs fetched", extra={"tags": ["network"], "destination": "match_urls_source", "method": "GET"})
 
-                async def scrape_match_data_and_save_to_database(url):
-                    match_scraper = MatchDataScraper()
-                    await match_scraper.initialize()
-                    match_data = await match_scraper.get_all_data()
+                def save_match_data(url, match_data):
+                    match_record = self._match_record(match_data, club_ids)
+                    if match_record['home_team_id'] is None or match_record['away_team_id'] is None:
+                        # the team id columns are NOT NULL, a match with a club missing from teams can't be stored
+                        logger.warning("Match skipped, club id unknown", extra={
+                            "tags": ["warning"], "resource": "matches", "url": url,
+                            "value": [match_data['home_team_data']['name'], match_data['away_team_data']['name']],
+                        })
+                        return
                     try:
-                        database_model.creat_record(match_data)
+                        database_model.create_record(match_record)
                         logger.info("Match data inserted", extra={"tags": ["event", "access"], "resource": "matches"})
                     except IntegrityError:
-                        database_model.update_record(match_data)
+                        database_model.update_record(match_record)
                         logger.warning("Match data updated after IntegrityError", extra={"tags": ["warning"], "resource": "matches"})
 
-                await asyncio.gather(*(scrape_match_data_and_save_to_database(url) for url in match_page_urls))
+                pipeline = MatchScrapingPipeline(on_result=save_match_data)
+                urls = [url for round_urls in match_page_urls.values() for url in round_urls]
+                stats = await pipeline.run(urls)
+                print(f"{stats['completed']}/{stats['total']} matches scraped, {stats['failed']} failed, "
+                      f"{stats['matches_per_minute']} matches/min")
             except Exception:
                 logger.error("Failed to update matches", extra={"tags": ["exception"], "error": traceback.format_exc()})
 
-        asyncio.run(coro())
+        run_coroutine(coro())
+
+    @staticmethod
+    def _get_club_ids(teams_model) -> dict:
+        try:
+            return teams_model.get_specific_column('id', key='name')
+        except Exception as e:
+            logger.warning("Club ids unavailable, matches whose clubs can't be resolved are skipped", extra={"tags": ["warning"], "error": str(e), "resource": "teams"})
+            return dict()
+
+    @staticmethod
+    def _match_record(match_data: dict, club_ids: dict) -> dict:
+        home_team_data = match_data['home_team_data']
+        away_team_data = match_data['away_team_data']
+        return {
+            'timestamp': match_data['timestamp'],
+            'match_week': match_data['round_number'],
+            'referee': match_data['referee_name'],
+            'home_team_id': club_ids.get(home_team_data['name']),
+            'home_team_data': json.dumps(home_team_data),
+            'away_team_id': club_ids.get(away_team_data['name']),
+            'away_team_data': json.dumps(away_team_data),
+        }
 
     def update_players_model(self):
         from model.scrapers.player_data_scraper import PlayerDataScraper
@@ -155,9 +194,8 @@ class DatabaseUpdate(ICommand):
         configure_logger(resolve_class_module_name(PlayerDataScraper))
         configure_logger(resolve_class_module_name(PlayerUrlsScraper))
 
-        database_model = ModelFactory.create_model('players')
-
         async def coro():
+            database_model = ModelFactory.create_model('players')
             try:
                 club_urls_scraper = ClubUrlsScraper()
                 await club_urls_scraper.initialize()
@@ -188,16 +226,15 @@ class DatabaseUpdate(ICommand):
             except Exception:
                 logger.error("Failed to update players", extra={"tags": ["exception"], "error": traceback.format_exc()})
 
-        asyncio.run(coro())
+        run_coroutine(coro())
 
     def update_tables_model(self):
         from model.scrapers.tables_data_scraper import TablesDataScraper
 
         configure_logger(resolve_class_module_name(TablesDataScraper))
 
-        database_model = ModelFactory.create_model('tables')
-
         async def coro():
+            database_model = ModelFactory.create_model('tables')
             try:
                 scraper = TablesDataScraper()
                 await scraper.initialize()
@@ -212,7 +249,7 @@ class DatabaseUpdate(ICommand):
             except Exception as e:
                 logger.error("Failed to update tables", extra={"tags": ["exception"], "error": traceback.format_exc()})
 
-        asyncio.run(coro())
+        run_coroutine(coro())
 
 class ScrapeDataCommand(ICommand): 
     base_name = 'scrape'
@@ -243,12 +280,16 @@ class ScrapeDataCommand(ICommand):
 
     def execute_command(self):
         logger.info("Executing scrape command", extra={"tags": ["event", "access"], "action": "scrape", "resource": self._type})
+        # a user is waiting on this one, so its requests jump ahead of any bulk refresh
+        token = request_priority.set(Priority.INTERACTIVE)
         try:
             data = self._scraper.scrape_data()
             logger.info("Scraping completed", extra={"tags": ["event"], "event_type": "data_scraped", "scraper_type": self._type})
         except Exception as e:
             logger.error("Scraping failed", extra={"tags": ["exception"], "error": traceback.format_exc()})
             raise
+        finally:
+            request_priority.reset(token)
 
         self._printer.print_data(data)
 
@@ -293,7 +334,7 @@ class ScrapeDataCommand(ICommand):
             self._validate_arguments(*args)
 
         def scrape_data(self):
-            return asyncio.run(self._main())
+            return run_coroutine(self._main())
 
         def _validate_arguments(self, *args):
             logger.debug("Validating arguments for ClubUrlsScraper", extra={"tags": ["debug", "validation"], "args": args})
@@ -316,7 +357,7 @@ class ScrapeDataCommand(ICommand):
 
         def scrape_data(self):
             try:
-                result = asyncio.run(self._main())
+                result = run_coroutine(self._main())
                 logger.info("Club data scraped successfully", extra={"tags": ["event"], "event_type": "club_data_scraped"})
                 return result
             except Exception as e:
@@ -348,7 +389,7 @@ class ScrapeDataCommand(ICommand):
 
         def scrape_data(self):
             logger.debug("Starting scrape_data in MatchUrlsScraper", extra={"tags": ["debug"]})
-            result = asyncio.run(self._main())
+            result = run_coroutine(self._main())
             logger.debug("Completed scrape_data in MatchUrlsScraper", extra={"tags": ["debug"]})
             return result
 
@@ -383,7 +424,7 @@ class ScrapeDataCommand(ICommand):
 
         def scrape_data(self):
             logger.debug("Starting scrape_data in MatchDataScraper", extra={"tags": ["debug"]})
-            result = asyncio.run(self._main())
+            result = run_coroutine(self._main())
             logger.debug("Completed scrape_data in MatchDataScraper", extra={"tags": ["debug"]})
             return result
 
@@ -418,7 +459,7 @@ class ScrapeDataCommand(ICommand):
             self.arguments = args[1:]
 
         def scrape_data(self):
-            return asyncio.run(self._main())
+            return run_coroutine(self._main())
 
         async def _main(self):
             from model.scrapers.player_urls_scraper import PlayerUrlsScraper
@@ -464,7 +505,7 @@ class ScrapeDataCommand(ICommand):
             self.urls = args
 
         def scrape_data(self):
-            return asyncio.run(self._main())
+            return run_coroutine(self._main())
 
         async def _main(self):
             from model.scrapers.player_data_scraper import PlayerDataScraper
@@ -493,7 +534,7 @@ class ScrapeDataCommand(ICommand):
             self._validate_arguments(*args)
 
         def scrape_data(self):
-            return asyncio.run(self._main())
+            return run_coroutine(self._main())
 
         async def _main(self):
             from model.scrapers.tables_data_scraper import TablesDataScraper
@@ -589,7 +630,7 @@ class TestRequestHandler(ICommand):
             "tags": ["event"],
             "event_type": "execute_command"
         })
-        asyncio.run(self._main())
+        run_coroutine(self._main())
 
     async def _main(self):
         from model.scrapers.request_handler import RequestHandler
@@ -624,10 +665,109 @@ class TestRequestHandler(ICommand):
 
             for i, result in enumerate(results, 1):
                 print(f"\n--- Result {i} ---\n{result[:500]}...\n")
+            print(f"duplicate requests coalesced: {handler.coalesced_requests}")
+            concurrency = handler.concurrency.snapshot()
+            print(f"concurrency limit: {concurrency['limit']} (latency p50: {concurrency['latency_p50']}, p95: {concurrency['latency_p95']})")
+            for change in concurrency['history']:
+                print(f"  {change['previous']} -> {change['limit']} ({change['reason']})")
 
         except Exception as e:
             logger.critical("Unhandled error in request handler execution", extra={
                 "tags": ["critical", "exception"],
                 "error": traceback.format_exc()
             })
-            print(f"Error occurred: {e}")
\ No newline at end of file
+            print(f"Error occurred: {e}")
+
+
+class RequestMetricsCommand(ICommand):
+    base_name = 'request_metrics'
+    description = "show latency, status and queue metrics collected by RequestHandler, 'export <path>' saves a snapshot, 'reset' clears them"
+
+    def __init__(self, *args):
+        logger.debug("Initializing RequestMetricsCommand", extra={"tags": ["debug", "event"], "args": args})
+        if args and args[0] not in ('export', 'reset'):
+            logger.error("Invalid request_metrics action", extra={"tags": ["validation", "exception"], "field": "action", "value": args[0]})
+            raise ValueError(f"unknown action: {args[0]}")
+        self._action = args[0] if args else 'show'
+        self._path = args[1] if len(args) > 1 else f"request_metrics_{time.strftime('%Y%m%d_%H%M%S')}.json"
+
+    def execute_command(self):
+        from model.scrapers.request_handler import RequestHandler
+
+        handler = RequestHandler()
+        metrics = getattr(handler, 'metrics', None)
+        if metrics is None:
+            print("no requests have been made in this session yet")
+            return
+
+        logger.info("Executing request_metrics command", extra={"tags": ["event", "access"], "action": self._action, "resource": "request_metrics"})
+        result = run_coroutine(self._main(metrics))
+        if self._action == 'export':
+            print(f"metrics snapshot written to {result}")
+        elif self._action == 'reset':
+            print("request metrics cleared")
+        else:
+            self._print_snapshot(result)
+
+    async def _main(self, metrics):
+        # runs on the same loop as the requests, so a snapshot never races the counters it reads
+        if self._action == 'export':
+            return metrics.export(self._path)
+        if self._action == 'reset':
+            return metrics.reset()
+        return metrics.snapshot()
+
+    @staticmethod
+    def _print_snapshot(snapshot):
+        print(f"requests: {snapshot['requests']}  bytes received: {snapshot['bytes_received']}")
+        print(f"status codes: {snapshot['status_counts']}")
+        print(f"queue wait:   p50={snapshot['queue_wait']['p50']}  p95={snapshot['queue_wait']['p95']}")
+        print(f"network time: p50={snapshot['network_time']['p50']}  p95={snapshot['network_time']['p95']}")
+        for title, key in (("latency by host", "latency_by_host"), ("latency by url pattern", "latency_by_pattern")):
+            print(f"\n{title}:")
+            for name, histogram in snapshot[key].items():
+                print(f"\t{name}: count={histogram['count']}  p50={histogram['p50']}  p95={histogram['p95']}  max={histogram['max']}")
+        print("\ngauges:")
+        for name, value in snapshot['gauges'].items():
+            print(f"\t{name}: {value}")
+
+class TransportCommand(ICommand):
+    base_name = 'transport'
+    description = "choose where RequestHandler gets responses from: 'live', 'record [archive_dir]' or 'replay [archive_dir] [latency] [jitter]'"
+
+    def __init__(self, *args):
+        logger.debug("Initializing TransportCommand", extra={"tags": ["debug", "event"], "args": args})
+        from model.scrapers.transport import LiveTransport, RecordingTransport, ReplayTransport, ResponseArchive, DEFAULT_ARCHIVE_DIR
+
+        self._mode = args[0] if args else None
+        directory = args[1] if len(args) > 1 else DEFAULT_ARCHIVE_DIR
+        try:
+            if self._mode is None:
+                self._transport = None
+            elif self._mode == 'live':
+                self._transport = LiveTransport()
+            elif self._mode == 'record':
+                self._transport = RecordingTransport(ResponseArchive(directory))
+            elif self._mode == 'replay':
+                latency = float(args[2]) if len(args) > 2 else 0.0
+                jitter = float(args[3]) if len(args) > 3 else 0.0
+                self._transport = ReplayTransport(ResponseArchive(directory), latency=latency, jitter=jitter)
+            else:
+                raise ValueError(f"unknown transport mode: {self._mode}")
+        except ValueError as e:
+            logger.error("Invalid transport arguments", extra={"tags": ["validation", "exception"], "field": "transport", "value": args, "error": str(e)})
+            raise
+
+    def execute_command(self):
+        from model.scrapers.request_handler import RequestHandler
+
+        handler = RequestHandler()
+        if self._transport is None:
+            transport = getattr(handler, 'transport', None)
+            print(f"current transport: {type(transport).__name__ if transport else 'LiveTransport'}")
+            return
+
+        # picked up by the next configure(), which opens a session on the new transport
+        handler.transport = self._transport
+        logger.info("RequestHandler transport changed", extra={"tags": ["event"], "event_type": "transport_changed", "value": self._mode})
+        print(f"RequestHandler now uses the {self._mode} transport")
@@ -0,0 +1,380 @@
+import asyncio, time, logging, itertools
+import psutil
+from contextlib import asynccontextmanager
+from playwright.async_api import async_playwright
+
+logger = logging.getLogger(__name__)
+
+class PooledBrowser:
+    def __init__(self, browser, marker: str | None = None):
+        self.browser = browser
+        self.marker = marker
+        self.leases = 0
+        self.navigations = 0
+        self.last_used = time.monotonic()
+        self.retiring = False
+        self.peak_rss = 0
+        self._process = None
+
+    @property
+    def is_available(self) -> bool:
+        return not self.retiring and self.browser.is_connected()
+
+    def rss(self) -> int | None:
+        # renderers are separate processes under the browser, the whole tree counts against the budget
+        process = self._find_process()
+        if process is None:
+            return None
+        try:
+            rss = sum(child.memory_info().rss for child in [process, *process.children(recursive=True)])
+        except psutil.Error:
+            self._process = None
+            return None
+        self.peak_rss = max(self.peak_rss, rss)
+        return rss
+
+    def _find_process(self):
+        if self._process is not None or self.marker is None:
+            return self._process
+        try:
+            for process in psutil.Process().children(recursive=True):
+                cmdline = process.cmdline()
+                # child processes carry --type=..., the browser process itself doesn't
+                if self.marker in cmdline and not any(arg.startswith('--type=') for arg in cmdline):
+                    self._process = process
+                    break
+        except psutil.Error as e:
+            logger.debug("Failed to look up browser process", extra={"tags": ["browser_pool", "memory"], "error": str(e)})
+        return self._process
+
+
+class PooledPage:
+    # what callers hold for the length of a lease; when its browser dies the pool swaps a fresh page in underneath
+    def __init__(self, page, entry: PooledBrowser):
+        self._page = page
+        self.entry = entry
+        self._listeners = []
+
+    @property
+    def page(self):
+        return self._page
+
+    def on(self, event, handler):
+        self._listeners.append((event, handler))
+        self._page.on(event, handler)
+
+    def __getattr__(self, name):
+        return getattr(self._page, name)
+
+    def _swap(self, page, entry: PooledBrowser):
+        self._page = page
+        self.entry = entry
+        for event, handler in self._listeners:
+            page.on(event, handler)
+
+
+class BrowserPool:
+    # chromium ignores switches it doesn't know, this one only tags the process so its memory can be found
+    MARKER_SWITCH = '--premierleague-pool-browser'
+    # past this multiple of the budget a browser is closed under its pages instead of waiting for them to finish
+    HARD_LIMIT_FACTOR = 1.5
+
+    def __init__(self, max_browsers: int = 2, pages_per_browser: int = 4, max_navigations: int = 100,
+                 idle_timeout: float = 120.0, reap_interval: float = 30.0, launch_options: dict | None = None,
+                 context_options: dict | None = None, memory_budget: int | None = 1024, memory_check_interval: float = 10.0):
+        if max_browsers < 1 or pages_per_browser < 1:
+            raise ValueError("the pool needs at least one browser with at least one page")
+        if max_navigations < 1:
+            raise ValueError("max_navigations must be at least 1")
+        if memory_budget is not None and memory_budget <= 0:
+            raise ValueError("memory_budget must be positive, pass None to disable the memory watch")
+
+        self.max_browsers = max_browsers
+        self.pages_per_browser = pages_per_browser
+        self.max_navigations = max_navigations
+        self.idle_timeout = idle_timeout
+        self.reap_interval = reap_interval
+        self.launch_options = dict(launch_options or {"headless": True})
+        self.context_options = dict(context_options or {})
+        # in megabytes, per browser process tree
+        self.memory_budget = memory_budget
+        self.memory_check_interval = memory_check_interval
+        self.launched = 0
+        self.recycled = 0
+        self.reaped = 0
+        self.crashed = 0
+        self.memory_restarts = 0
+        self.renewed = 0
+        self._browsers: list[PooledBrowser] = []
+        self._condition = asyncio.Condition()
+        self._playwright = None
+        self._reaper_task = None
+        self._watchdog_task = None
+        self._discards = set()
+        # slots reserved by launches in flight, counted against max_browsers while the condition is released
+        self._launching = 0
+        self._startup_lock = asyncio.Lock()
+        self._markers = itertools.count(1)
+        self._closed = False
+
+    @property
+    def capacity(self) -> int:
+        return self.max_browsers * self.pages_per_browser
+
+    @asynccontextmanager
+    async def page(self):
+        leased = await self._lease()
+        try:
+            yield leased
+        finally:
+            await self._return(leased)
+
+    async def renew(self, leased: PooledPage):
+        # the lease survives a crashed page or browser: the caller keeps its PooledPage and gets a fresh page under it
+        old_entry = leased.entry
+        if old_entry is not None:
+            await self._close_context(leased.page)
+            # detached until the fresh page is in, so a renewal that times out doesn't release the old lease twice
+            leased.entry = None
+            await self._release(old_entry)
+
+        entry = await self._acquire()
+        try:
+            page = await self._open_page(entry)
+        except BaseException:
+            await self._release(entry)
+            raise
+        leased._swap(page, entry)
+        self.renewed += 1
+        logger.info("Leased page moved to a fresh browser page", extra={"tags": ["browser_pool", "recover"], "renewed": self.renewed})
+
+    def record_navigation(self, page):
+        entry = getattr(page, 'entry', None)
+        if not isinstance(entry, PooledBrowser):
+            return
+        entry.navigations += 1
+        if entry.navigations >= self.max_navigations and not entry.retiring:
+            # long-lived chromium processes creep in memory, so each one is replaced after a while
+            entry.retiring = True
+            self.recycled += 1
+            logger.info(f"Browser retiring after {entry.navigations} navigations", extra={"tags": ["browser_pool", "recycle"], "navigations": entry.navigations})
+
+    async def reap_idle(self):
+        now = time.monotonic()
+        async with self._condition:
+            for entry in list(self._browsers):
+                idle = now - entry.last_used >= self.idle_timeout
+                if entry.leases == 0 and (idle or not entry.browser.is_connected()):
+                    await self._close_browser(entry)
+                    self.reaped += 1
+                    logger.debug("Idle browser reaped", extra={"tags": ["browser_pool", "reap"], "browsers": len(self._browsers)})
+            self._condition.notify_all()
+
+    async def check_memory(self):
+        if self.memory_budget is None:
+            return
+
+        budget = self.memory_budget * 1024 * 1024
+        # walking the process tree is blocking /proc work, it runs off the loop and without the condition held
+        readings = await asyncio.to_thread(self._measure, list(self._browsers))
+        async with self._condition:
+            for entry, rss in readings:
+                # the browser may have been closed or dropped while it was measured
+                if rss is None or rss < budget or entry not in self._browsers:
+                    continue
+
+                if not entry.retiring:
+                    entry.retiring = True
+                    self.memory_restarts += 1
+                    logger.warning(
+                        f"Browser over its memory budget ({rss // (1024 * 1024)} MB), restarting it",
+                        extra={"tags": ["browser_pool", "memory"], "rss": rss, "budget": budget, "leases": entry.leases},
+                    )
+                # a retiring browser normally closes once its pages are returned, a runaway one can't wait that long;
+                # navigations it interrupts are re-queued by the request handler on a fresh page
+                if entry.leases == 0 or rss >= budget * self.HARD_LIMIT_FACTOR:
+                    await self._close_browser(entry)
+            self._condition.notify_all()
+
+    @staticmethod
+    def _measure(entries: list[PooledBrowser]) -> list[tuple[PooledBrowser, int | None]]:
+        return [(entry, entry.rss()) for entry in entries]
+
+    async def close(self):
+        self._closed = True
+        for task in (self._reaper_task, self._watchdog_task):
+            if task is None:
+                continue
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._reaper_task = None
+        self._watchdog_task = None
+
+        async with self._condition:
+            for entry in list(self._browsers):
+                await self._close_browser(entry)
+            self._condition.notify_all()
+
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+        logger.info("Browser pool closed", extra={"tags": ["browser_pool", "shutdown"], "launched": self.launched})
+
+    def snapshot(self) -> dict:
+        return {
+            "browsers": len(self._browsers),
+            "leased_pages": sum(entry.leases for entry in self._browsers),
+            "launched": self.launched,
+            "recycled": self.recycled,
+            "reaped": self.reaped,
+            "crashed": self.crashed,
+            "memory_restarts": self.memory_restarts,
+            "renewed": self.renewed,
+            "peak_rss": max((entry.peak_rss for entry in self._browsers), default=0),
+        }
+
+    async def _lease(self) -> PooledPage:
+        entry = await self._acquire()
+        try:
+            page = await self._open_page(entry)
+        except BaseException:
+            await self._release(entry)
+            raise
+        return PooledPage(page, entry)
+
+    async def _return(self, leased: PooledPage):
+        if leased.entry is None:
+            # a renewal that never got a fresh page already gave the lease back
+            return
+        await self._close_context(leased.page)
+        await self._release(leased.entry)
+
+    async def _open_page(self, entry: PooledBrowser):
+        # a fresh context per lease keeps cookies and storage from leaking between scrapes
+        context = await entry.browser.new_context(**self.context_options)
+        try:
+            return await context.new_page()
+        except BaseException:
+            await context.close()
+            raise
+
+    @staticmethod
+    async def _close_context(page):
+        try:
+            await page.context.close()
+        except Exception as e:
+            logger.warning("Failed to close browser context", extra={"tags": ["browser_pool", "context"], "error": str(e)})
+
+    async def _acquire(self) -> PooledBrowser:
+        async with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("browser pool is closed")
+
+                candidates = [entry for entry in self._browsers if entry.is_available and entry.leases < self.pages_per_browser]
+                if candidates:
+                    entry = min(candidates, key=lambda entry: entry.leases)
+                    entry.leases += 1
+                    entry.last_used = time.monotonic()
+                    return entry
+                if len(self._browsers) + self._launching < self.max_browsers:
+                    self._launching += 1
+                    break
+                logger.debug("Browser pool exhausted, waiting for a page", extra={"tags": ["browser_pool", "wait"]})
+                await self._condition.wait()
+
+        # a cold launch takes seconds, releases, renewals and the reaper carry on around it
+        try:
+            entry = await self._launch()
+        except BaseException:
+            async with self._condition:
+                self._launching -= 1
+                self._condition.notify_all()
+            raise
+
+        async with self._condition:
+            self._launching -= 1
+            if self._closed:
+                await self._close_browser(entry)
+                self._condition.notify_all()
+                raise RuntimeError("browser pool is closed")
+            self._browsers.append(entry)
+            entry.leases += 1
+            entry.last_used = time.monotonic()
+            self._condition.notify_all()
+            return entry
+
+    async def _release(self, entry: PooledBrowser):
+        async with self._condition:
+            entry.leases -= 1
+            entry.last_used = time.monotonic()
+            if entry.leases == 0 and not entry.is_available:
+                await self._close_browser(entry)
+            self._condition.notify_all()
+
+    async def _launch(self) -> PooledBrowser:
+        # launches run outside the condition, so two first leases mustn't both start playwright
+        async with self._startup_lock:
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+                self._reaper_task = asyncio.create_task(self._reaper())
+                if self.memory_budget is not None:
+                    self._watchdog_task = asyncio.create_task(self._watchdog())
+
+        start = time.monotonic()
+        marker = f"{self.MARKER_SWITCH}={id(self)}-{next(self._markers)}"
+        launch_options = {**self.launch_options, "args": [*self.launch_options.get("args", []), marker]}
+        browser = await self._playwright.chromium.launch(**launch_options)
+        entry = PooledBrowser(browser, marker)
+        browser.on("disconnected", lambda _: self._on_disconnected(entry))
+        self.launched += 1
+        logger.info(
+            "Browser launched into pool",
+            extra={"tags": ["browser_pool", "launch"], "duration": round(time.monotonic() - start, 3), "browsers": len(self._browsers) + 1},
+        )
+        return entry
+
+    async def _close_browser(self, entry: PooledBrowser):
+        if entry in self._browsers:
+            self._browsers.remove(entry)
+        try:
+            await entry.browser.close()
+        except Exception as e:
+            logger.warning("Failed to close pooled browser", extra={"tags": ["browser_pool", "close"], "error": str(e)})
+
+    def _on_disconnected(self, entry: PooledBrowser):
+        # browsers the pool closes itself are already out of the list
+        if entry in self._browsers:
+            self.crashed += 1
+            logger.warning("Pooled browser disconnected unexpectedly", extra={"tags": ["browser_pool", "crash"], "leases": entry.leases})
+            task = asyncio.get_running_loop().create_task(self._discard(entry))
+            self._discards.add(task)
+            task.add_done_callback(self._discards.discard)
+
+    async def _discard(self, entry: PooledBrowser):
+        async with self._condition:
+            if entry not in self._browsers:
+                return
+            if entry.leases == 0:
+                await self._close_browser(entry)
+            else:
+                # a dead browser gives its slot back right away, leases still out on it are released against the
+                # detached entry, which closes it with the last one
+                self._browsers.remove(entry)
+            self._condition.notify_all()
+
+    async def _reaper(self):
+        while True:
+            await asyncio.sleep(self.reap_interval)
+            await self.reap_idle()
+
+    async def _watchdog(self):
+        while True:
+            await asyncio.sleep(self.memory_check_interval)
+            try:
+                await self.check_memory()
+            except Exception as e:
+                logger.error("Browser memory check failed", extra={"tags": ["browser_pool", "memory"], "error": str(e)})
@@ -1,8 +1,11 @@
-from bs4 import BeautifulSoup
-import re
 import sys
 from .utils import UrlValidator
 from .request_handler import RequestHandler
+from .request_queue import Priority
+from .parser_engine import ParserEngine
+from .parse_executor import ParseExecutor
+from .extraction_schema import ExtractionSchema, SchemaField
+from .patterns import Patterns, Selectors
 from .interfaces.club_data_scraper import IClubDataScraper
 from .premierleague_website_scraper import PremierleagueWebsiteScraper
 import logging
@@ -14,6 +17,32 @@ configure_logger(resolve_class_module_name(UrlValidator))
 configure_logger(resolve_class_module_name(RequestHandler))
 
 class ClubDataScraper(PremierleagueWebsiteScraper, IClubDataScraper):
+    # a badge is a few kilobytes, anything far past that isn't one and isn't worth holding in memory
+    MAX_LOGO_SIZE = 2 * 1024 * 1024
+    MAIN_PAGE_REGIONS = ('club-header', 'club-navigation', 'club-profile-header__title', 'club-profile-bio__metadata-item--established')
+    DIRECTORY_PAGE_REGIONS = ('clubDirectory',)
+    MAIN_PAGE_SCHEMA = ExtractionSchema({
+        'club_name': SchemaField('h1.club-profile-header__title'),
+        'establishment_year': SchemaField('.club-profile-bio__metadata-item.club-profile-bio__metadata-item--established p', transform=lambda text: Patterns.NUMBER.search(text).group()),
+        # "<stadium>, <city>"
+        'city': SchemaField('span.club-header__club-stadium', transform=lambda text: text.split(',')[1].strip()),
+        'stadium': SchemaField('span.club-header__club-stadium', transform=lambda text: text.split(',')[0].strip()),
+        'logo_url': SchemaField('.club-header__content img.club-header__badge', attribute='src'),
+        'squad_page_path': SchemaField('.tab.club-navigation__tab:nth-child(2) a', attribute='href'),
+    })
+
+    @staticmethod
+    def _manager_from_cards(cards):
+        # clubs title the role differently, the manager's card is the first one carrying one of the titles
+        for card in cards:
+            if card.find(string=Patterns.MANAGER_TITLE):
+                return Selectors.CARD_BODY.select_one(card).get_text(strip=True)
+        return None
+
+    DIRECTORY_PAGE_SCHEMA = ExtractionSchema({
+        'manager_name': SchemaField('.card', many=True, transform=_manager_from_cards),
+    })
+
     def __init__(self, url):
         logger.debug("Initializing ClubDataScraper with URL: %s", url, extra={"tags": ["init", "input"]})
         if not UrlValidator.validate_club_page_url(url):
@@ -50,10 +79,8 @@ class ClubDataScraper(PremierleagueWebsiteScraper, IClubDataScraper):
             directory_page_structure = await self._request_handler.get(directory_page_url)
             logger.info("Fetched directory page HTML.", extra={"tags": ["request", "html"]})
 
-            self._structures = {
-                'main_page': BeautifulSoup(main_page_structure, 'html.parser'),
-                'directory_page': BeautifulSoup(directory_page_structure, 'html.parser')
-            }
+            # both pages are parsed and read in a worker process, the event loop only waits for the extracted fields
+            self._page = await ParseExecutor().run(extract_club_pages, main_page_structure, directory_page_structure)
 
             self._initialized = True
             logger.info("Scraper initialized successfully.", extra={"tags": ["init", "success"]})
@@ -88,7 +115,7 @@ class ClubDataScraper(PremierleagueWebsiteScraper, IClubDataScraper):
             return self.club_data['club_name']
 
         try:
-            name = self._structures['main_page'].select_one('h1.club-profile-header__title').get_text(strip=True)
+            name = self._read('club_name')
             self.club_data['club_name'] = name
             logger.info("Club name extracted: %s", name, extra={"tags": ["extract", "club_name"]})
             return name
@@ -104,8 +131,7 @@ class ClubDataScraper(PremierleagueWebsiteScraper, IClubDataScraper):
             return self.club_data['establishment_year']
 
         try:
-            element = self._structures['main_page'].select_one('.club-profile-bio__metadata-item.club-profile-bio__metadata-item--established p')
-            year = re.search(r'\d+', element.get_text(strip=True)).group()
+            year = self._read('establishment_year')
             self.club_data['establishment_year'] = year
             logger.info("Establishment year extracted: %s", year, extra={"tags": ["extract", "establishment_year"]})
             return year
@@ -121,9 +147,7 @@ class ClubDataScraper(PremierleagueWebsiteScraper, IClubDataScraper):
             return self.club_data['manager_name']
 
         try:
-            pattern = re.compile(r'^Head Coach$|^First-team Manager$|^Manager$', re.IGNORECASE)
-            title_element = self._structures['directory_page'].find(string=pattern)
-            manager = title_element.parent.parent.parent.parent.select_one('.cardBody').get_text(strip=True)
+            manager = self._read('manager_name')
             self.club_data['manager_name'] = manager
             logger.info("Manager name extracted: %s", manager, extra={"tags": ["extract", "manager_name"]})
             return manager
@@ -139,8 +163,7 @@ class ClubDataScraper(PremierleagueWebsiteScraper, IClubDataScraper):
             return self.club_data['city']
 
         try:
-            city_text = self._structures['main_page'].select_one('span.club-header__club-stadium').text
-            city = city_text.split(',')[1].strip()
+            city = self._read('city')
             self.club_data['city'] = city
             logger.info("City extracted: %s", city, extra={"tags": ["extract", "city"]})
             return city
@@ -156,8 +179,7 @@ class ClubDataScraper(PremierleagueWebsiteScraper, IClubDataScraper):
             return self.club_data['stadium']
 
         try:
-            stadium_text = self._structures['main_page'].select_one('span.club-header__club-stadium').text
-            stadium = stadium_text.split(',')[0].strip()
+            stadium = self._read('stadium')
             self.club_data['stadium'] = stadium
             logger.info("Stadium extracted: %s", stadium, extra={"tags": ["extract", "stadium"]})
             return stadium
@@ -173,8 +195,8 @@ class ClubDataScraper(PremierleagueWebsiteScraper, IClubDataScraper):
             return self.club_data['logo']
 
         try:
-            logo_url = self._structures['main_page'].select_one('.club-header__content img.club-header__badge')['src']
-            logo_data = await self._request_handler.get(logo_url, raw=True)
+            logo_url = self._read('logo_url')
+            logo_data = await self._request_handler.get(logo_url, raw=True, priority=Priority.BULK, max_size=self.MAX_LOGO_SIZE)
             self.club_data['logo'] = logo_data
             logger.info("Club logo downloaded from URL: %s", logo_url, extra={"tags": ["download", "logo"]})
             return logo_data
@@ -190,7 +212,7 @@ class ClubDataScraper(PremierleagueWebsiteScraper, IClubDataScraper):
             return self.club_data['squad_page_url']
 
         try:
-            relative_url = self._structures['main_page'].select_one('.tab.club-navigation__tab:nth-child(2) a')['href']
+            relative_url = self._read('squad_page_path')
             full_url = self._base_url.replace('overview', relative_url)
             self.club_data['squad_page_url'] = full_url
             logger.info("Squad page URL extracted: %s", full_url, extra={"tags": ["extract", "squad_page_url"]})
@@ -199,7 +221,21 @@ class ClubDataScraper(PremierleagueWebsiteScraper, IClubDataScraper):
             logger.error("Error extracting squad page URL: %s", str(e), extra={"error": str(e), "tags": ["extract", "squad_page_url"]})
             raise
 
+    def _read(self, field):
+        value = self._page.get(field)
+        if value is None:
+            raise ValueError(f"{field} not found on the club pages")
+        return value
+
     def _raise_if_not_initialized(self):
         if not self._initialized:
             logger.critical("Scraper used before initialization.", extra={"error": "NotInitialized", "tags": ["init", "misuse"]})
             raise RuntimeError("scraper doesn't initialized yet, you should call 'await scraper.initialize()' first")
+
+
+def extract_club_pages(main_page_html: str, directory_page_html: str) -> dict:
+    # runs in a parse worker: raw html in, plain values out, no soup crosses the process boundary
+    return {
+        **ClubDataScraper.MAIN_PAGE_SCHEMA.extract(ParserEngine.parse(main_page_html, regions=ClubDataScraper.MAIN_PAGE_REGIONS)),
+        **ClubDataScraper.DIRECTORY_PAGE_SCHEMA.extract(ParserEngine.parse(directory_page_html, regions=ClubDataScraper.DIRECTORY_PAGE_REGIONS)),
+    }
@@ -0,0 +1,78 @@
+import logging
+from threading import Lock
+from urllib.parse import urlsplit
+from .patterns import Patterns
+
+logger = logging.getLogger(__name__)
+
+class ClubNameResolver:
+    _instance = None
+    _lock = Lock()
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                logger.debug("Creating a new instance of ClubNameResolver", extra={"tags": ["singleton", "init"]})
+                cls._instance = super(ClubNameResolver, cls).__new__(cls)
+                cls._instance.model = None
+                cls._instance._names = dict()
+                cls._instance._loaded = False
+                cls._instance.hits = 0
+                cls._instance.misses = 0
+        return cls._instance
+
+    @classmethod
+    def reset(cls):
+        logger.info("Resetting ClubNameResolver singleton instance", extra={"tags": ["reset"]})
+        cls._instance = None
+
+    def configure(self, model=None):
+        # the teams model is optional, without it the resolver only remembers what the scrapers found in this run
+        self.model = model or self.model
+        self._loaded = False
+        logger.info("ClubNameResolver configured", extra={"tags": ["configure"], "backed_by_database": self.model is not None})
+
+    @classmethod
+    def key(cls, url: str) -> str:
+        # match pages link to /clubs/<id>/<slug>/overview while the teams table may store any tab of the club page,
+        # the numeric id is the part they share
+        match = Patterns.CLUB_ID.search(url)
+        if match:
+            return match.group(1)
+        return urlsplit(url).path.rstrip('/')
+
+    def lookup(self, url: str) -> str | None:
+        if not self._loaded:
+            self.load()
+
+        name = self._names.get(self.key(url))
+        if name is None:
+            self.misses += 1
+            logger.debug(f"Club name not known yet: {url}", extra={"tags": ["club_names", "miss"]})
+        else:
+            self.hits += 1
+        return name
+
+    def remember(self, url: str, name: str):
+        if name:
+            self._names[self.key(url)] = name
+
+    def load(self):
+        self._loaded = True
+        if self.model is None:
+            return
+
+        try:
+            # rows are read once into memory, the model's sqlite connection isn't touched after this
+            names = self.model.get_specific_column('name', key='page_url')
+        except Exception as e:
+            logger.warning("Failed to load club names from the teams table", extra={"tags": ["club_names", "database"], "error": str(e)})
+            return
+
+        for url, name in names.items():
+            if url and name:
+                self._names.setdefault(self.key(url), name)
+        logger.info(f"Loaded {len(self._names)} club names", extra={"tags": ["club_names", "database"]})
+
+    def snapshot(self) -> dict:
+        return {"known": len(self._names), "hits": self.hits, "misses": self.misses}
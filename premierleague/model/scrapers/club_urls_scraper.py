@@ -1,6 +1,7 @@
 import logging
-from bs4 import BeautifulSoup
 from .request_handler import RequestHandler
+from .parser_engine import ParserEngine
+from .patterns import Selectors
 from .interfaces.club_urls_scraper import IClubUrlsScraper
 from .premierleague_website_scraper import PremierleagueWebsiteScraper
 from log_config.logger_configurer import configure_logger, resolve_class_module_name
@@ -10,6 +11,10 @@ logger = logging.getLogger(__name__)
 configure_logger(resolve_class_module_name(RequestHandler)) 
 
 class ClubUrlsScraper(PremierleagueWebsiteScraper, IClubUrlsScraper):
+    CLUBS_PAGE_REGIONS = ('club-cards-wrapper',)
+    CLUB_LINK_SELECTOR = Selectors.compile('.club-cards-wrapper .club-list .club-card-wrapper a')
+    CLUB_NAME_SELECTOR = Selectors.compile('.club-card__info .club-card__name-container h2')
+
     def __init__(self, url=None):
         super().__init__()
         self._base_url = url if url else self._website_url + '/clubs?se=578'
@@ -33,7 +38,7 @@ class ClubUrlsScraper(PremierleagueWebsiteScraper, IClubUrlsScraper):
             )
 
             structure = await self._request_handler.get(self._base_url)
-            self._structure = BeautifulSoup(structure, 'html.parser')
+            self._structure = ParserEngine.parse(structure, regions=self.CLUBS_PAGE_REGIONS)
             logger.info(
                 f"Successfully fetched and parsed club list page: {self._base_url}",
                 extra={"tags": ["html_parsing", "club_urls_scraper", "page_fetch"]}
@@ -53,7 +58,7 @@ class ClubUrlsScraper(PremierleagueWebsiteScraper, IClubUrlsScraper):
         )
 
         try:
-            clubs = self._structure.select('.club-cards-wrapper .club-list .club-card-wrapper a')
+            clubs = self._structure.select(self.CLUB_LINK_SELECTOR)
             logger.debug(
                 f"Found {len(clubs)} clubs in the HTML structure",
                 extra={"tags": ["data_extraction", "club_count", "club_urls_scraper"]}
@@ -67,7 +72,7 @@ class ClubUrlsScraper(PremierleagueWebsiteScraper, IClubUrlsScraper):
 
             for i, club in enumerate(clubs, start=1):
                 try:
-                    club_name = club.select_one('.club-card__info .club-card__name-container h2').get_text(strip=True)
+                    club_name = club.select_one(self.CLUB_NAME_SELECTOR).get_text(strip=True)
                     club_page_url = str(self._website_url + club.get('href'))
                     result.append({"club_name": club_name, "club_page_url": club_page_url})
                     logger.debug(
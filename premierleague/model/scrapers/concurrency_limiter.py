@@ -0,0 +1,119 @@
+import asyncio, aiohttp, time, logging
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+class AdaptiveConcurrencyLimiter:
+    # failures that say the server is struggling, as opposed to a bad url or an oversized body
+    OVERLOAD_EXCEPTIONS = (asyncio.TimeoutError, aiohttp.ClientConnectionError, aiohttp.ClientPayloadError)
+
+    def __init__(self, initial: int = 4, min_limit: int = 1, max_limit: int = 32, backoff: float = 0.5,
+                 latency_tolerance: float = 2.0, window: int = 50, min_samples: int = 10,
+                 cooldown: float = 1.0, history_size: int = 100):
+        if not 1 <= min_limit <= initial <= max_limit:
+            raise ValueError("limits must satisfy 1 <= min_limit <= initial <= max_limit")
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be between 0 and 1")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.min_samples = min_samples
+        self.cooldown = cooldown
+        self.limit = float(initial)
+        self.in_flight = 0
+        self.history = deque(maxlen=history_size)
+        self._latencies = deque(maxlen=window)
+        self._last_decrease = float('-inf')
+        self._waiters = deque()
+
+    @property
+    def current_limit(self) -> int:
+        return int(self.limit)
+
+    def percentile(self, fraction: float) -> float | None:
+        if not self._latencies:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    async def acquire(self):
+        while self.in_flight >= self.current_limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        self.in_flight += 1
+
+    def release(self, latency: float | None = None, status: int | None = None, error: BaseException | None = None):
+        # the slot is counted as busy while we decide, so a full window can still grow the limit
+        saturated = self.in_flight >= self.current_limit
+        self.in_flight = max(0, self.in_flight - 1)
+
+        reason = self._overload_reason(latency, status, error)
+        if latency is not None:
+            # spikes join the window too, so a site that got slower for good becomes the new baseline
+            self._latencies.append(latency)
+        if reason:
+            self._decrease(reason)
+        elif latency is not None and saturated and self.limit < self.max_limit:
+            # additive increase of roughly one slot per full window of successes, only when
+            # the limit is actually what's holding us back
+            self._set_limit(min(self.max_limit, self.limit + 1 / self.limit), 'increase')
+        self._wake_waiters()
+
+    def reset(self):
+        # a new event loop starts with nothing in flight, but keeps the limit it learned
+        self.in_flight = 0
+        self._waiters.clear()
+
+    def snapshot(self) -> dict:
+        return {
+            "limit": self.current_limit,
+            "in_flight": self.in_flight,
+            "latency_p50": self.percentile(0.5),
+            "latency_p95": self.percentile(0.95),
+            "history": list(self.history),
+        }
+
+    def _overload_reason(self, latency, status, error) -> str | None:
+        if status == 429:
+            return 'throttled'
+        if status is not None and status >= 500:
+            return 'server_error'
+        if error is not None and isinstance(error, self.OVERLOAD_EXCEPTIONS):
+            return 'network_error'
+        if latency is not None and len(self._latencies) >= self.min_samples:
+            baseline = self.percentile(0.95)
+            if latency > baseline * self.latency_tolerance:
+                return 'latency_spike'
+        return None
+
+    def _decrease(self, reason):
+        now = time.monotonic()
+        # responses already in flight report the same overload; one cut per cooldown is enough
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        self._set_limit(max(self.min_limit, self.limit * self.backoff), reason)
+        logger.warning(
+            f"Concurrency limit lowered to {self.current_limit} ({reason})",
+            extra={"tags": ["concurrency", "backoff"], "limit": self.current_limit, "reason": reason, "in_flight": self.in_flight},
+        )
+
+    def _set_limit(self, value, reason):
+        previous = self.current_limit
+        self.limit = value
+        if self.current_limit != previous:
+            self.history.append({"time": time.time(), "limit": self.current_limit, "previous": previous, "reason": reason})
+            logger.debug(f"Concurrency limit changed {previous} -> {self.current_limit}", extra={"tags": ["concurrency"], "reason": reason})
+
+    def _wake_waiters(self):
+        available = self.current_limit - self.in_flight
+        for waiter in list(self._waiters)[:max(0, available)]:
+            if not waiter.done():
+                waiter.set_result(None)
@@ -0,0 +1,53 @@
+import aiohttp, logging
+from importlib.util import find_spec
+
+logger = logging.getLogger(__name__)
+
+# aiohttp decodes brotli transparently when one of these packages is installed
+BROTLI_AVAILABLE = any(find_spec(module) is not None for module in ('brotli', 'brotlicffi'))
+
+class ConnectionPool:
+    def __init__(self, limit: int = 30, limit_per_host: int = 6, keepalive_timeout: float = 60,
+                 dns_cache_ttl: int | None = 300, compression: bool = True):
+        if limit_per_host > limit > 0:
+            raise ValueError("limit_per_host can't be greater than the total connection limit")
+
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.compression = compression
+
+    @property
+    def accept_encoding(self) -> str:
+        if not self.compression:
+            return 'identity'
+        return 'gzip, deflate, br' if BROTLI_AVAILABLE else 'gzip, deflate'
+
+    def create_connector(self) -> aiohttp.TCPConnector:
+        return aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            use_dns_cache=self.dns_cache_ttl != 0,
+            ttl_dns_cache=self.dns_cache_ttl,
+            enable_cleanup_closed=True,
+        )
+
+    def create_session(self) -> aiohttp.ClientSession:
+        logger.debug(
+            "Creating pooled client session",
+            extra={
+                "tags": ["configure", "connection_pool"],
+                "limit": self.limit,
+                "limit_per_host": self.limit_per_host,
+                "keepalive_timeout": self.keepalive_timeout,
+                "dns_cache_ttl": self.dns_cache_ttl,
+                "accept_encoding": self.accept_encoding,
+            },
+        )
+        return aiohttp.ClientSession(
+            connector=self.create_connector(),
+            headers={"Accept-Encoding": self.accept_encoding},
+            auto_decompress=True,
+        )
@@ -0,0 +1,104 @@
+import re, logging
+from bs4 import Tag
+from .patterns import Selectors
+
+logger = logging.getLogger(__name__)
+
+class SchemaField:
+    def __init__(self, selector: str, transform=None, type=str, attribute: str | None = None, many: bool = False):
+        self.selector = selector
+        # applied to the element's stripped text, or to the attribute's value, or to the list of elements when many
+        self.transform = transform
+        self.type = type
+        self.attribute = attribute
+        self.many = many
+
+    def read(self, found):
+        if found is None:
+            return None
+        if self.many:
+            value = found
+        elif self.attribute:
+            value = found.get(self.attribute)
+            if value is None:
+                return None
+        else:
+            value = found.get_text(strip=True)
+
+        if self.transform is not None:
+            value = self.transform(value)
+        if value is None:
+            return None
+        return self.type(value)
+
+
+class ExtractionSchema:
+    _NESTED_PARTS = re.compile(r'\[[^\]]*\]|\([^)]*\)')
+    _COMBINATORS = re.compile(r'\s*[\s>+~]\s*')
+    _CLASS = re.compile(r'\.([\w-]+)')
+    _TAG = re.compile(r'^[a-zA-Z][\w-]*')
+
+    def __init__(self, fields: dict[str, SchemaField]):
+        if not fields:
+            raise ValueError("an extraction schema needs at least one field")
+        self.fields = dict(fields)
+        # fields reading the same node (date of birth and age) share one match
+        self._single = {field.selector for field in self.fields.values() if not field.many}
+        self._many = {field.selector for field in self.fields.values() if field.many}
+        self._by_class, self._by_tag, self._anywhere = dict(), dict(), list()
+        for selector in self._single | self._many:
+            kind, key = self.index_key(selector)
+            entry = (selector, Selectors.compile(selector))
+            if kind == 'class':
+                self._by_class.setdefault(key, []).append(entry)
+            elif kind == 'tag':
+                self._by_tag.setdefault(key, []).append(entry)
+            else:
+                self._anywhere.append(entry)
+
+    @classmethod
+    def index_key(cls, selector: str) -> tuple[str | None, str | None]:
+        # an element can only match when it carries a class (or is the tag) the rightmost compound names,
+        # so the walk only runs the full matcher against selectors that have a chance
+        compound = cls._COMBINATORS.split(cls._NESTED_PARTS.sub('', selector).strip())[-1]
+        classes = cls._CLASS.findall(compound)
+        if classes:
+            return 'class', classes[0]
+        tag = cls._TAG.match(compound)
+        if tag:
+            return 'tag', tag.group().lower()
+        return None, None
+
+    def extract(self, page) -> dict:
+        found = self._walk(page)
+        # a field missing from the page, or whose transform rejects what was found, is None
+        record = dict()
+        for name, field in self.fields.items():
+            try:
+                record[name] = field.read(found.get(field.selector))
+            except (AttributeError, IndexError, KeyError, TypeError, ValueError) as e:
+                logger.debug(f"Field {name} couldn't be read", extra={"tags": ["extraction", "schema"], "error": str(e)})
+                record[name] = None
+        return record
+
+    def _walk(self, page) -> dict:
+        # one pass over the tree in document order, so the first element a selector matches is the one select_one returns
+        pending = set(self._single)
+        found = {selector: [] for selector in self._many}
+        for element in page.descendants:
+            if not isinstance(element, Tag):
+                continue
+            candidates = self._by_tag.get(element.name, []) + self._anywhere
+            for class_name in element.get('class', ()):
+                candidates += self._by_class.get(class_name, [])
+            for selector, compiled in candidates:
+                if selector in pending:
+                    if compiled.match(element):
+                        found[selector] = element
+                        pending.discard(selector)
+                elif selector in self._many and compiled.match(element):
+                    if not found[selector] or found[selector][-1] is not element:
+                        found[selector].append(element)
+            if not pending and not self._many:
+                break
+        return found
@@ -0,0 +1,47 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+class Field:
+    def __init__(self, selector: str, attribute: str | None = None, many: bool = False, optional: bool = False):
+        self.selector = selector
+        # None reads the element's textContent
+        self.attribute = attribute
+        self.many = many
+        self.optional = optional
+
+    def to_dict(self, name: str) -> dict:
+        return {"name": name, "selector": self.selector, "attribute": self.attribute, "many": self.many}
+
+
+class ExtractionSpec:
+    # one generic function, the spec travels as its argument, so every spec shares a single compiled script
+    SCRIPT = '''(fields) => {
+        const read = (element, attribute) => {
+            if (!element) return null;
+            return attribute ? element.getAttribute(attribute) : element.textContent;
+        };
+        const record = {};
+        for (const field of fields) {
+            if (field.many) {
+                record[field.name] = Array.from(document.querySelectorAll(field.selector), (element) => read(element, field.attribute));
+            } else {
+                record[field.name] = read(document.querySelector(field.selector), field.attribute);
+            }
+        }
+        return record;
+    }'''
+
+    def __init__(self, fields: dict[str, Field]):
+        if not fields:
+            raise ValueError("an extraction spec needs at least one field")
+        self.fields = dict(fields)
+        self._payload = [field.to_dict(name) for name, field in self.fields.items()]
+
+    async def extract(self, page) -> dict:
+        record = await page.evaluate(self.SCRIPT, self._payload)
+        missing = [name for name, field in self.fields.items() if record.get(name) is None and not field.many and not field.optional]
+        if missing:
+            logger.error("Required fields missing from page", extra={"tags": ["extraction", "validation"], "fields": missing, "url": getattr(page, 'url', None)})
+            raise ValueError(f"required fields not found on page: {', '.join(missing)}")
+        return record
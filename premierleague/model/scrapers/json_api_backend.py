@@ -0,0 +1,161 @@
+import os, json, logging
+import aiohttp
+from pathlib import Path
+from threading import Lock
+from urllib.parse import urlsplit, urlunsplit
+from .request_handler import RequestHandler
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENDPOINTS_FILE = str(Path(__file__).parent.parent / 'data' / 'api_endpoints.json')
+
+class EndpointStore:
+    # the API rejects requests without the site's origin, everything else the browser sent is left out
+    FORWARDED_HEADERS = ('accept', 'origin', 'referer')
+
+    def __init__(self, path: str = DEFAULT_ENDPOINTS_FILE):
+        self.path = Path(path)
+        self._endpoints = None
+
+    def get(self, name: str) -> dict | None:
+        return self._load().get(name)
+
+    def learn(self, name: str, url: str, identifier: str, placeholder: str, request_headers: dict | None = None) -> dict | None:
+        # only the path segment holding the id is templated, the same digits elsewhere (a season, a query value) stay as captured
+        parts = urlsplit(url)
+        segments = parts.path.split('/')
+        if identifier not in segments:
+            logger.debug(f"Captured {name} url has no {identifier} path segment, can't template it", extra={"tags": ["api", "discover"], "url": url})
+            return None
+        index = len(segments) - 1 - segments[::-1].index(identifier)
+        segments[index] = '{' + placeholder + '}'
+
+        endpoint = {
+            "template": urlunsplit(parts._replace(path='/'.join(segments))),
+            "headers": {key: value for key, value in (request_headers or {}).items() if key.lower() in self.FORWARDED_HEADERS},
+        }
+        self._load()[name] = endpoint
+        self._save()
+        logger.info(f"Learned {name} endpoint: {endpoint['template']}", extra={"tags": ["api", "discover"]})
+        return endpoint
+
+    def forget(self, name: str):
+        if self._load().pop(name, None) is not None:
+            self._save()
+            logger.warning(f"Forgot {name} endpoint, it will be rediscovered through the browser", extra={"tags": ["api", "discover"]})
+
+    def _load(self) -> dict:
+        if self._endpoints is None:
+            try:
+                self._endpoints = json.loads(self.path.read_text())
+            except FileNotFoundError:
+                self._endpoints = dict()
+            except ValueError as e:
+                logger.warning("Unreadable endpoints file, starting empty", extra={"tags": ["api", "load"], "error": str(e)})
+                self._endpoints = dict()
+        return self._endpoints
+
+    def _save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = self.path.with_name(self.path.name + '.tmp')
+        temporary_path.write_text(json.dumps(self._endpoints, indent=2))
+        os.replace(temporary_path, self.path)
+
+
+class JsonResponseCapture:
+    def __init__(self, page):
+        self._responses = []
+        # attached before navigation so the page's own XHR calls are seen
+        page.on("response", self._on_response)
+
+    def _on_response(self, response):
+        if 'json' in response.headers.get('content-type', ''):
+            self._responses.append(response)
+
+    async def find(self, predicate):
+        for response in self._responses:
+            try:
+                payload = await response.json()
+            except Exception:
+                continue
+            if predicate(payload):
+                return response, payload
+        return None
+
+
+class JsonApiBackend:
+    # the endpoint is gone for good, anything else (timeouts, 5xx, rate limits) may work on the next fetch
+    GONE_STATUSES = (404, 410)
+
+    _instance = None
+    _lock = Lock()
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                logger.debug("Creating a new instance of JsonApiBackend", extra={"tags": ["singleton", "init"]})
+                cls._instance = super(JsonApiBackend, cls).__new__(cls)
+                cls._instance.endpoints = EndpointStore()
+                cls._instance.request_handler = None
+                cls._instance.api_hits = 0
+                cls._instance.fallbacks = 0
+        return cls._instance
+
+    @classmethod
+    def reset(cls):
+        logger.info("Resetting JsonApiBackend singleton instance", extra={"tags": ["reset"]})
+        cls._instance = None
+
+    def configure(self, endpoints: EndpointStore | None = None, request_handler: RequestHandler | None = None):
+        self.endpoints = endpoints or self.endpoints
+        self.request_handler = request_handler or self.request_handler
+
+    def knows(self, name: str) -> bool:
+        return self.endpoints.get(name) is not None
+
+    async def fetch(self, name: str, parse, **params):
+        endpoint = self.endpoints.get(name)
+        if endpoint is None:
+            return None
+
+        url = endpoint["template"].format(**params)
+        try:
+            handler = self.request_handler or RequestHandler()
+            await handler.configure()
+            body = await handler.get(url, headers=endpoint["headers"], raise_for_status=True)
+        except aiohttp.ClientResponseError as e:
+            return self._fall_back(name, url, e, forget=e.status in self.GONE_STATUSES)
+        except Exception as e:
+            return self._fall_back(name, url, e, forget=False)
+
+        try:
+            result = parse(json.loads(body))
+        except Exception as e:
+            # the endpoint changed shape, the next browser visit learns it again
+            return self._fall_back(name, url, e, forget=True)
+
+        self.api_hits += 1
+        logger.debug(f"{name} served from the JSON API", extra={"tags": ["api", "fetch"], "url": url})
+        return result
+
+    def _fall_back(self, name: str, url: str, error: Exception, forget: bool):
+        self.fallbacks += 1
+        logger.warning(f"{name} API fetch failed, falling back to the browser", extra={"tags": ["api", "fallback"], "url": url, "error": str(error)})
+        if forget:
+            self.endpoints.forget(name)
+        return None
+
+    async def discover(self, name: str, capture: JsonResponseCapture, predicate, identifier: str, placeholder: str) -> bool:
+        try:
+            found = await capture.find(predicate)
+            if found is None:
+                logger.debug(f"No {name} payload among the page's responses", extra={"tags": ["api", "discover"]})
+                return False
+            response, _ = found
+            return self.endpoints.learn(name, response.url, identifier, placeholder, await response.request.all_headers()) is not None
+        except Exception as e:
+            logger.warning(f"Failed to discover the {name} endpoint", extra={"tags": ["api", "discover"], "error": str(e)})
+            return False
+
+    def snapshot(self) -> dict:
+        return {"api_hits": self.api_hits, "fallbacks": self.fallbacks}
@@ -1,10 +1,13 @@
 import logging
-import re
+from urllib.parse import urljoin
 from .interfaces.match_data_scraper import IMatchDataScraper
 from .utils import UrlValidator
+from .patterns import Patterns
+from .extraction_spec import ExtractionSpec, Field
+from .club_name_resolver import ClubNameResolver
+from .json_api_backend import JsonApiBackend, JsonResponseCapture
 from .request_handler import PlaywrightRequestHandler
 from .premierleague_website_scraper import PremierleagueWebsiteScraper
-from playwright.async_api import async_playwright
 from log_config.logger_configurer import configure_logger, resolve_class_module_name
 
 logger = logging.getLogger(__name__)
@@ -13,6 +16,22 @@ configure_logger(resolve_class_module_name(PlaywrightRequestHandler))
 configure_logger(resolve_class_module_name(UrlValidator))
 
 class MatchDataScraper(PremierleagueWebsiteScraper, IMatchDataScraper):
+    MATCH_PAGE_READY_SELECTOR = '.mc-summary__score'
+    CLUB_PAGE_READY_SELECTOR = 'h2.club-header__team-name'
+
+    MATCH_SUMMARY_SPEC = ExtractionSpec({
+        'round_number': Field('.mc-header__gameweek-selector-current-gameweek--long'),
+        'timestamp': Field('.mc-summary__info-kickoff .renderKOContainer', attribute='data-kickoff'),
+        'referee_name': Field('.mc-summary__info:last-child'),
+        'score': Field('.mc-summary__score'),
+        'home_team_url': Field('.mc-summary__team.home a.mc-summary__badge-container', attribute='href'),
+        'away_team_url': Field('.mc-summary__team.away a.mc-summary__badge-container', attribute='href'),
+    })
+    CLUB_HEADER_SPEC = ExtractionSpec({
+        'name': Field('h2.club-header__team-name'),
+    })
+    FIXTURE_ENDPOINT = 'fixture'
+
     def __init__(self, url):
         logger.debug("Initializing MatchDataScraper", extra={"tags": ["scraper", "init"]})
         if not UrlValidator.validate_match_page_url(url):
@@ -22,6 +41,9 @@ class MatchDataScraper(PremierleagueWebsiteScraper, IMatchDataScraper):
         super().__init__()
         self._base_url = url
         self._initialized = False
+        self._match_id = url.rstrip('/').rsplit('/', 1)[-1]
+        self._club_names = ClubNameResolver()
+        self._api_backend = JsonApiBackend()
         self.match_data = {
             'timestamp': int(),
             'round_number': int(),
@@ -47,30 +69,14 @@ class MatchDataScraper(PremierleagueWebsiteScraper, IMatchDataScraper):
     async def get_all_data(self) -> dict:
         self._raise_if_not_initialized()
         logger.info("Starting full match data scraping", extra={"tags": ["scraper", "full"]})
+        if await self._load_from_api():
+            return self.match_data
 
         async def scraper(page):
             try:
-                round_number = await page.locator('.mc-header__gameweek-selector-current-gameweek--long').first.text_content()
-                self.match_data['round_number'] = int(re.search(r'\d+', round_number).group())
-
-                self.match_data['timestamp'] = int(await page.locator('.mc-summary__info-kickoff .renderKOContainer').first.get_attribute('data-kickoff'))
-
-                self.match_data['referee_name'] = await page.locator('.mc-summary__info:last-child').text_content().lstrip('Ref: ')
-
-                home_team_page_url = await page.locator('.mc-summary__team-container:nth-child(1) a.mc-summary__badge-container').first.get_attribute('href')
-                away_team_page_url = await page.locator('.mc-summary__team-container:nth-child(2) a.mc-summary__badge-container').first.get_attribute('href')
-
-                match_result = await page.locator('.mc-summary__score').text_content()
-                match_result = match_result.split(' - ')
-
-                self.match_data['home_team_data']['score'] = int(match_result[0])
-                self.match_data['away_team_data']['score'] = int(match_result[1])
-
-                await self._request_handler.goto(page, home_team_page_url)
-                self.match_data['home_team_data']['name'] = await page.locator('h2.club-header__team-name').text_content()
-
-                await self._request_handler.goto(page, away_team_page_url)
-                self.match_data['away_team_data']['name'] = await page.locator('h2.club-header__team-name').text_content()
+                team_urls = await self._scrape_summary(page)
+                for side in ('home', 'away'):
+                    self.match_data[f'{side}_team_data']['name'] = await self._scrape_club_name(page, team_urls[side])
 
                 logger.info("Full match data scraped successfully", extra={"tags": ["scraper", "full"]})
                 return self.match_data
@@ -85,11 +91,13 @@ class MatchDataScraper(PremierleagueWebsiteScraper, IMatchDataScraper):
         if self.match_data['timestamp']:
             logger.debug("Returning cached timestamp", extra={"tags": ["scraper", "timestamp"]})
             return self.match_data['timestamp']
+        if await self._load_from_api():
+            return self.match_data['timestamp']
 
         async def scraper(page):
             try:
                 logger.debug("Scraping timestamp...", extra={"tags": ["scraper", "timestamp"]})
-                self.match_data['timestamp'] = int(await page.locator('.mc-summary__info-kickoff .renderKOContainer').first.get_attribute('data-kickoff'))
+                await self._scrape_summary(page)
                 logger.info("Timestamp scraped", extra={"tags": ["scraper", "timestamp"]})
                 return self.match_data['timestamp']
             except Exception as e:
@@ -103,12 +111,13 @@ class MatchDataScraper(PremierleagueWebsiteScraper, IMatchDataScraper):
         if self.match_data['round_number']:
             logger.debug("Returning cached round number", extra={"tags": ["scraper", "round"]})
             return self.match_data['round_number']
+        if await self._load_from_api():
+            return self.match_data['round_number']
 
         async def scraper(page):
             try:
                 logger.debug("Scraping round number...", extra={"tags": ["scraper", "round"]})
-                string = await page.locator('.mc-header__gameweek-selector-current-gameweek--long').first.text_content()
-                self.match_data['round_number'] = int(re.search(r'\d+', string).group())
+                await self._scrape_summary(page)
                 logger.info("Round number scraped", extra={"tags": ["scraper", "round"]})
                 return self.match_data['round_number']
             except Exception as e:
@@ -122,12 +131,13 @@ class MatchDataScraper(PremierleagueWebsiteScraper, IMatchDataScraper):
         if self.match_data['referee_name']:
             logger.debug("Returning cached referee name", extra={"tags": ["scraper", "referee"]})
             return self.match_data['referee_name']
+        if await self._load_from_api():
+            return self.match_data['referee_name']
 
         async def scraper(page):
             try:
                 logger.debug("Scraping referee name...", extra={"tags": ["scraper", "referee"]})
-                referee_name = await page.locator('.mc-summary__info:last-child').text_content()
-                self.match_data['referee_name'] = referee_name.strip().lstrip('Ref: ')
+                await self._scrape_summary(page)
                 logger.info("Referee name scraped", extra={"tags": ["scraper", "referee"]})
                 return self.match_data['referee_name']
             except Exception as e:
@@ -141,18 +151,14 @@ class MatchDataScraper(PremierleagueWebsiteScraper, IMatchDataScraper):
         if self.match_data['home_team_data']['name'] and self.match_data['home_team_data']['score']:
             logger.debug("Returning cached home team data", extra={"tags": ["scraper", "home_team"]})
             return self.match_data['home_team_data']
+        if await self._load_from_api():
+            return self.match_data['home_team_data']
 
         async def scraper(page):
             try:
                 logger.debug("Scraping home team data...", extra={"tags": ["scraper", "home_team"]})
-                url = await page.locator('.mc-summary__team.home a.mc-summary__badge-container').first.get_attribute('href')
-                url = self._website_url + url
-
-                match_result = await page.locator('.mc-summary__score').text_content()
-                self.match_data['home_team_data']['score'] = int(match_result.split(' - ')[0])
-
-                await self._request_handler.goto(page, url)
-                self.match_data['home_team_data']['name'] = await page.locator('h2.club-header__team-name').text_content()
+                team_urls = await self._scrape_summary(page)
+                self.match_data['home_team_data']['name'] = await self._scrape_club_name(page, team_urls['home'])
 
                 logger.info("Home team data scraped", extra={"tags": ["scraper", "home_team"]})
                 return self.match_data['home_team_data']
@@ -167,18 +173,14 @@ class MatchDataScraper(PremierleagueWebsiteScraper, IMatchDataScraper):
         if self.match_data['away_team_data']['name'] and self.match_data['away_team_data']['score']:
             logger.debug("Returning cached away team data", extra={"tags": ["scraper", "away_team"]})
             return self.match_data['away_team_data']
+        if await self._load_from_api():
+            return self.match_data['away_team_data']
 
         async def scraper(page):
             try:
                 logger.debug("Scraping away team data...", extra={"tags": ["scraper", "away_team"]})
-                url = await page.locator('.mc-summary__team.away a.mc-summary__badge-container').first.get_attribute('href')
-                url = self._website_url + url
-
-                match_result = await page.locator('.mc-summary__score').text_content()
-                self.match_data['away_team_data']['score'] = int(match_result.split(' - ')[1])
-
-                await self._request_handler.goto(page, url)
-                self.match_data['away_team_data']['name'] = await page.locator('h2.club-header__team-name').text_content()
+                team_urls = await self._scrape_summary(page)
+                self.match_data['away_team_data']['name'] = await self._scrape_club_name(page, team_urls['away'])
 
                 logger.info("Away team data scraped", extra={"tags": ["scraper", "away_team"]})
                 return self.match_data['away_team_data']
@@ -188,6 +190,59 @@ class MatchDataScraper(PremierleagueWebsiteScraper, IMatchDataScraper):
 
         return await self._create_context_then_callback(scraper)
 
+    async def _load_from_api(self) -> bool:
+        match_data = await self._api_backend.fetch(self.FIXTURE_ENDPOINT, self._parse_fixture_payload, match_id=self._match_id)
+        if match_data is None:
+            return False
+        self.match_data = match_data
+        logger.info("Match data loaded from the JSON API", extra={"tags": ["scraper", "api"]})
+        return True
+
+    def _is_fixture_payload(self, payload) -> bool:
+        return isinstance(payload, dict) and 'teams' in payload and str(payload.get('id', '')).split('.')[0] == self._match_id
+
+    @staticmethod
+    def _parse_fixture_payload(payload: dict) -> dict:
+        referee = next(official for official in payload['matchOfficials'] if official.get('role') == 'REFEREE')
+        home_team, away_team = payload['teams']
+        return {
+            'timestamp': int(payload['kickoff']['millis']),
+            'round_number': int(payload['gameweek']['gameweek']),
+            'referee_name': referee['name']['display'],
+            'home_team_data': {'name': home_team['team']['name'], 'score': int(home_team['score'])},
+            'away_team_data': {'name': away_team['team']['name'], 'score': int(away_team['score'])},
+        }
+
+    async def _scrape_summary(self, page) -> dict[str, str]:
+        # every summary field comes back in one round-trip, so whichever getter runs first fills them all in
+        record = await self.MATCH_SUMMARY_SPEC.extract(page)
+
+        self.match_data['round_number'] = int(Patterns.NUMBER.search(record['round_number']).group())
+        self.match_data['timestamp'] = int(record['timestamp'])
+        self.match_data['referee_name'] = Patterns.REFEREE_PREFIX.sub('', record['referee_name']).strip()
+
+        home_score, away_score = record['score'].split(' - ')
+        self.match_data['home_team_data']['score'] = int(home_score)
+        self.match_data['away_team_data']['score'] = int(away_score)
+
+        logger.debug("Match summary extracted", extra={"tags": ["scraper", "extraction"]})
+        return {
+            'home': urljoin(self._website_url, record['home_team_url']),
+            'away': urljoin(self._website_url, record['away_team_url']),
+        }
+
+    async def _scrape_club_name(self, page, club_url) -> str:
+        # the same 20 clubs come up in every match, so their pages are only visited when the name isn't known yet
+        name = self._club_names.lookup(club_url)
+        if name:
+            return name
+
+        await self._request_handler.goto(page, club_url, wait_for=self.CLUB_PAGE_READY_SELECTOR)
+        record = await self.CLUB_HEADER_SPEC.extract(page)
+        name = record['name'].strip()
+        self._club_names.remember(club_url, name)
+        return name
+
     def _raise_if_not_initialized(self):
         if not self._initialized:
             logger.critical("Scraper method called before initialization", extra={"tags": ["scraper", "error"], "error": "UninitializedScraper"})
@@ -195,14 +250,15 @@ class MatchDataScraper(PremierleagueWebsiteScraper, IMatchDataScraper):
 
     async def _create_context_then_callback(self, callback):
         try:
-            async with async_playwright() as p:
-                async with await p.chromium.launch(headless=True) as browser:
-                    logger.debug("Browser launched", extra={"tags": ["scraper", "browser"]})
-                    page = await browser.new_page()
-                    page.set_default_timeout(0)  # FIXME: no timeout
-                    await self._request_handler.goto(page, self._base_url)
-                    logger.debug("Page navigation successful", extra={"tags": ["scraper", "browser"]})
-                    return await callback(page)
+            async with self._request_handler.page() as page:
+                logger.debug("Page leased from browser pool", extra={"tags": ["scraper", "browser"]})
+                # while the endpoint is unknown, the page's own API calls are watched so later matches can skip the browser
+                capture = None if self._api_backend.knows(self.FIXTURE_ENDPOINT) else JsonResponseCapture(page)
+                await self._request_handler.goto(page, self._base_url, wait_for=self.MATCH_PAGE_READY_SELECTOR)
+                logger.debug("Page navigation successful", extra={"tags": ["scraper", "browser"]})
+                if capture is not None:
+                    await self._api_backend.discover(self.FIXTURE_ENDPOINT, capture, self._is_fixture_payload, self._match_id, 'match_id')
+                return await callback(page)
         except Exception as e:
             logger.error("Error during Playwright context execution", extra={"tags": ["scraper", "browser"], "error": str(e)})
             raise
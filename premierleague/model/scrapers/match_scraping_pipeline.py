@@ -0,0 +1,106 @@
+import asyncio, inspect, time, logging
+from .match_data_scraper import MatchDataScraper
+from .request_handler import PlaywrightRequestHandler
+
+logger = logging.getLogger(__name__)
+
+class MatchScrapingPipeline:
+    def __init__(self, workers: int = 8, on_result=None, on_error=None, browser_pool=None):
+        if workers < 1:
+            raise ValueError("the pipeline needs at least one worker")
+
+        # every worker holds at most one pooled page at a time, so workers beyond the pool's capacity just wait for a lease
+        self.workers = workers
+        self.on_result = on_result
+        self.on_error = on_error
+        self.browser_pool = browser_pool
+        self._reset_counters(0)
+
+    async def run(self, urls) -> dict:
+        urls = list(dict.fromkeys(urls))
+        self._reset_counters(len(urls))
+        if not urls:
+            return self.snapshot()
+
+        await PlaywrightRequestHandler().configure(browser_pool=self.browser_pool)
+
+        queue = asyncio.Queue()
+        for url in urls:
+            queue.put_nowait(url)
+
+        logger.info(f"Scraping {len(urls)} matches with {self.workers} workers", extra={"tags": ["pipeline", "start"]})
+        self.started_at = time.monotonic()
+        workers = [asyncio.create_task(self._worker(queue)) for _ in range(min(self.workers, len(urls)))]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+            self.finished_at = time.monotonic()
+
+        logger.info(
+            f"Match scraping finished: {self.completed} scraped, {self.failed} failed, {self.matches_per_minute:.1f} matches/min",
+            extra={"tags": ["pipeline", "finish"], "stats": self.snapshot()},
+        )
+        return self.snapshot()
+
+    @property
+    def elapsed(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    @property
+    def matches_per_minute(self) -> float:
+        elapsed = self.elapsed
+        return self.completed / elapsed * 60 if elapsed else 0.0
+
+    def snapshot(self) -> dict:
+        return {
+            "total": self.total,
+            "completed": self.completed,
+            "failed": self.failed,
+            "elapsed": round(self.elapsed, 3),
+            "matches_per_minute": round(self.matches_per_minute, 2),
+        }
+
+    async def _worker(self, queue: asyncio.Queue):
+        while True:
+            try:
+                url = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+
+            try:
+                scraper = MatchDataScraper(url)
+                await scraper.initialize()
+                match_data = await scraper.get_all_data()
+                # results are handed over as they complete, nothing waits for the whole season
+                if self.on_result is not None:
+                    await self._call(self.on_result, url, match_data)
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"Failed to scrape match {url}", extra={"tags": ["pipeline", "error"], "url": url, "error": str(e)})
+                if self.on_error is not None:
+                    await self._call(self.on_error, url, e)
+            else:
+                self.completed += 1
+                logger.info(
+                    f"{self.completed + self.failed}/{self.total} matches done ({self.matches_per_minute:.1f} matches/min)",
+                    extra={"tags": ["pipeline", "progress"], "url": url},
+                )
+            finally:
+                queue.task_done()
+
+    @staticmethod
+    async def _call(callback, *args):
+        result = callback(*args)
+        if inspect.isawaitable(result):
+            await result
+
+    def _reset_counters(self, total: int):
+        self.total = total
+        self.completed = 0
+        self.failed = 0
+        self.started_at = None
+        self.finished_at = None
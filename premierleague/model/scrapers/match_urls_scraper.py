@@ -1,7 +1,11 @@
 import logging
-import asyncio, re
+import asyncio
+from urllib.parse import urljoin
 from playwright.async_api import async_playwright
 from .interfaces.match_urls_scraper import IMatchUrlsScraper
+from .extraction_spec import ExtractionSpec, Field
+from .patterns import Patterns
+from .json_api_backend import JsonApiBackend, JsonResponseCapture
 from model.scrapers.request_handler import PlaywrightRequestHandler
 from model.scrapers.premierleague_website_scraper import PremierleagueWebsiteScraper
 from log_config.logger_configurer import configure_logger, resolve_class_module_name
@@ -11,10 +15,26 @@ logger = logging.getLogger(__name__)
 configure_logger(resolve_class_module_name(PlaywrightRequestHandler))
 
 class MatchUrlsScraper(PremierleagueWebsiteScraper, IMatchUrlsScraper):
+    WEEK_PAGE_READY_SELECTOR = '.fixtures-abridged-header__title'
+    MATCHWEEK_SELECTOR_READY_SELECTOR = 'header.mc-header'
+
+    WEEK_MATCHES_SPEC = ExtractionSpec({
+        'round': Field('.fixtures-abridged-header__title'),
+        'urls': Field('a.match-fixture--abridged.match-fixture', attribute='href', many=True),
+    })
+    WEEK_LINKS_SPEC = ExtractionSpec({
+        'urls': Field(
+            '.mc-header__gameweek-selector-list-container .mc-header__gameweek-selector-list li.mc-header__gameweek-selector-list-item a',
+            attribute='href', many=True,
+        ),
+    })
+    WEEK_FIXTURES_ENDPOINT = 'week_fixtures'
+
     def __init__(self, url=None):
         PremierleagueWebsiteScraper.__init__(self)
         self._base_url = url if url else self._website_url + '/matchweek/18390/blog?match=true'
         self._initialized = False
+        self._api_backend = JsonApiBackend()
         logger.debug("MatchUrlsScraper instantiated", extra={"tags": ["init"], "base_url": self._base_url})
 
     async def initialize(self) -> None:
@@ -30,28 +50,27 @@ class MatchUrlsScraper(PremierleagueWebsiteScraper, IMatchUrlsScraper):
 
     async def _get_week_match_urls(self, browser, url):
         logger.debug(f"Fetching match URLs from week page: {url}", extra={"tags": ["scraping", "week_page"]})
+        week_id = Patterns.MATCHWEEK_ID.search(url).group(1)
+        result = await self._api_backend.fetch(self.WEEK_FIXTURES_ENDPOINT, self._parse_week_fixtures_payload, week_id=week_id)
+        if result is not None:
+            logger.info(f"Loaded {len(result['urls'])} match URLs for round {result['round']} from the JSON API", extra={"tags": ["scraping", "api"]})
+            return result
+
         try:
             page = await browser.new_page()
-            page.set_default_timeout(0)
-            await self._request_handler.goto(page, url)
-
-            result = dict()
+            self._request_handler.apply_deadlines(page)
+            await self._request_handler.apply_profile(page)
+            capture = None if self._api_backend.knows(self.WEEK_FIXTURES_ENDPOINT) else JsonResponseCapture(page)
+            await self._request_handler.goto(page, url, wait_for=self.WEEK_PAGE_READY_SELECTOR)
+            if capture is not None:
+                await self._api_backend.discover(self.WEEK_FIXTURES_ENDPOINT, capture, self._is_week_fixtures_payload, week_id, 'week_id')
 
-            round_text = await page.locator('.fixtures-abridged-header__title').first.text_content()
-            round_number = re.search(r'\d+', round_text).group()
-            result['round'] = int(round_number)
-            result['urls'] = set()
+            record = await self.WEEK_MATCHES_SPEC.extract(page)
 
-            logger.debug(f"Scraping match URLs for round {result['round']}", extra={"tags": ["scraping", "match_urls"]})
-
-            game_elements = page.locator('a.match-fixture--abridged.match-fixture')
-            count = await game_elements.count()
-            logger.debug(f"Found {count} match elements", extra={"tags": ["scraping", "match_urls"]})
-
-            for i in range(count):
-                match_url = await game_elements.nth(i).get_attribute('href')
-                full_url = self._website_url + match_url
-                result['urls'].add(full_url)
+            result = dict()
+            result['round'] = int(Patterns.NUMBER.search(record['round']).group())
+            # an anchor without an href is skipped, not allowed to fail the whole week
+            result['urls'] = {urljoin(self._website_url, href) for href in record['urls'] if href is not None}
 
             logger.info(f"Scraped {len(result['urls'])} match URLs for round {result['round']}", extra={"tags": ["scraping", "match_urls"]})
             return result
@@ -59,31 +78,38 @@ class MatchUrlsScraper(PremierleagueWebsiteScraper, IMatchUrlsScraper):
             logger.exception("Failed to scrape week match URLs", extra={"tags": ["scraping", "error"], "error": str(e), "url": url})
             raise
 
+    @staticmethod
+    def _is_week_fixtures_payload(payload) -> bool:
+        content = payload.get('content') if isinstance(payload, dict) else None
+        return bool(content) and all('gameweek' in fixture and 'teams' in fixture for fixture in content)
+
+    def _parse_week_fixtures_payload(self, payload: dict) -> dict:
+        fixtures = payload['content']
+        rounds = {int(fixture['gameweek']['gameweek']) for fixture in fixtures}
+        if len(rounds) != 1:
+            raise ValueError(f"expected fixtures of a single round, got rounds {sorted(rounds)}")
+        return {
+            'round': rounds.pop(),
+            'urls': {f"{self._website_url}/match/{int(fixture['id'])}" for fixture in fixtures},
+        }
+
     async def _get_week_page_urls(self, browser):
         logger.debug("Fetching all week page URLs", extra={"tags": ["scraping", "week_pages"]})
         try:
             page = await browser.new_page()
-            page.set_default_timeout(0)
-            await self._request_handler.goto(page, self._base_url)
+            self._request_handler.apply_deadlines(page)
+            await self._request_handler.apply_profile(page)
+            await self._request_handler.goto(page, self._base_url, wait_for=self.MATCHWEEK_SELECTOR_READY_SELECTOR)
 
             await page.evaluate('''
                 const element = document.querySelector('header.mc-header');
                 element.classList.add('is-open');
             ''')
 
-            week_urls = page.locator(
-                '.mc-header__gameweek-selector-list-container .mc-header__gameweek-selector-list li.mc-header__gameweek-selector-list-item a'
-            )
-
-            result = []
-            count = await week_urls.count()
-            logger.debug(f"Found {count} week links", extra={"tags": ["scraping", "week_pages"]})
+            record = await self.WEEK_LINKS_SPEC.extract(page)
+            logger.debug(f"Found {len(record['urls'])} week links", extra={"tags": ["scraping", "week_pages"]})
 
-            for i in range(count):
-                week_anchor = week_urls.nth(i)
-                href = await week_anchor.get_attribute('href')
-                full_url = self._website_url + href
-                result.append(full_url)
+            result = [urljoin(self._website_url, href) for href in record['urls'] if href is not None]
 
             half_result = result[:int(len(result) / 2)]
             logger.info(f"Extracted {len(half_result)} week page URLs", extra={"tags": ["scraping", "week_pages"]})
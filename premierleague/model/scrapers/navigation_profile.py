@@ -0,0 +1,58 @@
+import re, logging
+
+logger = logging.getLogger(__name__)
+
+class NavigationProfile:
+    # the scrapers only read text and attributes, so nothing here changes what they see
+    DEFAULT_BLOCKED_RESOURCE_TYPES = ('image', 'media', 'font')
+    DEFAULT_BLOCKED_URL_PATTERNS = (
+        r'google-analytics\.com',
+        r'googletagmanager\.com',
+        r'doubleclick\.net',
+        r'googlesyndication\.com',
+        r'adservice\.google\.',
+        r'connect\.facebook\.net',
+        r'scorecardresearch\.com',
+        r'chartbeat\.(com|net)',
+        r'optimizely\.com',
+        r'hotjar\.com',
+        r'onetrust\.com',
+    )
+    WAIT_UNTIL_OPTIONS = ('commit', 'domcontentloaded', 'load', 'networkidle')
+
+    def __init__(self, blocked_resource_types: tuple[str, ...] | None = DEFAULT_BLOCKED_RESOURCE_TYPES,
+                 blocked_url_patterns: tuple[str, ...] | None = DEFAULT_BLOCKED_URL_PATTERNS,
+                 wait_until: str = 'domcontentloaded'):
+        if wait_until not in self.WAIT_UNTIL_OPTIONS:
+            raise ValueError(f"wait_until must be one of {', '.join(self.WAIT_UNTIL_OPTIONS)}")
+
+        self.blocked_resource_types = frozenset(blocked_resource_types or ())
+        self.blocked_url_patterns = [re.compile(pattern) for pattern in blocked_url_patterns or ()]
+        self.wait_until = wait_until
+        self.blocked = 0
+        self.allowed = 0
+
+    @classmethod
+    def unrestricted(cls) -> 'NavigationProfile':
+        return cls(blocked_resource_types=None, blocked_url_patterns=None, wait_until='load')
+
+    @property
+    def intercepts(self) -> bool:
+        return bool(self.blocked_resource_types or self.blocked_url_patterns)
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        if resource_type in self.blocked_resource_types:
+            return True
+        return any(pattern.search(url) for pattern in self.blocked_url_patterns)
+
+    async def handle_route(self, route):
+        request = route.request
+        if self.should_block(request.resource_type, request.url):
+            self.blocked += 1
+            await route.abort()
+        else:
+            self.allowed += 1
+            await route.continue_()
+
+    def snapshot(self) -> dict:
+        return {"blocked": self.blocked, "allowed": self.allowed, "wait_until": self.wait_until}
@@ -0,0 +1,95 @@
+import os, asyncio, logging, multiprocessing
+from threading import Lock
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+logger = logging.getLogger(__name__)
+
+class ParseExecutor:
+    # a parse worker holds a whole parser in memory, past a handful they only compete with the browsers for it
+    MAX_WORKERS = 4
+    # pages smaller than this parse faster on the loop than they cross to a worker and back
+    INLINE_LIMIT = 32 * 1024
+
+    _instance = None
+    _lock = Lock()
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                logger.debug("Creating a new instance of ParseExecutor", extra={"tags": ["singleton", "init"]})
+                cls._instance = super(ParseExecutor, cls).__new__(cls)
+                cls._instance.workers = min(os.cpu_count() or 1, cls.MAX_WORKERS)
+                cls._instance.inline_limit = cls.INLINE_LIMIT
+                cls._instance._executor = None
+                cls._instance.submitted = 0
+                cls._instance.restarts = 0
+        return cls._instance
+
+    @classmethod
+    def reset(cls):
+        logger.info("Resetting ParseExecutor singleton instance", extra={"tags": ["reset"]})
+        if cls._instance is not None:
+            cls._instance.shutdown()
+        cls._instance = None
+
+    def configure(self, workers: int | None = None, inline_limit: int | None = None):
+        if inline_limit is not None:
+            if inline_limit < 0:
+                raise ValueError("inline_limit can't be negative")
+            self.inline_limit = inline_limit
+        if workers is None:
+            return
+        if workers < 0:
+            raise ValueError("workers can't be negative")
+        if workers > self.MAX_WORKERS:
+            logger.warning(f"ParseExecutor capped at {self.MAX_WORKERS} workers, {workers} were asked for", extra={"tags": ["configure"]})
+            workers = self.MAX_WORKERS
+        if workers != self.workers:
+            # the running pool keeps its size, the next submission starts one with the new size
+            self.shutdown()
+        # 0 parses on the event loop itself, for tests and single-core machines where a pool only adds overhead
+        self.workers = workers
+        logger.info(f"ParseExecutor configured with {workers} workers", extra={"tags": ["configure"]})
+
+    async def run(self, function, *args):
+        # the function and its arguments cross a process boundary, so both have to be picklable: a module level
+        # function taking raw html and returning plain data
+        self.submitted += 1
+        if self.workers == 0 or self._size(args) < self.inline_limit:
+            return function(*args)
+
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._pool(), function, *args)
+        except BrokenProcessPool as e:
+            # a worker died (killed for memory, segfault in the parser), the pool can't take more work
+            self.restarts += 1
+            logger.warning("Parse worker pool broke, retrying on a fresh pool", extra={"tags": ["parse", "pool"], "error": str(e)})
+            self.shutdown()
+            return await loop.run_in_executor(self._pool(), function, *args)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def snapshot(self) -> dict:
+        return {"workers": self.workers, "submitted": self.submitted, "restarts": self.restarts}
+
+    @staticmethod
+    def _size(args) -> int:
+        return sum(len(arg) for arg in args if isinstance(arg, (str, bytes)))
+
+    @staticmethod
+    def _context():
+        # the pool is started from the runtime's thread while others are live, a forked worker can inherit a lock
+        # some other thread held and never get it; forkserver and spawn start workers from a clean process instead
+        methods = multiprocessing.get_all_start_methods()
+        return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=self._context())
+            logger.debug(f"Started a parse pool with {self.workers} processes", extra={"tags": ["parse", "pool"]})
+        return self._executor
@@ -0,0 +1,62 @@
+import importlib.util, logging
+from bs4 import BeautifulSoup, SoupStrainer, FeatureNotFound, ParserRejectedMarkup
+
+logger = logging.getLogger(__name__)
+
+class ParserEngine:
+    FAST_BACKEND = 'lxml'
+    FALLBACK_BACKEND = 'html.parser'
+    BACKENDS = (FAST_BACKEND, FALLBACK_BACKEND)
+
+    # the C tree builder roughly halves parse time on the club and player pages, html.parser is kept for
+    # environments without lxml and for markup lxml refuses
+    backend = FAST_BACKEND if importlib.util.find_spec('lxml') else FALLBACK_BACKEND
+    fallbacks = 0
+    region_misses = 0
+    _strainers = dict()
+
+    @classmethod
+    def configure(cls, backend: str | None = None):
+        if backend is None:
+            return
+        if backend not in cls.BACKENDS:
+            raise ValueError(f"backend must be one of {', '.join(cls.BACKENDS)}")
+        if backend == cls.FAST_BACKEND and not importlib.util.find_spec('lxml'):
+            raise ValueError("the lxml backend needs the lxml package installed")
+        cls.backend = backend
+        logger.info(f"HTML parser backend set to {backend}", extra={"tags": ["parser", "configure"]})
+
+    @classmethod
+    def parse(cls, markup, backend: str | None = None, regions=None) -> BeautifulSoup:
+        backend = backend or cls.backend
+        if regions:
+            # only the elements carrying one of the region classes (and everything inside them) become tree nodes
+            soup = cls._parse(markup, backend, cls.strainer(regions))
+            if soup.find() is not None:
+                return soup
+            cls.region_misses += 1
+            logger.warning("None of the page regions were found, parsing the whole page", extra={"tags": ["parser", "regions"], "regions": list(regions)})
+        return cls._parse(markup, backend)
+
+    @classmethod
+    def strainer(cls, regions) -> SoupStrainer:
+        regions = frozenset(regions)
+        if regions not in cls._strainers:
+            def in_region(value):
+                # the class attribute reaches the strainer unsplit on some bs4 versions and as a list on others
+                if not value:
+                    return False
+                return not regions.isdisjoint(value.split() if isinstance(value, str) else value)
+            cls._strainers[regions] = SoupStrainer(class_=in_region)
+        return cls._strainers[regions]
+
+    @classmethod
+    def _parse(cls, markup, backend: str, parse_only: SoupStrainer | None = None) -> BeautifulSoup:
+        try:
+            return BeautifulSoup(markup, backend, parse_only=parse_only)
+        except (FeatureNotFound, ParserRejectedMarkup) as e:
+            if backend == cls.FALLBACK_BACKEND:
+                raise
+            cls.fallbacks += 1
+            logger.warning(f"{backend} couldn't parse the page, retrying with {cls.FALLBACK_BACKEND}", extra={"tags": ["parser", "fallback"], "error": str(e)})
+            return BeautifulSoup(markup, cls.FALLBACK_BACKEND, parse_only=parse_only)
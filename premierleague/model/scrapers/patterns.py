@@ -0,0 +1,31 @@
+import re
+import soupsieve
+
+class Patterns:
+    # every regex the scrapers and the validator run, compiled once at import instead of going through re's cache per call
+    SQUAD_PAGE_URL = re.compile(r"^https:\/\/www\.premierleague\.com\/clubs\/\d+\/[A-Za-z\-]+\/squad\?se=\d+$")
+    CLUB_PAGE_URL = re.compile(r"^https:\/\/www\.premierleague\.com\/clubs\/\d+\/[A-Za-z\-]+\/overview$")
+    MATCH_PAGE_URL = re.compile(r"^https:\/\/www\.premierleague\.com\/match\/\d+$")
+    PLAYER_PAGE_URL = re.compile(r"^https:\/\/www\.premierleague\.com\/players\/\d+\/[^\/]+\/overview$")
+
+    CLUB_ID = re.compile(r'/clubs/(\d+)(?:/|$)')
+    MATCHWEEK_ID = re.compile(r'/matchweek/(\d+)')
+    NUMBER = re.compile(r'\d+')
+    REFEREE_PREFIX = re.compile(r'^\s*Ref:\s*')
+    MANAGER_TITLE = re.compile(r'^Head Coach$|^First-team Manager$|^Manager$', re.IGNORECASE)
+
+
+class Selectors:
+    _compiled = dict()
+
+    @classmethod
+    def compile(cls, selector: str):
+        # scrapers compile their selectors into class constants, so each one is parsed once per process however many
+        # pages it runs against, and a selector shared by two scrapers is parsed once for both
+        if selector not in cls._compiled:
+            cls._compiled[selector] = soupsieve.compile(selector)
+        return cls._compiled[selector]
+
+
+# read by helpers running outside an extraction schema, compiled once here instead of parsed on every call
+Selectors.CARD_BODY = Selectors.compile('.cardBody')
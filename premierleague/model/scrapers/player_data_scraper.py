@@ -1,9 +1,12 @@
 import logging
-import re
-from bs4 import BeautifulSoup
 from .interfaces.player_data_scraper import IPlayerDataScraper
 from .utils import UrlValidator
 from .request_handler import RequestHandler
+from .request_queue import Priority
+from .parser_engine import ParserEngine
+from .parse_executor import ParseExecutor
+from .extraction_schema import ExtractionSchema, SchemaField
+from .patterns import Patterns
 from .premierleague_website_scraper import PremierleagueWebsiteScraper
 from log_config.logger_configurer import configure_logger, resolve_class_module_name
 
@@ -13,6 +16,23 @@ configure_logger(resolve_class_module_name(RequestHandler))
 configure_logger(resolve_class_module_name(UrlValidator))
 
 class PlayerDataScraper(PremierleagueWebsiteScraper, IPlayerDataScraper):
+    MAX_PICTURE_SIZE = 2 * 1024 * 1024
+    # the header, the sidebar and the personal details block hold every field the getters read
+    PLAYER_PAGE_REGIONS = ('player-header', 'playerSidebar', 'player-info')
+    PLAYER_PAGE_SCHEMA = ExtractionSchema({
+        'firstname': SchemaField('.player-header__name-first'),
+        'lastname': SchemaField('.player-header__name-last'),
+        'club_name': SchemaField('.playerSidebar .player-overview__side-widget:first-child .player-overview__col .player-overview__info a'),
+        'position': SchemaField('.playerSidebar .player-overview.u-hide-mob .player-overview__side-widget:first-child > .player-overview__col:nth-child(3) .player-overview__info'),
+        'nationality': SchemaField('.player-info__player-country'),
+        # the birth date and the age share one block, "<date>  (<age>)"
+        'date_of_birth': SchemaField('.player-info__details-list .player-info__col:nth-child(2) .player-info__info', transform=lambda text: text.split('  ')[0]),
+        'age': SchemaField('.player-info__details-list .player-info__col:nth-child(2) .player-info__info', transform=lambda text: Patterns.NUMBER.search(text.split('  ')[1]).group(), type=int),
+        'shirt_number': SchemaField('.player-header div.player-header__player-number'),
+        'height': SchemaField('.player-info__col:nth-child(3) .player-info__info', transform=lambda text: Patterns.NUMBER.match(text).group(), type=int),
+        'picture_url': SchemaField('.imgContainer img.img', attribute='src'),
+    })
+
     def __init__(self, url):
         logger.debug("Initializing PlayerDataScraper", extra={"tags": ["init", "player_scraper"], "url": url})
         if not UrlValidator.validate_player_page_url(url):
@@ -42,9 +62,8 @@ class PlayerDataScraper(PremierleagueWebsiteScraper, IPlayerDataScraper):
         try:
             await self._request_handler.configure()
             structure = await self._request_handler.get(self._base_url)
-            self._structures = {
-                'main': BeautifulSoup(structure, 'html.parser')
-            }
+            # parsing and selecting happen in a worker process, the event loop only waits for the extracted fields
+            self._page = await ParseExecutor().run(extract_player_page, structure)
             self._initialized = True
             logger.info("Initialization completed", extra={"tags": ["init", "player_scraper"]})
         except Exception as e:
@@ -83,9 +102,7 @@ class PlayerDataScraper(PremierleagueWebsiteScraper, IPlayerDataScraper):
             return self.player_data['club_name']
 
         try:
-            selector = '.playerSidebar .player-overview__side-widget:first-child .player-overview__col .player-overview__info a'
-            club_name = self._structures['main'].select_one(selector)
-            self.player_data['club_name'] = club_name.get_text(strip=True)
+            self.player_data['club_name'] = self._read('club_name')
             logger.debug("Extracted club name", extra={"tags": ["scrape", "club_name"], "value": self.player_data['club_name']})
             return self.player_data['club_name']
         except Exception as e:
@@ -99,7 +116,7 @@ class PlayerDataScraper(PremierleagueWebsiteScraper, IPlayerDataScraper):
             return self.player_data['firstname']
 
         try:
-            self.player_data['firstname'] = self._structures['main'].select_one('.player-header__name-first').get_text(strip=True)
+            self.player_data['firstname'] = self._read('firstname')
             logger.debug("Extracted firstname", extra={"tags": ["scrape", "firstname"], "value": self.player_data['firstname']})
             return self.player_data['firstname']
         except Exception as e:
@@ -113,7 +130,7 @@ class PlayerDataScraper(PremierleagueWebsiteScraper, IPlayerDataScraper):
             return self.player_data['lastname']
 
         try:
-            self.player_data['lastname'] = self._structures['main'].select_one('.player-header__name-last').get_text(strip=True)
+            self.player_data['lastname'] = self._read('lastname')
             logger.debug("Extracted lastname", extra={"tags": ["scrape", "lastname"], "value": self.player_data['lastname']})
             return self.player_data['lastname']
         except Exception as e:
@@ -127,8 +144,7 @@ class PlayerDataScraper(PremierleagueWebsiteScraper, IPlayerDataScraper):
             return self.player_data['position']
 
         try:
-            selector = '.playerSidebar .player-overview.u-hide-mob .player-overview__side-widget:first-child > .player-overview__col:nth-child(3) .player-overview__info'
-            self.player_data['position'] = self._structures['main'].select_one(selector).get_text(strip=True)
+            self.player_data['position'] = self._read('position')
             logger.debug("Extracted position", extra={"tags": ["scrape", "position"], "value": self.player_data['position']})
             return self.player_data['position']
         except Exception as e:
@@ -142,7 +158,7 @@ class PlayerDataScraper(PremierleagueWebsiteScraper, IPlayerDataScraper):
             return self.player_data['nationality']
 
         try:
-            self.player_data['nationality'] = self._structures['main'].select_one('.player-info__player-country').get_text(strip=True)
+            self.player_data['nationality'] = self._read('nationality')
             logger.debug("Extracted nationality", extra={"tags": ["scrape", "nationality"], "value": self.player_data['nationality']})
             return self.player_data['nationality']
         except Exception as e:
@@ -156,7 +172,7 @@ class PlayerDataScraper(PremierleagueWebsiteScraper, IPlayerDataScraper):
             return self.player_data['shirt_number']
 
         try:
-            self.player_data['shirt_number'] = self._structures['main'].select_one('.player-header div.player-header__player-number').get_text(strip=True)
+            self.player_data['shirt_number'] = self._read('shirt_number')
             logger.debug("Extracted shirt number", extra={"tags": ["scrape", "shirt_number"], "value": self.player_data['shirt_number']})
             return self.player_data['shirt_number']
         except Exception as e:
@@ -170,8 +186,7 @@ class PlayerDataScraper(PremierleagueWebsiteScraper, IPlayerDataScraper):
             return self.player_data['date_of_birth']
 
         try:
-            dob_block = self._structures['main'].select_one('.player-info__details-list .player-info__col:nth-child(2) .player-info__info')
-            dob_text = dob_block.get_text(strip=True).split('  ')[0]
+            dob_text = self._read('date_of_birth')
             self.player_data['date_of_birth'] = dob_text
             logger.debug("Extracted date of birth", extra={"tags": ["scrape", "dob"], "value": dob_text})
             return dob_text
@@ -186,9 +201,7 @@ class PlayerDataScraper(PremierleagueWebsiteScraper, IPlayerDataScraper):
             return self.player_data['age']
 
         try:
-            info_block = self._structures['main'].select_one('.player-info__details-list .player-info__col:nth-child(2) .player-info__info')
-            age_text = info_block.get_text(strip=True).split('  ')[1]
-            self.player_data['age'] = int(re.search(r'\d+', age_text).group())
+            self.player_data['age'] = self._read('age')
             logger.debug("Extracted age", extra={"tags": ["scrape", "age"], "value": self.player_data['age']})
             return self.player_data['age']
         except Exception as e:
@@ -202,8 +215,7 @@ class PlayerDataScraper(PremierleagueWebsiteScraper, IPlayerDataScraper):
             return self.player_data['height']
 
         try:
-            height_string = self._structures['main'].select_one('.player-info__col:nth-child(3) .player-info__info').get_text(strip=True)
-            self.player_data['height'] = int(re.match(r'\d+', height_string).group())
+            self.player_data['height'] = self._read('height')
             logger.debug("Extracted height", extra={"tags": ["scrape", "height"], "value": self.player_data['height']})
             return self.player_data['height']
         except Exception as e:
@@ -217,9 +229,9 @@ class PlayerDataScraper(PremierleagueWebsiteScraper, IPlayerDataScraper):
             return self.player_data['picture']
 
         try:
-            picture_url = self._structures['main'].select_one('.imgContainer img.img')['src']
+            picture_url = self._read('picture_url')
             logger.debug("Found picture URL", extra={"tags": ["scrape", "picture"], "url": picture_url})
-            self.player_data['picture'] = await self._request_handler.get(url=picture_url, raw=True)
+            self.player_data['picture'] = await self._request_handler.get(url=picture_url, raw=True, priority=Priority.BULK, max_size=self.MAX_PICTURE_SIZE)
             logger.info("Fetched player image bytes", extra={"tags": ["scrape", "picture"]})
             return self.player_data['picture']
         except Exception as e:
@@ -227,8 +239,19 @@ class PlayerDataScraper(PremierleagueWebsiteScraper, IPlayerDataScraper):
                          extra={"tags": ["scrape", "picture"], "error": str(e)})
             raise
 
+    def _read(self, field):
+        value = self._page.get(field)
+        if value is None:
+            raise ValueError(f"{field} not found on the player page")
+        return value
+
     def _raise_if_not_initialized(self):
         if not self._initialized:
             logger.error("Scraper used before initialization", extra={"tags": ["error", "init"], "error": "scraper not initialized"})
             raise RuntimeError("scraper doesn't initialized yet, you should call 'await scraper.initialize()' first")
         logger.debug("Scraper is initialized", extra={"tags": ["check", "init"]})
+
+
+def extract_player_page(html: str) -> dict:
+    # runs in a parse worker: raw html in, plain values out, no soup crosses the process boundary
+    return PlayerDataScraper.PLAYER_PAGE_SCHEMA.extract(ParserEngine.parse(html, regions=PlayerDataScraper.PLAYER_PAGE_REGIONS))
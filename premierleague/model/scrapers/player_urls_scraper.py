@@ -1,8 +1,9 @@
 import logging
-from bs4 import BeautifulSoup
 from .interfaces.player_urls_scraper import IPlayerUrlsScraper
 from .utils import UrlValidator
 from .request_handler import RequestHandler
+from .parser_engine import ParserEngine
+from .patterns import Selectors
 from .club_urls_scraper import ClubUrlsScraper
 from .premierleague_website_scraper import PremierleagueWebsiteScraper
 from log_config.logger_configurer import configure_logger, resolve_class_module_name
@@ -14,6 +15,13 @@ configure_logger(resolve_class_module_name(RequestHandler))
 configure_logger(resolve_class_module_name(UrlValidator))
 
 class PlayerUrlsScraper(PremierleagueWebsiteScraper, IPlayerUrlsScraper):
+    CLUB_PAGE_REGIONS = ('club-navigation',)
+    SQUAD_PAGE_REGIONS = ('stats-card',)
+    PLAYER_CARD_SELECTOR = Selectors.compile('li.stats-card[data-widget="featured-player"] a.stats-card__wrapper')
+    PLAYER_FIRSTNAME_SELECTOR = Selectors.compile('.stats-card__player-first')
+    PLAYER_LASTNAME_SELECTOR = Selectors.compile('.stats-card__player-last')
+    SQUAD_BUTTON_SELECTOR = Selectors.compile('ul.club-navigation__nav a.club-navigation__link[data-text="Squad"]')
+
     def __init__(self, club_name=None, url=None):
         super().__init__()
         self._club_name = club_name
@@ -41,7 +49,7 @@ class PlayerUrlsScraper(PremierleagueWebsiteScraper, IPlayerUrlsScraper):
                 raise ValueError("didn't provided any identifier")
             
             self.structure = await self._request_handler.get(self._url)
-            self.structure = BeautifulSoup(self.structure, 'html.parser')
+            self.structure = ParserEngine.parse(self.structure, regions=self.SQUAD_PAGE_REGIONS)
 
             self._initialized = True
             logger.info("PlayerUrlsScraper initialized successfully", extra={"tags": ["init"]})
@@ -58,12 +66,12 @@ class PlayerUrlsScraper(PremierleagueWebsiteScraper, IPlayerUrlsScraper):
         result.append(columns_row)
 
         try:
-            player_elements = self.structure.select('li.stats-card[data-widget="featured-player"] a.stats-card__wrapper')
+            player_elements = self.structure.select(self.PLAYER_CARD_SELECTOR)
             logger.debug(f"Found {len(player_elements)} player elements", extra={"tags": ["scraping"]})
 
             for index, player_element in enumerate(player_elements):
-                firstname = player_element.select_one('.stats-card__player-first').get_text(strip=True)
-                lastname = player_element.select_one('.stats-card__player-last').get_text(strip=True)
+                firstname = player_element.select_one(self.PLAYER_FIRSTNAME_SELECTOR).get_text(strip=True)
+                lastname = player_element.select_one(self.PLAYER_LASTNAME_SELECTOR).get_text(strip=True)
                 full_name = firstname + lastname
 
                 player_page_url = self._website_url + player_element.get('href')
@@ -100,8 +108,8 @@ class PlayerUrlsScraper(PremierleagueWebsiteScraper, IPlayerUrlsScraper):
                 raise ValueError("didn't provided any argument")
 
             page_structure = await self._request_handler.get(club_page_url)
-            page_structure = BeautifulSoup(page_structure, 'html.parser')
-            squad_button = page_structure.select_one('ul.club-navigation__nav a.club-navigation__link[data-text="Squad"]')
+            page_structure = ParserEngine.parse(page_structure, regions=self.CLUB_PAGE_REGIONS)
+            squad_button = page_structure.select_one(self.SQUAD_BUTTON_SELECTOR)
 
             if not squad_button:
                 logger.error("Squad button not found on club page", extra={"tags": ["squad_url", "error"], "error": "Squad button not found"})
@@ -0,0 +1,64 @@
+import asyncio, time, logging
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: int):
+        if rate <= 0:
+            raise ValueError("rate must be a positive number of requests per second")
+        if burst < 1:
+            raise ValueError("burst must allow at least one request")
+
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @property
+    def tokens(self) -> float:
+        self._refill()
+        return self._tokens
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self):
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                delay = (1 - self._tokens) / self.rate
+                logger.debug(f"Token bucket empty, waiting {delay:.3f}s", extra={"tags": ["rate_limit", "wait"], "delay": delay})
+                await asyncio.sleep(delay)
+                self._refill()
+            self._tokens -= 1
+
+
+class HostRateLimiter:
+    def __init__(self, rate: float, burst: int, host_limits: dict[str, tuple[float, int]] | None = None):
+        self.rate = rate
+        self.burst = burst
+        self.host_limits = dict(host_limits or {})
+        self._buckets: dict[str, TokenBucket] = dict()
+        # validate eagerly so a bad configuration fails in configure() and not on the first request
+        TokenBucket(rate, burst)
+        for host_rate, host_burst in self.host_limits.values():
+            TokenBucket(host_rate, host_burst)
+
+    @staticmethod
+    def resolve_host(url: str) -> str:
+        return urlsplit(url).netloc.lower()
+
+    def bucket_for(self, url: str) -> TokenBucket:
+        host = self.resolve_host(url)
+        if host not in self._buckets:
+            rate, burst = self.host_limits.get(host, (self.rate, self.burst))
+            self._buckets[host] = TokenBucket(rate, burst)
+            logger.debug(f"Token bucket created for host {host}", extra={"tags": ["rate_limit", "init"], "host": host, "rate": rate, "burst": burst})
+        return self._buckets[host]
+
+    async def acquire(self, url: str):
+        await self.bucket_for(url).acquire()
@@ -1,12 +1,54 @@
-import random, asyncio, aiohttp, signal, time, logging
+import random, asyncio, aiohttp, signal, time, logging, threading
+from contextlib import asynccontextmanager
 from threading import Lock
+from .rate_limiter import HostRateLimiter
+from .response_cache import ResponseCache
+from .retry_policy import RetryPolicy
+from .connection_pool import ConnectionPool
+from .transport import LiveTransport
+from playwright.async_api import Error as PlaywrightError
+from .browser_pool import BrowserPool, PooledPage
+from .navigation_profile import NavigationProfile
+from .concurrency_limiter import AdaptiveConcurrencyLimiter
+from .request_metrics import RequestMetrics
+from .request_queue import Priority, PriorityRequestQueue, request_priority
 
 logger = logging.getLogger(__name__)
 
+class ResponseTooLargeError(ValueError):
+    pass
+
+class QueuedRequest:
+    def __init__(self, url, future, priority=Priority.PAGE):
+        self.url = url
+        self.future = future
+        self.priority = priority
+        self.coro = None
+        self.task = None
+        self.waiters = 0
+        # outcome of the latest attempt, reported to the concurrency limiter
+        self.latency = None
+        self.status = None
+        self.error = None
+        self.size = 0
+        self.enqueued_at = None
+        self.dispatched_at = None
+
+    def close(self):
+        if self.coro is not None and self.task is None:
+            self.coro.close()
+
 class RequestHandler:
     _instance = None
     _lock = Lock()
 
+    # roughly the average throughput of the old batch-and-sleep scheduler, without its idle gaps
+    DEFAULT_RATE = 0.5
+    DEFAULT_BURST = 5
+    DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=60, connect=15, sock_read=30)
+    # size-capped bodies are read in chunks of this many bytes, so an oversized one is dropped after one chunk too many
+    CHUNK_SIZE = 64 * 1024
+
     USER_AGENTS = [
     # Chrome on Windows
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.6312.86 Safari/537.36",
@@ -43,11 +85,28 @@ class RequestHandler:
         logger.info("Resetting RequestHandler singleton instance", extra={"tags": ["reset"]})
         cls._instance = None
 
-    async def configure(self):
+    async def configure(self, rate=None, burst=None, host_limits=None, response_cache=None, retry_policy=None, connection_pool=None, timeout=None, priority_weights=None, concurrency=None, metrics=None, transport=None):
         current_loop = asyncio.get_running_loop()
         logger.debug("Starting configure()", extra={"tags": ["configure"]})
 
-        if not self._is_configured or self._scheduler_loop != current_loop:
+        self._rate = rate if rate is not None else getattr(self, '_rate', self.DEFAULT_RATE)
+        self._burst = burst if burst is not None else getattr(self, '_burst', self.DEFAULT_BURST)
+        self._host_limits = host_limits if host_limits is not None else getattr(self, '_host_limits', {})
+        # pass response_cache=False to disable caching
+        if response_cache is not None:
+            self.response_cache = response_cache or None
+        elif not hasattr(self, 'response_cache'):
+            self.response_cache = ResponseCache()
+        self.retry_policy = retry_policy or getattr(self, 'retry_policy', None) or RetryPolicy()
+        self.connection_pool = connection_pool or getattr(self, 'connection_pool', None) or ConnectionPool()
+        self.timeout = self._request_timeout(timeout) if timeout is not None else getattr(self, 'timeout', self.DEFAULT_TIMEOUT)
+        self._priority_weights = priority_weights or getattr(self, '_priority_weights', None)
+        self.concurrency = concurrency or getattr(self, 'concurrency', None) or AdaptiveConcurrencyLimiter()
+        self.metrics = metrics or getattr(self, 'metrics', None) or RequestMetrics()
+        self.transport = transport or getattr(self, 'transport', None) or LiveTransport()
+
+        # switching transports needs a new session, which the rebuild below creates
+        if not self._is_configured or self._scheduler_loop != current_loop or getattr(self, '_session_transport', None) is not self.transport:
             if hasattr(self, '_scheduler_task'):
                 try:
                     logger.info("Reconfiguring session: closing previous session and cancelling task", extra={"tags": ["configure"]})
@@ -57,10 +116,19 @@ class RequestHandler:
                 except asyncio.CancelledError:
                     logger.warning("Scheduler task cancelled during reconfiguration", extra={"tags": ["configure"]})
 
-            self.queue = asyncio.Queue()
-            self.session = aiohttp.ClientSession()
-            self._batch_size = random.randint(3, 5)
-            logger.debug(f"Batch size set to {self._batch_size}", extra={"tags": ["configure"]})
+            self.queue = PriorityRequestQueue(self._priority_weights)
+            self.session = self.transport.create_session(self.connection_pool)
+            self._session_transport = self.transport
+            self._rate_limiter = HostRateLimiter(self._rate, self._burst, self._host_limits) if self.transport.rate_limited else None
+            self._in_flight = set()
+            self._lanes = dict()
+            self._pending_requests = dict()
+            self.coalesced_requests = getattr(self, 'coalesced_requests', 0)
+            self.retries_used = 0
+            self._retry_timers = set()
+            self.concurrency.reset()
+            self._register_gauges()
+            logger.debug(f"Rate limit set to {self._rate} req/s with burst {self._burst}", extra={"tags": ["configure"]})
             self._register_shutdown_hooks()
             self._scheduler_task = asyncio.create_task(self._scheduler())
             self._scheduler_loop = current_loop
@@ -69,8 +137,29 @@ class RequestHandler:
 
             logger.info("RequestHandler configured successfully", extra={"tags": ["configure"]})
 
+    def begin_run(self):
+        # the handler outlives a single command on the admin runtime, but the retry budget is meant per run
+        self.retries_used = 0
+        logger.debug("Retry budget reset for a new run", extra={"tags": ["retry", "configure"], "budget": self.retry_policy.budget})
+
+    def _register_gauges(self):
+        self.metrics.register_gauge('in_flight', lambda: len(self._in_flight))
+        self.metrics.register_gauge('queued', self._queued)
+        self.metrics.register_gauge('concurrency', self.concurrency.snapshot)
+        self.metrics.register_gauge('coalesced_requests', lambda: self.coalesced_requests)
+        self.metrics.register_gauge('retries_used', lambda: self.retries_used)
+        self.metrics.register_gauge('cache', lambda: {
+            "hits": self.response_cache.hits,
+            "revalidated": self.response_cache.revalidated,
+            "misses": self.response_cache.misses,
+        } if self.response_cache else None)
+
     def _register_shutdown_hooks(self):
         loop = asyncio.get_running_loop()
+        if threading.current_thread() is not threading.main_thread():
+            # signals only reach the main thread, whoever runs this loop in the background owns shutdown
+            logger.debug("Not on the main thread, leaving signal handling to the loop owner", extra={"tags": ["shutdown", "signal"]})
+            return
 
         def on_shutdown():
             logger.info("Shutdown signal received", extra={"tags": ["shutdown"]})
@@ -92,41 +181,139 @@ class RequestHandler:
 
     async def _scheduler(self):
         logger.info("Scheduler started", extra={"tags": ["scheduler"]})
+        # the shared queue hands requests out in priority order, then each host waits for its own tokens in its own
+        # lane, so a throttled host never holds up requests for the others
+        lanes = dict()
+        self._lanes = lanes
+        try:
+            while True:
+                request = await self.queue.get()
+                if request.future.done():
+                    logger.debug(f"Skipping abandoned request: {request.url}", extra={"tags": ["scheduler", "cancel"]})
+                    request.close()
+                    continue
+                host = HostRateLimiter.resolve_host(request.url)
+                if host not in lanes:
+                    lane = PriorityRequestQueue(getattr(self.queue, 'weights', None))
+                    lanes[host] = (lane, asyncio.create_task(self._host_dispatcher(host, lane)))
+                    logger.debug(f"Dispatch lane opened for host {host}", extra={"tags": ["scheduler"], "host": host})
+                lanes[host][0].put_nowait(request)
+        finally:
+            for lane, task in lanes.values():
+                task.cancel()
+                while not lane.empty():
+                    lane.get_nowait().close()
+
+    async def _host_dispatcher(self, host, lane):
         while True:
-            batch = []
-            for _ in range(self._batch_size):
-                try:
-                    coro = await asyncio.wait_for(self.queue.get(), timeout=1)
-                    task = asyncio.create_task(coro)
-                    batch.append(task)
-                    logger.debug("Task added to batch", extra={"tags": ["scheduler"]})
-                except asyncio.TimeoutError:
-                    break
-
-            if batch:
-                logger.debug(f"Executing batch of size {len(batch)}", extra={"tags": ["scheduler"]})
-                await asyncio.gather(*batch)
-                self._batch_size = random.randint(3, 5)
-                delay = random.randint(5, 10)
-                logger.info(f"Batch complete. Sleeping for {delay}s", extra={"tags": ["scheduler"]})
-                await asyncio.sleep(delay)
-
-    async def get(self, url, raw=False):
+            request = await lane.get()
+            if request.future.done():
+                logger.debug(f"Skipping abandoned request: {request.url}", extra={"tags": ["scheduler", "cancel"]})
+                request.close()
+                continue
+            try:
+                # the token comes first, a request waiting on its host's bucket mustn't sit on a slot other hosts could use
+                if self._rate_limiter is not None:
+                    await self._rate_limiter.acquire(request.url)
+                await self.concurrency.acquire()
+            except asyncio.CancelledError:
+                request.close()
+                raise
+            if request.future.done():
+                self.concurrency.release()
+                request.close()
+                continue
+            self._dispatch(request)
+
+    def _dispatch(self, request):
+        request.latency = request.status = request.error = None
+        request.size = 0
+        request.dispatched_at = time.monotonic()
+        if request.enqueued_at is not None:
+            self.metrics.observe_queue_wait(request.dispatched_at - request.enqueued_at)
+        request.task = asyncio.create_task(request.coro)
+        self._in_flight.add(request.task)
+        request.task.add_done_callback(lambda task, request=request: self._on_request_done(request, task))
+        logger.debug(f"Request dispatched: {request.url}", extra={"tags": ["scheduler"], "in_flight": len(self._in_flight), "concurrency_limit": self.concurrency.current_limit})
+
+    def _queued(self) -> dict[str, int]:
+        sizes = self.queue.sizes()
+        for lane, _ in getattr(self, '_lanes', {}).values():
+            for priority, size in lane.sizes().items():
+                sizes[priority] = sizes.get(priority, 0) + size
+        return sizes
+
+    def _on_request_done(self, request, task):
+        self._in_flight.discard(task)
+        if task.cancelled():
+            self.concurrency.release()
+        else:
+            self.concurrency.release(latency=request.latency, status=request.status, error=request.error)
+        self.metrics.observe_response(
+            request.url,
+            latency=request.latency,
+            network_time=time.monotonic() - request.dispatched_at,
+            status=request.status,
+            size=request.size,
+            error=request.error,
+        )
+
+    def _enqueue(self, request):
+        request.enqueued_at = time.monotonic()
+        self.queue.put_nowait(request)
+
+    async def get(self, url, raw=False, timeout=None, priority=None, headers=None, raise_for_status=False, max_size=None):
         if not self._is_configured:
             raise RuntimeError("RequestHandler not configured yet. Call 'await handler.configure()' first.")
 
-        user_agent = random.choice(self.USER_AGENTS)
-        headers = {"User-Agent": user_agent}
-        loop = asyncio.get_running_loop()
-        future = loop.create_future()
+        priority = priority or request_priority.get() or Priority.PAGE
+        request_key = (url, raw, raise_for_status, max_size)
+        if request_key in self._pending_requests:
+            self.coalesced_requests += 1
+            logger.debug(f"GET request coalesced with in-flight request: {url}", extra={"tags": ["network", "http", "coalesce"], "url": url})
+            existing = self._pending_requests[request_key]
+            self._promote(existing, priority)
+            return await self._wait_for(existing)
+
+        cache_entry = self.response_cache.lookup(url) if self.response_cache else None
+        if cache_entry and self.response_cache.is_fresh(cache_entry):
+            self.response_cache.hits += 1
+            logger.info(f"GET request served from cache: {url}", extra={"tags": ["network", "http", "cache"], "url": url})
+            body = self.response_cache.read_body(cache_entry)
+            self._check_size(url, len(body), max_size)
+            return self._decode_body(body, cache_entry['encoding'], raw)
 
-        async def fetch():
+        user_agent = random.choice(self.USER_AGENTS)
+        # extra headers come first so they can't override the rotated user agent or the cache validators
+        headers = {**(headers or {}), "User-Agent": user_agent}
+        if cache_entry:
+            headers.update(ResponseCache.conditional_headers(cache_entry))
+        request_timeout = self._request_timeout(timeout)
+        request = QueuedRequest(url, asyncio.get_running_loop().create_future(), priority)
+        future = request.future
+
+        async def fetch(attempt=1):
             start = time.time()
             try:
-                async with self.session.get(url, headers=headers) as response:
+                async with self.session.get(url, headers=headers, timeout=request_timeout) as response:
                     duration = round(time.time() - start, 3)
                     status_code = response.status
-                    result = await response.read() if raw else await response.text()    
+                    request.latency, request.status = duration, status_code
+                    if self._schedule_retry(request, fetch, attempt, status=status_code, retry_after=response.headers.get('Retry-After')):
+                        return
+                    if raise_for_status:
+                        response.raise_for_status()
+                    if status_code == 304 and cache_entry:
+                        self.response_cache.mark_revalidated(url, response.headers)
+                        body = self.response_cache.read_body(cache_entry)
+                        self._check_size(url, len(body), max_size)
+                        encoding = cache_entry['encoding']
+                    else:
+                        body = await self._read_body(response, url, max_size)
+                        request.size = len(body)
+                        encoding = None if raw else response.get_encoding()
+                        if status_code == 200 and self.response_cache:
+                            self.response_cache.store(url, body, response.headers, encoding)
                     logger.info(
                         f"GET request successful - status: {status_code}",
                         extra={
@@ -137,9 +324,14 @@ class RequestHandler:
                             "agent": user_agent,
                         },
                     )
-                    future.set_result(result)
-                    
+                    future.set_result(self._decode_body(body, encoding, raw))
+
+            except asyncio.CancelledError:
+                if not future.done():
+                    future.cancel()
+                raise
             except Exception as e:
+                request.error = e
                 duration = round(time.time() - start, 3)
                 logger.error(
                     f"GET request failed for {url}",
@@ -152,11 +344,106 @@ class RequestHandler:
                         "duration": duration,
                     },
                 )
-                future.set_exception(e)
+                if not self._schedule_retry(request, fetch, attempt, exception=e):
+                    future.set_exception(e)
 
-        self.queue.put_nowait(fetch())
-        logger.debug(f"GET request queued: {url}", extra={"tags": ["network", "http"]})
-        return await future
+        self._pending_requests[request_key] = request
+        future.add_done_callback(lambda _: self._pending_requests.pop(request_key, None))
+
+        request.coro = fetch()
+        self._enqueue(request)
+        logger.debug(f"GET request queued: {url}", extra={"tags": ["network", "http"], "priority": priority})
+        return await self._wait_for(request)
+
+    @classmethod
+    async def _read_body(cls, response, url, max_size):
+        if max_size is None:
+            return await response.read()
+
+        # a declared length over the limit is refused before any of it is read, an undeclared one is cut off mid-stream
+        cls._check_size(url, response.content_length or 0, max_size)
+        body = bytearray()
+        async for chunk in response.content.iter_chunked(cls.CHUNK_SIZE):
+            body += chunk
+            cls._check_size(url, len(body), max_size)
+        return bytes(body)
+
+    @staticmethod
+    def _check_size(url, size, max_size):
+        if max_size is not None and size > max_size:
+            raise ResponseTooLargeError(f"{url} is over the {max_size} bytes limit")
+
+    async def _wait_for(self, request):
+        request.waiters += 1
+        try:
+            # shielded so one cancelled waiter doesn't cancel a response other waiters share
+            return await asyncio.shield(request.future)
+        except asyncio.CancelledError:
+            request.waiters -= 1
+            if request.waiters == 0:
+                self._abandon(request)
+            raise
+
+    def _promote(self, request, priority):
+        # a coalesced waiter with a more urgent class pulls the shared request forward
+        weights = self.queue.weights
+        if request.task is None and weights.get(priority, 0) > weights.get(request.priority, 0):
+            if not self.queue.promote(request, priority):
+                # already handed to its host's lane, still waiting for a token
+                lane = getattr(self, '_lanes', {}).get(HostRateLimiter.resolve_host(request.url))
+                if lane is not None:
+                    lane[0].promote(request, priority)
+
+    def _abandon(self, request):
+        if request.future.done():
+            return
+        request.future.cancel()
+        # a queued request is dropped by the scheduler, an in-flight one is aborted here
+        if request.task is not None and not request.task.done():
+            request.task.cancel()
+        logger.info(f"Request abandoned by all waiters: {request.url}", extra={"tags": ["network", "cancel"], "url": request.url, "in_flight": request.task is not None})
+
+    def _request_timeout(self, timeout):
+        if timeout is None:
+            return self.timeout
+        if isinstance(timeout, aiohttp.ClientTimeout):
+            return timeout
+        defaults = getattr(self, 'timeout', self.DEFAULT_TIMEOUT)
+        return aiohttp.ClientTimeout(total=timeout, connect=defaults.connect, sock_read=defaults.sock_read)
+
+    def _schedule_retry(self, request, fetch, attempt, status=None, exception=None, retry_after=None):
+        url = request.url
+        if not self.retry_policy.should_retry(attempt, status=status, exception=exception):
+            return False
+        if self.retries_used >= self.retry_policy.budget:
+            logger.warning(f"Retry budget exhausted, giving up on {url}", extra={"tags": ["network", "retry"], "url": url, "budget": self.retry_policy.budget})
+            return False
+
+        self.retries_used += 1
+        delay = self.retry_policy.compute_delay(attempt, status=status, retry_after=retry_after)
+
+        def requeue():
+            self._retry_timers.discard(timer)
+            if request.future.done():
+                return
+            request.coro = fetch(attempt + 1)
+            request.task = None
+            self._enqueue(request)
+
+        # the retry waits on a timer and then re-enters the queue, so it never holds a dispatch slot
+        timer = asyncio.get_running_loop().call_later(delay, requeue)
+        self._retry_timers.add(timer)
+        logger.info(
+            f"Retrying {url} in {delay:.2f}s (attempt {attempt + 1})",
+            extra={"tags": ["network", "retry"], "url": url, "status_code": status, "error": str(exception) if exception else None, "delay": delay},
+        )
+        return True
+
+    @staticmethod
+    def _decode_body(body, encoding, raw):
+        if raw:
+            return body
+        return body.decode(encoding or 'utf-8')
 
     async def shutdown(self):
         if getattr(self, "_shutdown_started", False):
@@ -171,15 +458,35 @@ class RequestHandler:
             except asyncio.CancelledError:
                 logger.debug("Scheduler task cancelled", extra={"tags": ["shutdown"]})
 
+        for timer in list(getattr(self, "_retry_timers", ())):
+            timer.cancel()
+
+        for task in list(getattr(self, "_in_flight", ())):
+            task.cancel()
+
         if hasattr(self, 'session') and self.session and not self.session.closed:
             await self.session.close()
             logger.info("Session closed", extra={"tags": ["shutdown"]})
 
+        if getattr(self, 'response_cache', None):
+            self.response_cache.close()
+
 
 class PlaywrightRequestHandler:
     _instance = None
     _lock = Lock()
 
+    DEFAULT_NAVIGATION_TIMEOUT = 30
+    DEFAULT_ACTION_TIMEOUT = 15
+    DEFAULT_MAX_RECOVERIES = 2
+    # navigations in flight when the pool can't tell its own page capacity
+    DEFAULT_MAX_CONCURRENCY = 8
+    # per host, a steady pace instead of the old bursts of 3-5 navigations followed by 5-10s of silence
+    DEFAULT_RATE = 2.0
+    DEFAULT_BURST = 4
+    # playwright reports dead pages and browsers through its generic Error, only the message tells them apart
+    CRASH_MESSAGES = ('has been closed', 'target closed', 'crashed', 'browser closed')
+
     @classmethod
     def reset(cls):
         logger.info("Resetting PlaywrightRequestHandler instance", extra={"tags": ["reset"]})
@@ -193,12 +500,54 @@ class PlaywrightRequestHandler:
                 cls._instance._is_configured = False
         return cls._instance
 
-    async def configure(self):
-        if not self._is_configured:
+    async def __aenter__(self):
+        await self.configure()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.shutdown()
+
+    async def configure(self, browser_pool=None, navigation_profile=None, navigation_timeout=None, action_timeout=None, max_recoveries=None,
+                        max_concurrency=None, rate=None, burst=None):
+        current_loop = asyncio.get_running_loop()
+        # a pool used on another loop is bound to it (its playwright connection and lease condition), it can't be carried over
+        loop_changed = self._is_configured and getattr(self, '_scheduler_loop', None) is not current_loop
+        previous_pool = None if loop_changed else getattr(self, 'browser_pool', None)
+
+        # browsers launch lazily on the first page() call, so configuring stays cheap
+        self.browser_pool = browser_pool or previous_pool or BrowserPool()
+        self.navigation_profile = navigation_profile or getattr(self, 'navigation_profile', None) or NavigationProfile()
+        # seconds; a hung page fails its scrape instead of holding a pooled page forever
+        self.navigation_timeout = navigation_timeout or getattr(self, 'navigation_timeout', None) or self.DEFAULT_NAVIGATION_TIMEOUT
+        self.action_timeout = action_timeout or getattr(self, 'action_timeout', None) or self.DEFAULT_ACTION_TIMEOUT
+        if max_recoveries is not None:
+            self.max_recoveries = max_recoveries
+        elif not hasattr(self, 'max_recoveries'):
+            self.max_recoveries = self.DEFAULT_MAX_RECOVERIES
+        # every navigation runs on a leased page, so more in flight than the pool has pages would only queue up inside it
+        capacity = getattr(self.browser_pool, 'capacity', None)
+        self.max_concurrency = max_concurrency or getattr(self, 'max_concurrency', None) or (capacity if isinstance(capacity, int) else self.DEFAULT_MAX_CONCURRENCY)
+        # pass rate=False to navigate without a per-host rate limit
+        if rate is not None:
+            self._rate = rate or None
+        elif not hasattr(self, '_rate'):
+            self._rate = self.DEFAULT_RATE
+        self._burst = burst or getattr(self, '_burst', None) or self.DEFAULT_BURST
+
+        if not self._is_configured or loop_changed:
+            if loop_changed:
+                # the loop that ran the old scheduler is gone (e.g. a finished asyncio.run), so nothing on it can be awaited
+                logger.info("Event loop changed, rebuilding PlaywrightRequestHandler", extra={"tags": ["configure"]})
+                self._abandon_queue()
+
             logger.info("Configuring PlaywrightRequestHandler", extra={"tags": ["configure"]})
-            self._batch_size = random.randint(3, 5)
+            self.recovered_navigations = getattr(self, 'recovered_navigations', 0)
             self.queue = asyncio.Queue()
-            self._schedular_task = asyncio.create_task(self._scheduler())
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+            self._rate_limiter = HostRateLimiter(self._rate, self._burst) if self._rate else None
+            self._pending_navigations = set()
+            self._scheduler_task = asyncio.create_task(self._scheduler())
+            self._scheduler_loop = current_loop
             self._register_shutdown_hooks()
             self._shutdown_started = False
             self._is_configured = True
@@ -206,6 +555,10 @@ class PlaywrightRequestHandler:
 
     def _register_shutdown_hooks(self):
         loop = asyncio.get_running_loop()
+        if threading.current_thread() is not threading.main_thread():
+            # signals only reach the main thread, whoever runs this loop in the background owns shutdown
+            logger.debug("Not on the main thread, leaving signal handling to the loop owner", extra={"tags": ["shutdown", "signal"]})
+            return
 
         def on_shutdown():
             logger.info("Shutdown signal received", extra={"tags": ["shutdown"]})
@@ -226,41 +579,70 @@ class PlaywrightRequestHandler:
                 signal.signal(sig, sync_shutdown)
 
     async def _scheduler(self):
-        logger.info("Playwright scheduler started", extra={"tags": ["scheduler"]})
-        while True:
-            batch = []
-            for _ in range(self._batch_size):
+        logger.info("Playwright scheduler started", extra={"tags": ["scheduler"], "max_concurrency": self.max_concurrency})
+        running = set()
+        try:
+            while True:
+                coro = await self.queue.get()
                 try:
-                    coro = await asyncio.wait_for(asyncio.shield(self.queue.get()), timeout=1)
-                    batch.append(asyncio.create_task(coro))
-                    logger.debug("Playwright task added to batch", extra={"tags": ["scheduler"]})
-                except asyncio.TimeoutError:
-                    logger.debug("Playwright task queue timeout", extra={"tags": ["scheduler"]})
-                    await asyncio.sleep(0.1)
-                    break
-
-            if batch:
-                await asyncio.gather(*batch)
-                self._batch_size = random.randint(3, 5)
-                delay = random.randint(5, 10)
-                logger.info(f"Batch done. Sleeping {delay}s", extra={"tags": ["scheduler"]})
-                await asyncio.sleep(delay)
-
-    async def goto(self, page, url):
+                    await self._slots.acquire()
+                except asyncio.CancelledError:
+                    coro.close()
+                    self.queue.task_done()
+                    raise
+                task = asyncio.create_task(coro)
+                running.add(task)
+                task.add_done_callback(lambda task: self._on_navigation_done(task, running))
+                logger.debug("Playwright navigation dispatched", extra={"tags": ["scheduler"], "in_flight": len(running)})
+        finally:
+            for task in running:
+                task.cancel()
+
+    def _on_navigation_done(self, task, running):
+        running.discard(task)
+        self._slots.release()
+        self.queue.task_done()
+
+    def page(self):
         if not self._is_configured:
             raise RuntimeError("PlaywrightRequestHandler not configured yet. Call 'await handler.configure()' first.")
+        return self._profiled_page()
 
-        loop = asyncio.get_running_loop()
-        future = loop.create_future()
+    @asynccontextmanager
+    async def _profiled_page(self):
+        async with self.browser_pool.page() as page:
+            await self._prepare_page(page)
+            yield page
 
-        async def coroutine():
+    async def _prepare_page(self, page):
+        self.apply_deadlines(page)
+        await self.apply_profile(page)
+
+    async def apply_profile(self, page):
+        if self.navigation_profile.intercepts:
+            await page.route("**/*", self.navigation_profile.handle_route)
+
+    def apply_deadlines(self, page):
+        page.set_default_navigation_timeout(self.navigation_timeout * 1000)
+        page.set_default_timeout(self.action_timeout * 1000)
+
+    async def goto(self, page, url, wait_for=None):
+        if not self._is_configured:
+            raise RuntimeError("PlaywrightRequestHandler not configured yet. Call 'await handler.configure()' first.")
+        if self._shutdown_started:
+            raise RuntimeError("PlaywrightRequestHandler is shutting down, no new navigations are accepted")
+
+        recoveries = 0
+        while True:
             try:
-                logger.info(f"Navigating to {url}", extra={"tags": ["goto", "network"]})
-                await asyncio.wait_for(page.goto(url), 
-                                       timeout=30)
-                logger.info(f"Navigation to {url} succeeded", extra={"tags": ["goto", "network"]})
-                future.set_result(None)
+                return await self._queue_navigation(page, url, wait_for)
             except Exception as e:
+                # recovery runs in the caller's task, the scheduler never waits for a fresh page to be leased
+                if recoveries < self.max_recoveries and not self._shutdown_started and await self._recover(page, e):
+                    recoveries += 1
+                    self.recovered_navigations += 1
+                    logger.warning(f"Navigation to {url} interrupted by a crash, re-queued", extra={"tags": ["goto", "recover"], "url": url, "error": str(e)})
+                    continue
                 logger.error(
                     f"Failed to navigate to {url}",
                     exc_info=True,
@@ -270,20 +652,98 @@ class PlaywrightRequestHandler:
                         "error": str(e),
                     },
                 )
-                future.set_exception(e)
+                raise
+
+    async def _queue_navigation(self, page, url, wait_for):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending_navigations.add(future)
+        future.add_done_callback(self._pending_navigations.discard)
+        # playwright's own deadlines fire first, this only catches a page that stopped answering altogether
+        deadline = self.navigation_timeout + (self.action_timeout if wait_for else 0) + 5
+
+        async def coroutine():
+            try:
+                if self._rate_limiter is not None:
+                    await self._rate_limiter.acquire(url)
+                logger.info(f"Navigating to {url}", extra={"tags": ["goto", "network"]})
+                await asyncio.wait_for(self._navigate(page, url, wait_for), timeout=deadline)
+                logger.info(f"Navigation to {url} succeeded", extra={"tags": ["goto", "network"]})
+                self.browser_pool.record_navigation(page)
+                if not future.done():
+                    future.set_result(None)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
 
         self.queue.put_nowait(coroutine())
         return await future
 
-    async def shutdown(self):
+    async def _recover(self, page, error) -> bool:
+        if not isinstance(page, PooledPage) or not self._is_crash(page, error):
+            return False
+        try:
+            # a full pool can't keep the caller waiting for a fresh page longer than a navigation may take
+            await asyncio.wait_for(self.browser_pool.renew(page), timeout=self.navigation_timeout)
+            await self._prepare_page(page)
+        except Exception as e:
+            logger.error("Failed to replace crashed page", extra={"tags": ["goto", "recover"], "error": str(e)})
+            return False
+        return True
+
+    def _is_crash(self, page, error) -> bool:
+        if page.entry is None or not page.entry.browser.is_connected():
+            return True
+        return isinstance(error, PlaywrightError) and any(message in str(error).lower() for message in self.CRASH_MESSAGES)
+
+    async def _navigate(self, page, url, wait_for):
+        # waiting for the one element a scraper reads beats waiting for every script and tracker to load
+        await page.goto(url, wait_until=self.navigation_profile.wait_until)
+        if wait_for:
+            await page.wait_for_selector(wait_for, state='attached')
+
+    async def shutdown(self, drain_timeout: float = 10):
         if getattr(self, "_shutdown_started", False):
             return
         self._shutdown_started = True
         logger.info("Shutting down PlaywrightRequestHandler...", extra={"tags": ["shutdown"]})
 
-        if hasattr(self, "_scheduler_task"):
-            self._scheduler_task.cancel()
+        scheduler_task = getattr(self, "_scheduler_task", None)
+        on_this_loop = scheduler_task is not None and scheduler_task.get_loop() is asyncio.get_running_loop()
+
+        # navigations already queued get a chance to finish, new ones are refused by goto()
+        if on_this_loop and not scheduler_task.done() and getattr(self, "_pending_navigations", None):
             try:
-                await self._scheduler_task
+                await asyncio.wait_for(self.queue.join(), timeout=drain_timeout)
+                logger.debug("Navigation queue drained", extra={"tags": ["shutdown"]})
+            except asyncio.TimeoutError:
+                logger.warning(f"Navigation queue not drained after {drain_timeout}s", extra={"tags": ["shutdown"], "queued": self.queue.qsize()})
+
+        if on_this_loop:
+            scheduler_task.cancel()
+            try:
+                await scheduler_task
             except asyncio.CancelledError:
                 logger.debug("Playwright scheduler task cancelled", extra={"tags": ["shutdown"]})
+
+        self._abandon_queue()
+
+        if getattr(self, "browser_pool", None):
+            await self.browser_pool.close()
+            # a closed pool refuses leases, the next configure() starts a new one
+            self.browser_pool = None
+        self._is_configured = False
+        logger.info("PlaywrightRequestHandler shut down", extra={"tags": ["shutdown"]})
+
+    def _abandon_queue(self):
+        queue = getattr(self, "queue", None)
+        while queue is not None and not queue.empty():
+            queue.get_nowait().close()
+            queue.task_done()
+
+        pending = [future for future in getattr(self, "_pending_navigations", ()) if not future.done()]
+        for future in pending:
+            if not future.get_loop().is_closed():
+                future.set_exception(RuntimeError("PlaywrightRequestHandler shut down before the navigation finished"))
+        if pending:
+            logger.warning(f"Rejected {len(pending)} unfinished navigations", extra={"tags": ["shutdown"]})
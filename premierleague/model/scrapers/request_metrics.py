@@ -0,0 +1,144 @@
+import os, re, json, time, logging
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from pathlib import Path
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+class Histogram:
+    # upper bounds in seconds, the last bucket catches everything above them
+    DEFAULT_BOUNDS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+    def __init__(self, bounds: tuple[float, ...] = DEFAULT_BOUNDS):
+        self.bounds = tuple(bounds)
+        self.buckets = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, value: float):
+        self.buckets[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def quantile(self, fraction: float) -> float | None:
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for index, bucket in enumerate(self.buckets):
+            seen += bucket
+            if seen >= rank and bucket:
+                # the bucket's upper bound, clamped to what was actually observed
+                upper = self.bounds[index] if index < len(self.bounds) else self.max
+                return min(upper, self.max)
+        return self.max
+
+    def snapshot(self) -> dict:
+        labels = [f"le_{bound}" for bound in self.bounds] + ["le_inf"]
+        return {
+            "count": self.count,
+            "sum": round(self.total, 6),
+            "min": self.min,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "buckets": dict(zip(labels, self.buckets)),
+        }
+
+
+class RequestMetrics:
+    URL_PATTERNS = {
+        'club': re.compile(r'^/clubs(/|$)'),
+        'player': re.compile(r'^/players(/|$)'),
+        'match': re.compile(r'^/(match|matches|results|fixtures)(/|$)'),
+        'table': re.compile(r'^/tables(/|$)'),
+    }
+
+    def __init__(self):
+        self._gauges = dict()
+        self.reset()
+
+    def reset(self):
+        self.started_at = time.time()
+        self.requests = 0
+        self.latency_by_host = defaultdict(Histogram)
+        self.latency_by_pattern = defaultdict(Histogram)
+        self.network_time = Histogram()
+        self.queue_wait = Histogram()
+        self.bytes_by_host = Counter()
+        self.bytes_by_pattern = Counter()
+        self.status_counts = Counter()
+
+    @classmethod
+    def classify(cls, url: str) -> str:
+        path = urlsplit(url).path
+        for name, pattern in cls.URL_PATTERNS.items():
+            if pattern.match(path):
+                return name
+        return 'other'
+
+    def register_gauge(self, name: str, callback):
+        self._gauges[name] = callback
+
+    def observe_queue_wait(self, seconds: float):
+        self.queue_wait.observe(seconds)
+
+    def observe_response(self, url: str, latency: float | None = None, network_time: float | None = None,
+                         status: int | None = None, size: int = 0, error: BaseException | None = None):
+        host = urlsplit(url).netloc.lower()
+        pattern = self.classify(url)
+
+        self.requests += 1
+        if status is not None:
+            self.status_counts[str(status)] += 1
+        elif error is not None:
+            self.status_counts[f"error:{type(error).__name__}"] += 1
+        else:
+            self.status_counts['cancelled'] += 1
+
+        if latency is not None:
+            self.latency_by_host[host].observe(latency)
+            self.latency_by_pattern[pattern].observe(latency)
+        if network_time is not None:
+            self.network_time.observe(network_time)
+        if size:
+            self.bytes_by_host[host] += size
+            self.bytes_by_pattern[pattern] += size
+
+    def snapshot(self) -> dict:
+        gauges = dict()
+        for name, callback in self._gauges.items():
+            try:
+                gauges[name] = callback()
+            except Exception as e:
+                logger.warning(f"Gauge {name} failed", extra={"tags": ["metrics", "gauge"], "error": str(e)})
+                gauges[name] = None
+
+        return {
+            "started_at": self.started_at,
+            "taken_at": time.time(),
+            "requests": self.requests,
+            "status_counts": dict(self.status_counts),
+            "bytes_received": sum(self.bytes_by_host.values()),
+            "bytes_by_host": dict(self.bytes_by_host),
+            "bytes_by_pattern": dict(self.bytes_by_pattern),
+            "latency_by_host": {host: histogram.snapshot() for host, histogram in self.latency_by_host.items()},
+            "latency_by_pattern": {pattern: histogram.snapshot() for pattern, histogram in self.latency_by_pattern.items()},
+            "network_time": self.network_time.snapshot(),
+            "queue_wait": self.queue_wait.snapshot(),
+            "gauges": gauges,
+        }
+
+    def export(self, path) -> Path:
+        destination = Path(path)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = destination.with_name(destination.name + '.tmp')
+        temporary_path.write_text(json.dumps(self.snapshot(), indent=2, default=str))
+        os.replace(temporary_path, destination)
+        logger.info(f"Request metrics exported to {destination}", extra={"tags": ["metrics", "export"], "path": str(destination)})
+        return destination
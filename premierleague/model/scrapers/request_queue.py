@@ -0,0 +1,82 @@
+import asyncio, logging
+from collections import deque
+from contextvars import ContextVar
+
+logger = logging.getLogger(__name__)
+
+class Priority:
+    INTERACTIVE = 'interactive'
+    PAGE = 'page'
+    BULK = 'bulk'
+
+# lets a command mark every request made under it, e.g. the scrape command runs as INTERACTIVE
+request_priority: ContextVar[str | None] = ContextVar('request_priority', default=None)
+
+class PriorityRequestQueue:
+    DEFAULT_WEIGHTS = {
+        Priority.INTERACTIVE: 8,
+        Priority.PAGE: 3,
+        Priority.BULK: 1,
+    }
+
+    def __init__(self, weights: dict[str, int] | None = None):
+        self.weights = dict(weights or self.DEFAULT_WEIGHTS)
+        if any(weight < 1 for weight in self.weights.values()):
+            raise ValueError("priority weights must be positive integers")
+
+        self._queues = {priority: deque() for priority in self.weights}
+        self._credits = {priority: 0 for priority in self.weights}
+        self._not_empty = asyncio.Event()
+
+    def qsize(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    def sizes(self) -> dict[str, int]:
+        return {priority: len(queue) for priority, queue in self._queues.items()}
+
+    def empty(self) -> bool:
+        return self.qsize() == 0
+
+    def put_nowait(self, item):
+        priority = getattr(item, 'priority', Priority.PAGE)
+        if priority not in self._queues:
+            raise ValueError(f"unknown request priority: {priority}")
+        self._queues[priority].append(item)
+        self._not_empty.set()
+
+    def promote(self, item, priority):
+        if priority not in self._queues:
+            raise ValueError(f"unknown request priority: {priority}")
+        current = self._queues.get(getattr(item, 'priority', None))
+        if current is None or item not in current:
+            return False
+        current.remove(item)
+        item.priority = priority
+        self._queues[priority].append(item)
+        logger.debug(f"Queued request promoted to {priority}", extra={"tags": ["queue", "priority"], "priority": priority})
+        return True
+
+    def get_nowait(self):
+        candidates = [priority for priority, queue in self._queues.items() if queue]
+        if not candidates:
+            raise asyncio.QueueEmpty()
+
+        # smooth weighted round-robin: each class earns its weight, the richest class is served
+        # and pays back the total, so classes interleave in proportion to their weights
+        total = 0
+        for priority in candidates:
+            self._credits[priority] += self.weights[priority]
+            total += self.weights[priority]
+        selected = max(candidates, key=lambda priority: self._credits[priority])
+        self._credits[selected] -= total
+
+        item = self._queues[selected].popleft()
+        if self.empty():
+            self._not_empty.clear()
+        return item
+
+    async def get(self):
+        while self.empty():
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        return self.get_nowait()
@@ -0,0 +1,166 @@
+import os, time, sqlite3, hashlib, logging
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = str(Path(__file__).parent.parent / 'data' / 'http_cache')
+
+class ResponseCache:
+    SCHEMA = '''CREATE TABLE IF NOT EXISTS responses (
+        url TEXT PRIMARY KEY,
+        body_hash TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        encoding TEXT,
+        etag TEXT,
+        last_modified TEXT,
+        validated_at REAL NOT NULL,
+        accessed_at REAL NOT NULL
+    )'''
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, ttl: float = 30 * 24 * 3600,
+                 max_size: int = 512 * 1024 * 1024, fresh_for: float = 0):
+        self.directory = Path(directory)
+        self.ttl = ttl
+        self.max_size = max_size
+        self.fresh_for = fresh_for
+        self._connection = None
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            (self.directory / 'bodies').mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.directory / 'index.db')
+            self._connection.row_factory = sqlite3.Row
+            self._connection.execute(self.SCHEMA)
+            self._connection.commit()
+            logger.debug(f"Response cache opened at {self.directory}", extra={"tags": ["cache", "init"]})
+        return self._connection
+
+    def lookup(self, url: str) -> dict | None:
+        row = self.connection.execute('SELECT * FROM responses WHERE url = ?', (url,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+
+        entry = dict(row)
+        if time.time() - entry['validated_at'] > self.ttl or not self._body_path(entry['body_hash']).exists():
+            logger.debug(f"Dropping expired cache entry for {url}", extra={"tags": ["cache", "expired"], "url": url})
+            self._delete(url)
+            self.misses += 1
+            return None
+        return entry
+
+    def is_fresh(self, entry: dict) -> bool:
+        return time.time() - entry['validated_at'] < self.fresh_for
+
+    @staticmethod
+    def conditional_headers(entry: dict) -> dict[str, str]:
+        headers = dict()
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def read_body(self, entry: dict) -> bytes:
+        self.connection.execute('UPDATE responses SET accessed_at = ? WHERE url = ?', (time.time(), entry['url']))
+        self.connection.commit()
+        return self._body_path(entry['body_hash']).read_bytes()
+
+    def store(self, url: str, body: bytes, headers, encoding: str | None = None):
+        body_hash = hashlib.sha256(body).hexdigest()
+        body_path = self._body_path(body_hash)
+        if not body_path.exists():
+            body_path.parent.mkdir(parents=True, exist_ok=True)
+            temporary_path = body_path.with_suffix('.tmp')
+            temporary_path.write_bytes(body)
+            os.replace(temporary_path, body_path)
+
+        now = time.time()
+        self.connection.execute(
+            'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            (url, body_hash, len(body), encoding, headers.get('ETag'), headers.get('Last-Modified'), now, now)
+        )
+        self.connection.commit()
+        logger.debug(f"Response stored in cache: {url}", extra={"tags": ["cache", "store"], "url": url, "size": len(body)})
+        self.evict(sweep=False)
+
+    def mark_revalidated(self, url: str, headers):
+        now = time.time()
+        self.connection.execute(
+            'UPDATE responses SET validated_at = ?, accessed_at = ?, etag = COALESCE(?, etag), '
+            'last_modified = COALESCE(?, last_modified) WHERE url = ?',
+            (now, now, headers.get('ETag'), headers.get('Last-Modified'), url)
+        )
+        self.connection.commit()
+        self.revalidated += 1
+
+    def evict(self, sweep: bool = True):
+        now = time.time()
+        expired_hashes = {row[0] for row in self.connection.execute(
+            'SELECT DISTINCT body_hash FROM responses WHERE validated_at < ?', (now - self.ttl,)
+        )}
+        expired = self.connection.execute('DELETE FROM responses WHERE validated_at < ?', (now - self.ttl,)).rowcount
+        released = list(expired_hashes)
+
+        evicted = 0
+        total_size = self.size()
+        if total_size > self.max_size:
+            rows = self.connection.execute('SELECT url, body_hash, size FROM responses ORDER BY accessed_at').fetchall()
+            for row in rows:
+                if total_size <= self.max_size:
+                    break
+                self.connection.execute('DELETE FROM responses WHERE url = ?', (row['url'],))
+                evicted += 1
+                if not self._is_referenced(row['body_hash']):
+                    total_size -= row['size']
+                    released.append(row['body_hash'])
+
+        self.connection.commit()
+        for body_hash in released:
+            self._release_body(body_hash)
+        # store() evicts after every write and only needs the bodies it just released, an explicit call
+        # also sweeps files left behind by an interrupted run
+        if sweep:
+            self._remove_orphan_bodies()
+        if expired or evicted:
+            logger.info(f"Cache eviction removed {expired} expired and {evicted} least recently used entries",
+                        extra={"tags": ["cache", "evict"], "expired": expired, "evicted": evicted})
+
+    def size(self) -> int:
+        row = self.connection.execute(
+            'SELECT COALESCE(SUM(size), 0) FROM (SELECT DISTINCT body_hash, size FROM responses)'
+        ).fetchone()
+        return row[0]
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _delete(self, url: str):
+        row = self.connection.execute('SELECT body_hash FROM responses WHERE url = ?', (url,)).fetchone()
+        self.connection.execute('DELETE FROM responses WHERE url = ?', (url,))
+        self.connection.commit()
+        if row is not None:
+            self._release_body(row['body_hash'])
+
+    def _is_referenced(self, body_hash: str) -> bool:
+        return self.connection.execute('SELECT 1 FROM responses WHERE body_hash = ? LIMIT 1', (body_hash,)).fetchone() is not None
+
+    def _release_body(self, body_hash: str):
+        # a body shared by several urls stays until the last of them is gone
+        if not self._is_referenced(body_hash):
+            self._body_path(body_hash).unlink(missing_ok=True)
+
+    def _remove_orphan_bodies(self):
+        referenced = {row[0] for row in self.connection.execute('SELECT DISTINCT body_hash FROM responses')}
+        for body_path in (self.directory / 'bodies').glob('*/*'):
+            if body_path.name not in referenced:
+                body_path.unlink(missing_ok=True)
+
+    def _body_path(self, body_hash: str) -> Path:
+        return self.directory / 'bodies' / body_hash[:2] / body_hash
@@ -0,0 +1,60 @@
+import random, asyncio, aiohttp, time, logging
+from email.utils import parsedate_to_datetime
+
+logger = logging.getLogger(__name__)
+
+class RetryPolicy:
+    # status code -> maximum number of attempts, including the first one
+    DEFAULT_STATUS_RULES = {
+        429: 6,
+        500: 3,
+        502: 4,
+        503: 6,
+        504: 4,
+    }
+    RETRY_AFTER_STATUSES = (429, 503)
+    RETRYABLE_EXCEPTIONS = (aiohttp.ClientError, asyncio.TimeoutError, ConnectionError)
+
+    def __init__(self, max_attempts: int = 4, base_delay: float = 1.0, max_delay: float = 60.0,
+                 max_retry_after: float = 300.0, budget: int = 200, status_rules: dict[int, int] | None = None):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self.budget = budget
+        self.status_rules = dict(self.DEFAULT_STATUS_RULES if status_rules is None else status_rules)
+
+    def should_retry(self, attempt: int, status: int | None = None, exception: BaseException | None = None) -> bool:
+        if isinstance(exception, aiohttp.ClientResponseError):
+            # http errors are decided by their status code, not by the exception type
+            status, exception = exception.status, None
+        if exception is not None:
+            return isinstance(exception, self.RETRYABLE_EXCEPTIONS) and attempt < self.max_attempts
+        if status in self.status_rules:
+            return attempt < self.status_rules[status]
+        return False
+
+    def compute_delay(self, attempt: int, status: int | None = None, retry_after: str | None = None) -> float:
+        # full jitter: a random point between zero and the exponential ceiling
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        delay = random.uniform(0, ceiling)
+
+        if status in self.RETRY_AFTER_STATUSES and retry_after:
+            requested = self.parse_retry_after(retry_after)
+            if requested is not None:
+                delay = max(delay, min(requested, self.max_retry_after))
+        return delay
+
+    @staticmethod
+    def parse_retry_after(value: str) -> float | None:
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            logger.warning(f"Unparseable Retry-After header: {value}", extra={"tags": ["retry", "header"], "value": value})
+            return None
@@ -1,6 +1,7 @@
 import logging
-from bs4 import BeautifulSoup
 from model.scrapers.request_handler import RequestHandler
+from model.scrapers.parser_engine import ParserEngine
+from model.scrapers.patterns import Selectors
 from model.scrapers.interfaces.tables_data_scraper import ITablesDataScraper
 from model.scrapers.premierleague_website_scraper import PremierleagueWebsiteScraper
 from log_config.logger_configurer import configure_logger, resolve_class_module_name
@@ -10,6 +11,22 @@ logger = logging.getLogger(__name__)
 configure_logger(resolve_class_module_name(RequestHandler))
 
 class TablesDataScraper(PremierleagueWebsiteScraper, ITablesDataScraper):
+    TABLES_PAGE_REGIONS = ('league-table__tbody',)
+    ROW_SELECTOR = Selectors.compile('tbody.league-table__tbody.isPL tr:not(.league-table__expandable.expandable)')
+    POSITION_SELECTOR = Selectors.compile('td.league-table__pos.pos .league-table__value.value')
+    TEAM_NAME_SELECTOR = Selectors.compile('td.league-table__team.team .league-table__team-name--long')
+    POINTS_SELECTOR = Selectors.compile('td.league-table__points.points')
+    # the count columns carry no class of their own, only their position in the row
+    COLUMN_SELECTORS = {
+        'played': Selectors.compile('td:nth-child(3)'),
+        'won': Selectors.compile('td:nth-child(4)'),
+        'drawn': Selectors.compile('td:nth-child(5)'),
+        'lost': Selectors.compile('td:nth-child(6)'),
+        'goals_for': Selectors.compile('td:nth-child(7)'),
+        'goals_against': Selectors.compile('td:nth-child(8)'),
+        'goals_difference': Selectors.compile('td:nth-child(9)'),
+    }
+
     def __init__(self, url=None):
         super().__init__()
         if not url:
@@ -28,7 +45,7 @@ class TablesDataScraper(PremierleagueWebsiteScraper, ITablesDataScraper):
             logger.debug("RequestHandler configured", extra={"tags": ["request_handler"]})
 
             structure = await self._request_handler.get(self._base_url)
-            self._structure = BeautifulSoup(structure, 'html.parser')
+            self._structure = ParserEngine.parse(structure, regions=self.TABLES_PAGE_REGIONS)
             self._initialized = True
             logger.info("TablesDataScraper initialized successfully", extra={"tags": ["init"]})
         except Exception as e:
@@ -42,7 +59,7 @@ class TablesDataScraper(PremierleagueWebsiteScraper, ITablesDataScraper):
 
         logger.info("Extracting table data from page structure", extra={"tags": ["scraping", "tables"]})
         try:
-            table_rows = self._structure.select('tbody.league-table__tbody.isPL tr:not(.league-table__expandable.expandable)')
+            table_rows = self._structure.select(self.ROW_SELECTOR)
             logger.debug(f"Found {len(table_rows)} table rows in Premier League table", extra={"tags": ["scraping", "tables"]})
 
             standings = []
@@ -64,16 +81,11 @@ class TablesDataScraper(PremierleagueWebsiteScraper, ITablesDataScraper):
     async def _extract_data_from_tr_tag(self, table_row):
         result = {}
         try:
-            result['position'] = int(table_row.select_one('td.league-table__pos.pos .league-table__value.value').get_text(strip=True))
-            result['team_name'] = table_row.select_one('td.league-table__team.team .league-table__team-name--long').get_text(strip=True).lower()
-            result['played'] = int(table_row.select_one('td:nth-child(3)').get_text(strip=True))
-            result['won'] = int(table_row.select_one('td:nth-child(4)').get_text(strip=True))
-            result['drawn'] = int(table_row.select_one('td:nth-child(5)').get_text(strip=True))
-            result['lost'] = int(table_row.select_one('td:nth-child(6)').get_text(strip=True))
-            result['goals_for'] = int(table_row.select_one('td:nth-child(7)').get_text(strip=True))
-            result['goals_against'] = int(table_row.select_one('td:nth-child(8)').get_text(strip=True))
-            result['goals_difference'] = int(table_row.select_one('td:nth-child(9)').get_text(strip=True))
-            result['points'] = int(table_row.select_one('td.league-table__points.points').get_text(strip=True))
+            result['position'] = int(table_row.select_one(self.POSITION_SELECTOR).get_text(strip=True))
+            result['team_name'] = table_row.select_one(self.TEAM_NAME_SELECTOR).get_text(strip=True).lower()
+            for column, selector in self.COLUMN_SELECTORS.items():
+                result[column] = int(table_row.select_one(selector).get_text(strip=True))
+            result['points'] = int(table_row.select_one(self.POINTS_SELECTOR).get_text(strip=True))
             return result
         except Exception as e:
             logger.exception("Error parsing table row", extra={"tags": ["row_parsing", "error"], "error": str(e)})
@@ -0,0 +1,189 @@
+import os, json, random, asyncio, aiohttp, hashlib, logging, time
+from pathlib import Path
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ARCHIVE_DIR = str(Path(__file__).parent.parent / 'data' / 'http_archive')
+
+class ResponseArchive:
+    # bodies are stored decoded, so the transfer headers of the original response no longer apply
+    DROPPED_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding')
+
+    def __init__(self, directory: str = DEFAULT_ARCHIVE_DIR):
+        self.directory = Path(directory)
+
+    @staticmethod
+    def key(url: str) -> str:
+        return hashlib.sha256(url.encode()).hexdigest()
+
+    def save(self, url: str, status: int, headers, body: bytes, encoding: str | None = None):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        key = self.key(url)
+        entry = {
+            "url": url,
+            "status": status,
+            "headers": [(name, value) for name, value in headers.items() if name.lower() not in self.DROPPED_HEADERS],
+            "encoding": encoding,
+            "recorded_at": time.time(),
+        }
+        self._write(self.directory / f"{key}.body", body)
+        self._write(self.directory / f"{key}.json", json.dumps(entry, indent=2).encode())
+        logger.debug(f"Response recorded: {url}", extra={"tags": ["transport", "record"], "url": url, "status": status, "size": len(body)})
+
+    def load(self, url: str) -> tuple[dict, bytes] | None:
+        key = self.key(url)
+        try:
+            entry = json.loads((self.directory / f"{key}.json").read_text())
+            body = (self.directory / f"{key}.body").read_bytes()
+        except FileNotFoundError:
+            return None
+        return entry, body
+
+    def urls(self) -> list[str]:
+        return sorted(json.loads(path.read_text())["url"] for path in self.directory.glob('*.json'))
+
+    @staticmethod
+    def _write(path: Path, data: bytes):
+        temporary_path = path.with_name(path.name + '.tmp')
+        temporary_path.write_bytes(data)
+        os.replace(temporary_path, path)
+
+
+class ArchivedContent:
+    def __init__(self, body: bytes):
+        self._body = body
+
+    async def iter_chunked(self, chunk_size: int):
+        for start in range(0, len(self._body), chunk_size):
+            yield self._body[start:start + chunk_size]
+
+    async def read(self) -> bytes:
+        return self._body
+
+
+class ArchivedResponse:
+    def __init__(self, url: str, status: int, headers, body: bytes, encoding: str | None = None):
+        self.url = URL(url)
+        self.status = status
+        self.headers = CIMultiDictProxy(CIMultiDict(headers))
+        self.content = ArchivedContent(body)
+        self.content_length = len(body)
+        self._body = body
+        self._encoding = encoding
+
+    async def read(self) -> bytes:
+        return self._body
+
+    def get_encoding(self) -> str:
+        return self._encoding or 'utf-8'
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            request_info = aiohttp.RequestInfo(self.url, 'GET', CIMultiDictProxy(CIMultiDict()), self.url)
+            raise aiohttp.ClientResponseError(request_info, (), status=self.status, message=f"archived status {self.status}")
+
+
+class _ArchivedRequest:
+    def __init__(self, load):
+        self._load = load
+
+    async def __aenter__(self):
+        return await self._load()
+
+    async def __aexit__(self, *args):
+        return None
+
+
+class LiveTransport:
+    rate_limited = True
+
+    def create_session(self, connection_pool):
+        return connection_pool.create_session()
+
+
+class RecordingSession:
+    # a 304 has no body to archive, so validators from the response cache never reach the site while recording
+    CONDITIONAL_HEADERS = ('if-none-match', 'if-modified-since')
+
+    def __init__(self, session: aiohttp.ClientSession, archive: ResponseArchive):
+        self._session = session
+        self._archive = archive
+
+    @property
+    def closed(self) -> bool:
+        return self._session.closed
+
+    def get(self, url, headers=None, **kwargs):
+        headers = {name: value for name, value in (headers or {}).items() if name.lower() not in self.CONDITIONAL_HEADERS}
+
+        async def load():
+            async with self._session.get(url, headers=headers, **kwargs) as response:
+                # the whole body is read so it can be archived, streaming callers get it back in chunks
+                body = await response.read()
+                encoding = response.get_encoding()
+                self._archive.save(url, response.status, response.headers, body, encoding)
+                return ArchivedResponse(url, response.status, response.headers.items(), body, encoding)
+        return _ArchivedRequest(load)
+
+    async def close(self):
+        await self._session.close()
+
+
+class RecordingTransport:
+    rate_limited = True
+
+    def __init__(self, archive: ResponseArchive | None = None):
+        self.archive = archive or ResponseArchive()
+
+    def create_session(self, connection_pool):
+        logger.info(f"Recording responses to {self.archive.directory}", extra={"tags": ["transport", "record"]})
+        return RecordingSession(connection_pool.create_session(), self.archive)
+
+
+class ReplaySession:
+    def __init__(self, transport):
+        self._transport = transport
+        self.closed = False
+
+    def get(self, url, **kwargs):
+        return _ArchivedRequest(lambda: self._transport.replay(url))
+
+    async def close(self):
+        self.closed = True
+
+
+class ReplayTransport:
+    # nothing goes over the network, the simulated latency is the only pacing an offline run needs
+    rate_limited = False
+
+    def __init__(self, archive: ResponseArchive | None = None, latency: float = 0.0, jitter: float = 0.0, missing_status: int = 404):
+        if latency < 0 or jitter < 0:
+            raise ValueError("latency and jitter can't be negative")
+
+        self.archive = archive or ResponseArchive()
+        self.latency = latency
+        self.jitter = jitter
+        self.missing_status = missing_status
+        self.served = 0
+        self.missing = 0
+
+    def create_session(self, connection_pool):
+        logger.info(f"Replaying responses from {self.archive.directory}", extra={"tags": ["transport", "replay"], "latency": self.latency})
+        return ReplaySession(self)
+
+    async def replay(self, url: str) -> ArchivedResponse:
+        delay = self.latency + random.uniform(0, self.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+
+        archived = self.archive.load(url)
+        if archived is None:
+            self.missing += 1
+            logger.warning(f"No archived response for {url}", extra={"tags": ["transport", "replay"], "url": url})
+            return ArchivedResponse(url, self.missing_status, [], b'')
+
+        self.served += 1
+        entry, body = archived
+        return ArchivedResponse(url, entry["status"], entry["headers"], body, entry["encoding"])
@@ -0,0 +1,74 @@
+# Per-call cost of the precompiled regex and selector registry against the inline patterns it replaced.
+# Run from the project root: python -m tests.benchmarks.bench_patterns [batch_size]
+import re
+import sys
+import time
+from bs4 import BeautifulSoup
+from model.scrapers.utils import UrlValidator
+from model.scrapers.patterns import Patterns
+from model.scrapers.tables_data_scraper import TablesDataScraper
+
+INLINE_URL_PATTERNS = (
+    r"^https:\/\/www\.premierleague\.com\/clubs\/\d+\/[A-Za-z\-]+\/squad\?se=\d+$",
+    r"^https:\/\/www\.premierleague\.com\/clubs\/\d+\/[A-Za-z\-]+\/overview$",
+    r"^https:\/\/www\.premierleague\.com\/match\/\d+$",
+    r"^https:\/\/www\.premierleague\.com\/players\/\d+\/[^\/]+\/overview$",
+)
+
+TABLE_ROW = '<table><tbody class="league-table__tbody isPL"><tr>' + ''.join(f'<td>{i}</td>' for i in range(1, 12)) + '</tr></tbody></table>'
+
+def make_urls(batch_size: int) -> list[str]:
+    shapes = (
+        "https://www.premierleague.com/clubs/{id}/Arsenal/overview",
+        "https://www.premierleague.com/clubs/{id}/Arsenal/squad?se=719",
+        "https://www.premierleague.com/match/{id}",
+        "https://www.premierleague.com/players/{id}/Declan-Rice/overview",
+        "https://www.premierleague.com/matchweek/{id}/blog",
+    )
+    return [shapes[i % len(shapes)].format(id=i) for i in range(batch_size)]
+
+def best_of(function, repeat: int = 3) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+def run(batch_size: int = 10_000) -> dict:
+    urls = make_urls(batch_size)
+    row = BeautifulSoup(TABLE_ROW, 'html.parser').select_one('tr')
+    column = TablesDataScraper.COLUMN_SELECTORS['played']
+
+    cases = {
+        'validate': (
+            lambda: [[re.match(pattern, url) for pattern in INLINE_URL_PATTERNS] for url in urls],
+            lambda: [(UrlValidator.validate_squad_page_url(url), UrlValidator.validate_club_page_url(url),
+                      UrlValidator.validate_match_page_url(url), UrlValidator.validate_player_page_url(url)) for url in urls],
+        ),
+        'extract_ids': (
+            lambda: [(re.search(r'/clubs/(\d+)(?:/|$)', url), re.search(r'/matchweek/(\d+)', url), re.search(r'\d+', url)) for url in urls],
+            lambda: [(Patterns.CLUB_ID.search(url), Patterns.MATCHWEEK_ID.search(url), Patterns.NUMBER.search(url)) for url in urls],
+        ),
+        'select_cell': (
+            lambda: [row.select_one('td:nth-child(3)') for _ in urls],
+            lambda: [row.select_one(column) for _ in urls],
+        ),
+    }
+
+    results = dict()
+    for name, (inline, precompiled) in cases.items():
+        inline_ns = best_of(inline) / batch_size * 1e9
+        precompiled_ns = best_of(precompiled) / batch_size * 1e9
+        results[name] = {
+            'inline_ns': round(inline_ns, 1),
+            'precompiled_ns': round(precompiled_ns, 1),
+            'saving_ns': round(inline_ns - precompiled_ns, 1),
+        }
+    return results
+
+if __name__ == '__main__':
+    batch_size = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    print(f"{batch_size} urls, nanoseconds per url")
+    for name, result in run(batch_size).items():
+        print(f"{name:<12} inline {result['inline_ns']:>10.1f}   precompiled {result['precompiled_ns']:>10.1f}   saved {result['saving_ns']:>10.1f}")
@@ -0,0 +1,46 @@
+import pytest
+import asyncio
+from controller.admin_controller import TerminalInterface
+from controller.async_runtime import AsyncRuntime, run_coroutine
+from controller.commands import ICommand
+from model.scrapers.request_handler import RequestHandler, QueuedRequest
+from model.scrapers.retry_policy import RetryPolicy
+
+@pytest.fixture
+def interface():
+    AsyncRuntime.reset()
+    RequestHandler.reset()
+    interface = TerminalInterface()
+    interface.runtime.start()
+    yield interface
+    interface.runtime.stop()
+    AsyncRuntime.reset()
+    RequestHandler.reset()
+
+class RetryingCommand(ICommand):
+    base_name = 'retrying'
+    description = 'asks the request handler for one retry'
+    granted = []
+
+    def execute_command(self):
+        async def coro():
+            handler = RequestHandler()
+            await handler.configure(response_cache=False, retry_policy=RetryPolicy(budget=1))
+            request = QueuedRequest("https://www.premierleague.com/tables", asyncio.get_running_loop().create_future())
+
+            async def fetch(attempt):
+                pass
+
+            self.granted.append(handler._schedule_retry(request, fetch, 1, status=503))
+            request.future.cancel()
+        run_coroutine(coro())
+
+def test_each_command_gets_a_fresh_retry_budget(interface):
+    RetryingCommand.granted = []
+    interface.commands = {RetryingCommand.base_name: RetryingCommand}
+
+    interface.process_command('retrying')
+    interface.process_command('retrying')
+
+    # one runtime, one handler, and still the second command isn't starved by the first one's retries
+    assert RetryingCommand.granted == [True, True]
@@ -0,0 +1,125 @@
+import pytest
+import asyncio
+import threading
+from contextvars import ContextVar
+from controller.async_runtime import AsyncRuntime, run_coroutine
+
+@pytest.fixture
+def runtime():
+    AsyncRuntime.reset()
+    runtime = AsyncRuntime()
+    yield runtime
+    runtime.stop()
+    AsyncRuntime.reset()
+
+def test_runtime_is_a_singleton(runtime):
+    assert AsyncRuntime() is runtime
+
+def test_run_falls_back_to_asyncio_run_when_not_started(runtime):
+    async def answer():
+        return threading.current_thread()
+
+    assert run_coroutine(answer()) is threading.current_thread()
+
+def test_started_runtime_reuses_one_loop_across_calls(runtime):
+    runtime.start()
+
+    async def current_loop():
+        return asyncio.get_running_loop()
+
+    first = run_coroutine(current_loop())
+    second = run_coroutine(current_loop())
+
+    assert first is second is runtime.loop
+    assert runtime.is_running
+
+def test_background_tasks_survive_between_calls(runtime):
+    runtime.start()
+
+    async def start_background():
+        return asyncio.create_task(asyncio.sleep(60))
+
+    async def is_pending(task):
+        return not task.done()
+
+    task = run_coroutine(start_background())
+    assert run_coroutine(is_pending(task))
+
+def test_run_propagates_exceptions(runtime):
+    runtime.start()
+
+    async def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        run_coroutine(fail())
+
+def test_run_carries_context_variables(runtime):
+    runtime.start()
+    variable = ContextVar('variable', default='unset')
+
+    async def read():
+        return variable.get()
+
+    token = variable.set('set by caller')
+    try:
+        assert run_coroutine(read()) == 'set by caller'
+    finally:
+        variable.reset(token)
+
+def test_run_timeout_cancels_the_coroutine(runtime):
+    runtime.start()
+    cancelled = threading.Event()
+
+    async def hang():
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(TimeoutError):
+        run_coroutine(hang(), timeout=0.05)
+    assert cancelled.wait(1)
+
+def test_stop_runs_shutdown_callbacks_and_cancels_tasks(runtime):
+    calls = []
+
+    async def callback():
+        calls.append(asyncio.get_running_loop())
+
+    runtime.add_shutdown_callback(callback)
+    runtime.start()
+    loop = runtime.loop
+
+    async def start_background():
+        return asyncio.create_task(asyncio.sleep(60))
+
+    task = run_coroutine(start_background())
+    runtime.stop()
+
+    assert calls == [loop]
+    assert task.cancelled()
+    assert not runtime.is_running
+    assert loop.is_closed()
+
+def test_request_handler_keeps_its_session_across_commands(runtime):
+    from model.scrapers.request_handler import RequestHandler
+
+    RequestHandler.reset()
+    runtime.start()
+
+    async def configure():
+        handler = RequestHandler()
+        await handler.configure(response_cache=False)
+        return handler.session
+
+    try:
+        # configured off the main thread, so it must not try to install signal handlers
+        first = run_coroutine(configure())
+        second = run_coroutine(configure())
+        assert first is second
+        assert not first.closed
+    finally:
+        run_coroutine(RequestHandler().shutdown())
+        RequestHandler.reset()
@@ -0,0 +1,384 @@
+import pytest
+import asyncio
+import threading
+from unittest.mock import patch, MagicMock, AsyncMock
+from model.scrapers.browser_pool import BrowserPool, PooledPage
+
+class FakePage:
+    def __init__(self, context):
+        self.context = context
+        self.listeners = []
+
+    def on(self, event, handler):
+        self.listeners.append((event, handler))
+
+class FakeContext:
+    def __init__(self):
+        self.closed = False
+
+    async def new_page(self):
+        return FakePage(self)
+
+    async def close(self):
+        self.closed = True
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+        self.closed = False
+        self.connected = True
+        self.handlers = {}
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    def is_connected(self):
+        return self.connected and not self.closed
+
+    async def new_context(self, **kwargs):
+        context = FakeContext()
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.closed = True
+
+@pytest.fixture
+def playwright():
+    fake = MagicMock()
+    fake.chromium.launch = AsyncMock(side_effect=lambda **kwargs: FakeBrowser())
+    fake.stop = AsyncMock()
+    with patch("model.scrapers.browser_pool.async_playwright") as mock_async_playwright:
+        mock_async_playwright.return_value.start = AsyncMock(return_value=fake)
+        yield fake
+
+@pytest.mark.parametrize("kwargs", [{"max_browsers": 0}, {"pages_per_browser": 0}, {"max_navigations": 0}, {"memory_budget": 0}])
+def test_pool_rejects_invalid_parameters(kwargs):
+    with pytest.raises(ValueError):
+        BrowserPool(**kwargs)
+
+@pytest.mark.asyncio
+async def test_pool_reuses_a_warm_browser(playwright):
+    pool = BrowserPool()
+
+    async with pool.page():
+        pass
+    async with pool.page():
+        pass
+
+    assert playwright.chromium.launch.await_count == 1
+    assert pool.snapshot()["browsers"] == 1
+    await pool.close()
+
+@pytest.mark.asyncio
+async def test_each_lease_gets_its_own_context_closed_on_exit(playwright):
+    pool = BrowserPool()
+
+    async with pool.page() as first:
+        async with pool.page() as second:
+            assert first is not second
+    browser = pool._browsers[0].browser
+
+    assert len(browser.contexts) == 2
+    assert all(context.closed for context in browser.contexts)
+    await pool.close()
+
+@pytest.mark.asyncio
+async def test_pool_launches_up_to_max_browsers_then_waits(playwright):
+    pool = BrowserPool(max_browsers=2, pages_per_browser=1)
+    release = asyncio.Event()
+    entered = []
+
+    async def lease(index):
+        async with pool.page():
+            entered.append(index)
+            await release.wait()
+
+    tasks = [asyncio.create_task(lease(index)) for index in range(3)]
+    await asyncio.sleep(0.05)
+
+    assert entered == [0, 1]
+    assert playwright.chromium.launch.await_count == 2
+
+    release.set()
+    await asyncio.wait_for(asyncio.gather(*tasks), timeout=1)
+    assert entered == [0, 1, 2]
+    await pool.close()
+
+@pytest.mark.asyncio
+async def test_slow_launch_does_not_hold_up_the_rest_of_the_pool(playwright):
+    pool = BrowserPool(max_browsers=2, pages_per_browser=1)
+    launching, finish_launch = asyncio.Event(), asyncio.Event()
+    launches = 0
+
+    async def launch(**kwargs):
+        nonlocal launches
+        launches += 1
+        if launches == 2:
+            launching.set()
+            await finish_launch.wait()
+        return FakeBrowser()
+
+    playwright.chromium.launch = AsyncMock(side_effect=launch)
+    first = await pool._lease()
+    second = asyncio.create_task(pool._lease())
+    await asyncio.wait_for(launching.wait(), timeout=1)
+
+    # the first page goes back and a third lease takes it while the second browser is still starting
+    await asyncio.wait_for(pool._return(first), timeout=1)
+    third = await asyncio.wait_for(pool._lease(), timeout=1)
+    assert third.entry is first.entry
+
+    finish_launch.set()
+    second = await asyncio.wait_for(second, timeout=1)
+    assert second.entry is not first.entry
+    assert pool.snapshot()["browsers"] == 2
+    await pool.close()
+
+@pytest.mark.asyncio
+async def test_failed_launch_gives_its_slot_back(playwright):
+    pool = BrowserPool(max_browsers=1, pages_per_browser=1)
+    playwright.chromium.launch = AsyncMock(side_effect=[RuntimeError("chromium missing"), FakeBrowser()])
+
+    with pytest.raises(RuntimeError):
+        await pool._lease()
+    leased = await asyncio.wait_for(pool._lease(), timeout=1)
+
+    assert pool._launching == 0
+    assert pool._browsers == [leased.entry]
+    await pool.close()
+
+@pytest.mark.asyncio
+async def test_browser_is_recycled_after_max_navigations(playwright):
+    pool = BrowserPool(max_navigations=2)
+
+    async with pool.page() as page:
+        pool.record_navigation(page)
+        pool.record_navigation(page)
+        retired = pool._browsers[0].browser
+
+    assert retired.closed
+    assert pool.recycled == 1
+
+    async with pool.page():
+        pass
+    assert playwright.chromium.launch.await_count == 2
+    await pool.close()
+
+@pytest.mark.asyncio
+async def test_reap_idle_closes_unused_browsers(playwright):
+    pool = BrowserPool(idle_timeout=0)
+
+    async with pool.page():
+        pass
+    browser = pool._browsers[0].browser
+    await pool.reap_idle()
+
+    assert browser.closed
+    assert pool.snapshot()["browsers"] == 0
+    assert pool.reaped == 1
+    await pool.close()
+
+@pytest.mark.asyncio
+async def test_reap_idle_keeps_leased_browsers(playwright):
+    pool = BrowserPool(idle_timeout=0)
+
+    async with pool.page():
+        await pool.reap_idle()
+        assert pool.snapshot()["browsers"] == 1
+    await pool.close()
+
+@pytest.mark.asyncio
+async def test_reaping_a_crashed_browser_wakes_waiting_leases(playwright):
+    pool = BrowserPool(max_browsers=1, pages_per_browser=1)
+    async with pool.page():
+        crashed = pool._browsers[0].browser
+        waiter = asyncio.create_task(pool._acquire())
+        await asyncio.sleep(0)
+    crashed.connected = False
+    # the release already went by, the waiter is asleep on the full pool
+    await asyncio.sleep(0.05)
+    assert not waiter.done()
+
+    await pool.reap_idle()
+
+    entry = await asyncio.wait_for(waiter, timeout=1)
+    assert entry.browser is not crashed
+    await pool._release(entry)
+    await pool.close()
+
+@pytest.mark.asyncio
+async def test_disconnect_frees_the_slot_of_a_leased_browser(playwright):
+    pool = BrowserPool(max_browsers=1, pages_per_browser=1)
+    async with pool.page() as page:
+        crashed = page.entry.browser
+        waiter = asyncio.create_task(pool._acquire())
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+
+        crashed.connected = False
+        crashed.handlers["disconnected"](crashed)
+
+        # the waiter gets a new browser while the crashed one still has its page leased
+        entry = await asyncio.wait_for(waiter, timeout=1)
+        assert entry.browser is not crashed
+        assert not crashed.closed
+
+    assert crashed.closed
+    await pool._release(entry)
+    await pool.close()
+
+@pytest.mark.asyncio
+async def test_crashed_browser_is_replaced(playwright):
+    pool = BrowserPool()
+
+    async with pool.page():
+        crashed = pool._browsers[0].browser
+        crashed.connected = False
+
+    async with pool.page():
+        assert pool._browsers[0].browser is not crashed
+    await pool.close()
+
+@pytest.mark.asyncio
+async def test_close_stops_playwright_and_rejects_new_leases(playwright):
+    pool = BrowserPool()
+    async with pool.page():
+        pass
+
+    await pool.close()
+
+    playwright.stop.assert_awaited_once()
+    with pytest.raises(RuntimeError):
+        async with pool.page():
+            pass
+
+@pytest.mark.asyncio
+async def test_browsers_are_launched_with_a_process_marker(playwright):
+    pool = BrowserPool(launch_options={"headless": True, "args": ["--disable-gpu"]})
+
+    async with pool.page() as page:
+        assert isinstance(page, PooledPage)
+
+    options = playwright.chromium.launch.await_args.kwargs
+    assert options["headless"] is True
+    assert options["args"][0] == "--disable-gpu"
+    assert options["args"][1] == pool._browsers[0].marker
+    assert options["args"][1].startswith(BrowserPool.MARKER_SWITCH + "=")
+    await pool.close()
+
+@pytest.mark.asyncio
+async def test_renew_moves_the_lease_to_a_fresh_page_and_keeps_listeners(playwright):
+    pool = BrowserPool()
+    listener = MagicMock()
+
+    async with pool.page() as page:
+        page.on("response", listener)
+        crashed_page = page.page
+        crashed = page.entry.browser
+        crashed.connected = False
+
+        await pool.renew(page)
+
+        assert page.page is not crashed_page
+        assert page.entry.browser is not crashed
+        assert page.page.listeners == [("response", listener)]
+        assert crashed_page.context.closed
+
+    assert crashed.closed
+    assert pool.renewed == 1
+    assert pool.snapshot()["leased_pages"] == 0
+    await pool.close()
+
+@pytest.mark.asyncio
+async def test_renewal_cut_short_does_not_release_the_lease_twice(playwright):
+    pool = BrowserPool(max_browsers=1, pages_per_browser=1)
+
+    async def full():
+        await asyncio.Event().wait()
+
+    async with pool.page() as page:
+        entry = page.entry
+        with patch.object(pool, "_acquire", side_effect=full):
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(pool.renew(page), timeout=0.05)
+        assert page.entry is None
+
+    assert entry.leases == 0
+    await pool.close()
+
+@pytest.mark.asyncio
+async def test_unexpected_disconnect_counts_as_crash(playwright):
+    pool = BrowserPool()
+    async with pool.page():
+        pass
+    browser = pool._browsers[0].browser
+
+    browser.handlers["disconnected"](browser)
+    await pool.close()
+    browser.handlers["disconnected"](browser)
+
+    assert pool.crashed == 1
+
+@pytest.mark.asyncio
+async def test_memory_check_restarts_idle_browser_over_budget(playwright):
+    pool = BrowserPool(memory_budget=100)
+    async with pool.page():
+        pass
+    entry = pool._browsers[0]
+
+    with patch.object(entry, "rss", return_value=150 * 1024 * 1024):
+        await pool.check_memory()
+
+    assert entry.browser.closed
+    assert pool.memory_restarts == 1
+    assert pool.snapshot()["browsers"] == 0
+    await pool.close()
+
+@pytest.mark.asyncio
+async def test_memory_check_lets_leased_pages_finish_below_hard_limit(playwright):
+    pool = BrowserPool(memory_budget=100)
+
+    async with pool.page() as page:
+        entry = page.entry
+        with patch.object(entry, "rss", return_value=120 * 1024 * 1024):
+            await pool.check_memory()
+        assert entry.retiring and not entry.browser.closed
+
+        with patch.object(entry, "rss", return_value=160 * 1024 * 1024):
+            await pool.check_memory()
+        assert entry.browser.closed
+
+    assert pool.memory_restarts == 1
+    await pool.close()
+
+@pytest.mark.asyncio
+async def test_memory_is_measured_off_the_loop_without_the_condition(playwright):
+    pool = BrowserPool(memory_budget=100)
+    async with pool.page():
+        pass
+    entry = pool._browsers[0]
+    seen = []
+
+    def rss():
+        seen.append((threading.get_ident(), pool._condition.locked()))
+        return 150 * 1024 * 1024
+
+    with patch.object(entry, "rss", side_effect=rss):
+        await pool.check_memory()
+
+    [(thread, locked)] = seen
+    assert thread != threading.get_ident() and not locked
+    assert entry.browser.closed
+    await pool.close()
+
+@pytest.mark.asyncio
+async def test_memory_check_ignores_browsers_without_a_process(playwright):
+    pool = BrowserPool(memory_budget=100)
+    async with pool.page():
+        pass
+
+    await pool.check_memory()
+
+    assert pool.snapshot()["browsers"] == 1
+    await pool.close()
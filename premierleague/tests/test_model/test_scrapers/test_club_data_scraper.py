@@ -4,6 +4,16 @@ from unittest.mock import patch, AsyncMock, MagicMock
 from tests.utils import load_fixture
 from model.scrapers.club_data_scraper import ClubDataScraper
 from model.scrapers.request_handler import RequestHandler
+from model.scrapers.parse_executor import ParseExecutor
+from model.scrapers.request_queue import Priority
+
+@pytest.fixture(autouse=True)
+def parse_inline():
+    # the parse pool would have to pickle the patched parser, parsing on the loop keeps the mocks in this process
+    ParseExecutor.reset()
+    ParseExecutor().configure(workers=0)
+    yield
+    ParseExecutor.reset()
 
 @pytest.fixture
 def main_page_html():
@@ -54,15 +64,9 @@ async def test_initialize_sets_correct_state_and_mocks_side_effects():
 
             # Assert - state changes
             assert scraper._initialized is True, "Scraper should be initialized after calling initialize()"
-            assert isinstance(scraper._structures, dict), "Structures should be a dictionary"
-            assert 'main_page' in scraper._structures, "'main_page' key missing in structures"
-            assert 'directory_page' in scraper._structures, "'directory_page' key missing in structures"
-            assert isinstance(scraper._structures['main_page'], BeautifulSoup), "main_page structure should be a BeautifulSoup object"
-            assert isinstance(scraper._structures['directory_page'], BeautifulSoup), "directory_page structure should be a BeautifulSoup object"
-
-            # Confirm correct HTML structure parsing (reverse-loaded for testing)
-            assert scraper._structures['main_page'].select_one('span').text == 'Manager', "Expected 'Manager' in main_page span"
-            assert scraper._structures['directory_page'].select_one('h2').text == 'Fake Club', "Expected 'Fake Club' in directory_page h2"
+            assert isinstance(scraper._page, dict), "Extracted page should be a plain dictionary"
+            assert set(scraper._page) == {'club_name', 'establishment_year', 'manager_name', 'city', 'stadium', 'logo_url', 'squad_page_path'}
+            assert ParseExecutor().submitted == 1, "Both pages should be extracted in a single executor call"
 
 
 @pytest.mark.asyncio
@@ -141,7 +145,8 @@ def setup_scraper_with_html(html: str, page: str = "main_page"):
     with patch('model.scrapers.utils.UrlValidator.validate_club_page_url', return_value=True):
         scraper = ClubDataScraper("https://...")
         scraper._initialized = True
-        scraper._structures = {page: BeautifulSoup(html, "html.parser")}
+        schema = {'main_page': ClubDataScraper.MAIN_PAGE_SCHEMA, 'directory_page': ClubDataScraper.DIRECTORY_PAGE_SCHEMA}[page]
+        scraper._page = schema.extract(BeautifulSoup(html, "html.parser"))
         return scraper
 
 @pytest.mark.asyncio
@@ -213,7 +218,7 @@ async def test_get_club_logo_returns_image_bytes(main_page_html):
 
     with patch.object(handler, "get", new_callable=AsyncMock) as mock_get:
 
-        mock_get.return_value.content = fake_bytes
+        mock_get.return_value = fake_bytes
         scraper._request_handler = handler
 
         # Act
@@ -221,6 +226,12 @@ async def test_get_club_logo_returns_image_bytes(main_page_html):
 
         # Assert
         assert result == fake_bytes, f"Expected logo bytes {fake_bytes}, but got {result}"
-        mock_get.assert_awaited_once_with('https://resources.premierleague.com/premierleague/badges/t3.png'), "Expected one call to request_handler.get() with the 'https://resources.premierleague.com/premierleague/badges/t3.png' url for logo"
+        mock_get.assert_awaited_once_with('https://resources.premierleague.com/premierleague/badges/t3.png', raw=True, priority=Priority.BULK, max_size=ClubDataScraper.MAX_LOGO_SIZE), "Expected one call to request_handler.get() with the 'https://resources.premierleague.com/premierleague/badges/t3.png' url for logo"
 
         assert scraper.club_data.get("logo") == fake_bytes, "Logo bytes were not cached correctly in club_data"
+
+def test_missing_field_raises_value_error():
+    scraper = setup_scraper_with_html('<html><body></body></html>')
+
+    with pytest.raises(ValueError, match="club_name"):
+        scraper._read('club_name')
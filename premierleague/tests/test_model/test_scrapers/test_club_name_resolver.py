@@ -0,0 +1,57 @@
+import pytest
+from unittest.mock import MagicMock
+from model.scrapers.club_name_resolver import ClubNameResolver
+
+ARSENAL_URL = "https://www.premierleague.com/clubs/1/Arsenal/overview"
+
+@pytest.fixture(autouse=True)
+def reset_singleton():
+    ClubNameResolver.reset()
+    yield
+    ClubNameResolver.reset()
+
+def test_resolver_is_a_singleton():
+    assert ClubNameResolver() is ClubNameResolver()
+
+@pytest.mark.parametrize("url", [
+    ARSENAL_URL,
+    "/clubs/1/Arsenal/overview",
+    "https://www.premierleague.com/clubs/1/Arsenal/squad?se=719",
+    "https://www.premierleague.com/clubs/1",
+])
+def test_key_is_the_club_id(url):
+    assert ClubNameResolver.key(url) == "1"
+
+def test_remembered_names_are_found_from_any_club_tab():
+    resolver = ClubNameResolver()
+    assert resolver.lookup(ARSENAL_URL) is None
+
+    resolver.remember("/clubs/1/Arsenal/overview", "Arsenal")
+
+    assert resolver.lookup("https://www.premierleague.com/clubs/1/Arsenal/directory") == "Arsenal"
+    assert resolver.snapshot() == {"known": 1, "hits": 1, "misses": 1}
+
+def test_names_are_loaded_once_from_the_teams_model():
+    model = MagicMock()
+    model.get_specific_column.return_value = {
+        ARSENAL_URL: "Arsenal",
+        "https://www.premierleague.com/clubs/11/Manchester-City/overview": "Manchester City",
+        None: "Unknown",
+    }
+    resolver = ClubNameResolver()
+    resolver.configure(model)
+
+    assert resolver.lookup("/clubs/11/Manchester-City/overview") == "Manchester City"
+    assert resolver.lookup(ARSENAL_URL) == "Arsenal"
+    model.get_specific_column.assert_called_once_with('name', key='page_url')
+
+def test_database_failure_falls_back_to_memory():
+    model = MagicMock()
+    model.get_specific_column.side_effect = ValueError("Invalid column: name")
+    resolver = ClubNameResolver()
+    resolver.configure(model)
+
+    assert resolver.lookup(ARSENAL_URL) is None
+    resolver.remember(ARSENAL_URL, "Arsenal")
+    assert resolver.lookup(ARSENAL_URL) == "Arsenal"
+    model.get_specific_column.assert_called_once()
@@ -3,13 +3,14 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from bs4 import BeautifulSoup
 from tests.utils import load_fixture
 from model.scrapers.club_urls_scraper import ClubUrlsScraper
+from model.scrapers.parser_engine import ParserEngine
 
 @pytest.fixture
 def clubs_page_html():
     return load_fixture('clubs_page.html')
 
 @pytest.mark.asyncio
-@patch("model.scrapers.club_urls_scraper.BeautifulSoup")
+@patch("model.scrapers.parser_engine.BeautifulSoup")
 @patch("model.scrapers.club_urls_scraper.RequestHandler.__new__")
 async def test_initialize_calls_handler_and_parses_html(mock_new, mock_bs):
     # Mock RequestHandler singleton instance
@@ -41,7 +42,7 @@ async def test_initialize_calls_handler_and_parses_html(mock_new, mock_bs):
     mock_handler_instance.get.assert_awaited_once_with(expected_url)
 
     # 4. BeautifulSoup was called with the correct HTML
-    mock_bs.assert_called_once_with(fake_html, 'html.parser')
+    mock_bs.assert_called_once_with(fake_html, ParserEngine.backend, parse_only=ParserEngine.strainer(ClubUrlsScraper.CLUBS_PAGE_REGIONS))
 
     # 5. structure was set properly
     assert scraper._structure == mock_soup_instance
@@ -0,0 +1,108 @@
+import pytest
+import asyncio
+from unittest.mock import patch
+from model.scrapers.concurrency_limiter import AdaptiveConcurrencyLimiter
+
+@pytest.mark.parametrize("kwargs", [
+    {"initial": 0},
+    {"initial": 2, "min_limit": 3},
+    {"initial": 40, "max_limit": 32},
+    {"backoff": 1.5},
+])
+def test_limiter_rejects_invalid_parameters(kwargs):
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyLimiter(**kwargs)
+
+@pytest.mark.asyncio
+async def test_acquire_blocks_at_the_limit():
+    limiter = AdaptiveConcurrencyLimiter(initial=2)
+    await limiter.acquire()
+    await limiter.acquire()
+
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    limiter.release()
+    await asyncio.wait_for(waiter, timeout=1)
+    assert limiter.in_flight == 2
+
+@pytest.mark.asyncio
+async def test_limit_grows_while_saturated_and_latency_is_flat():
+    limiter = AdaptiveConcurrencyLimiter(initial=2, max_limit=4)
+
+    for _ in range(20):
+        while limiter.in_flight < limiter.current_limit:
+            await limiter.acquire()
+        limiter.release(latency=0.2, status=200)
+
+    assert limiter.current_limit == 4
+    assert [change["reason"] for change in limiter.history] == ["increase", "increase"]
+
+def test_limit_does_not_grow_when_not_saturated():
+    limiter = AdaptiveConcurrencyLimiter(initial=4)
+    for _ in range(20):
+        limiter.in_flight = 1
+        limiter.release(latency=0.2, status=200)
+
+    assert limiter.current_limit == 4
+
+@pytest.mark.parametrize("outcome, reason", [
+    ({"status": 429}, "throttled"),
+    ({"status": 503}, "server_error"),
+    ({"error": asyncio.TimeoutError()}, "network_error"),
+])
+def test_overload_halves_the_limit(outcome, reason):
+    limiter = AdaptiveConcurrencyLimiter(initial=8)
+    limiter.in_flight = 1
+    limiter.release(**outcome)
+
+    assert limiter.current_limit == 4
+    assert limiter.history[-1]["reason"] == reason
+
+def test_client_errors_do_not_lower_the_limit():
+    limiter = AdaptiveConcurrencyLimiter(initial=8)
+    limiter.in_flight = 1
+    limiter.release(latency=0.1, status=404)
+    limiter.in_flight = 1
+    limiter.release(error=ValueError("too large"))
+
+    assert limiter.current_limit == 8
+
+def test_latency_spike_lowers_the_limit():
+    limiter = AdaptiveConcurrencyLimiter(initial=8, min_samples=5)
+    for _ in range(5):
+        limiter.release(latency=0.2, status=200)
+
+    limiter.release(latency=2.0, status=200)
+
+    assert limiter.current_limit == 4
+    assert limiter.history[-1]["reason"] == "latency_spike"
+
+def test_decreases_are_spaced_by_cooldown():
+    limiter = AdaptiveConcurrencyLimiter(initial=16, cooldown=1.0)
+    with patch("model.scrapers.concurrency_limiter.time.monotonic", side_effect=[10.0, 10.5, 11.5]):
+        limiter.release(status=429)
+        limiter.release(status=429)
+        assert limiter.current_limit == 8
+        limiter.release(status=429)
+
+    assert limiter.current_limit == 4
+
+def test_limit_never_drops_below_minimum():
+    limiter = AdaptiveConcurrencyLimiter(initial=2, min_limit=2, cooldown=0)
+    for _ in range(5):
+        limiter.release(status=500)
+
+    assert limiter.current_limit == 2
+
+def test_snapshot_reports_limit_and_percentiles():
+    limiter = AdaptiveConcurrencyLimiter(initial=3)
+    for latency in (0.1, 0.2, 0.3, 0.4):
+        limiter.release(latency=latency, status=200)
+
+    snapshot = limiter.snapshot()
+    assert snapshot["limit"] == 3
+    assert snapshot["in_flight"] == 0
+    assert snapshot["latency_p50"] == 0.3
+    assert snapshot["latency_p95"] == 0.4
@@ -0,0 +1,47 @@
+import pytest
+from unittest.mock import patch
+from model.scrapers.connection_pool import ConnectionPool
+
+def test_rejects_per_host_limit_above_total_limit():
+    with pytest.raises(ValueError):
+        ConnectionPool(limit=4, limit_per_host=8)
+
+@pytest.mark.asyncio
+async def test_create_connector_applies_pool_settings():
+    pool = ConnectionPool(limit=12, limit_per_host=4, keepalive_timeout=45, dns_cache_ttl=600)
+
+    connector = pool.create_connector()
+    try:
+        assert connector.limit == 12
+        assert connector.limit_per_host == 4
+        assert connector.use_dns_cache is True
+    finally:
+        await connector.close()
+
+@pytest.mark.asyncio
+async def test_dns_cache_can_be_disabled():
+    connector = ConnectionPool(dns_cache_ttl=0).create_connector()
+    try:
+        assert connector.use_dns_cache is False
+    finally:
+        await connector.close()
+
+@pytest.mark.asyncio
+async def test_create_session_negotiates_compression():
+    session = ConnectionPool().create_session()
+    try:
+        assert "gzip" in session.headers["Accept-Encoding"]
+        assert session.auto_decompress is True
+    finally:
+        await session.close()
+
+@pytest.mark.parametrize("brotli_available, expected", [
+    (True, "gzip, deflate, br"),
+    (False, "gzip, deflate"),
+])
+def test_accept_encoding_advertises_brotli_only_when_available(brotli_available, expected):
+    with patch("model.scrapers.connection_pool.BROTLI_AVAILABLE", brotli_available):
+        assert ConnectionPool().accept_encoding == expected
+
+def test_accept_encoding_identity_when_compression_disabled():
+    assert ConnectionPool(compression=False).accept_encoding == "identity"
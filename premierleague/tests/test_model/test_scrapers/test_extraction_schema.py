@@ -0,0 +1,91 @@
+import pytest
+from bs4 import BeautifulSoup
+from tests.utils import load_fixture
+from model.scrapers.extraction_schema import ExtractionSchema, SchemaField
+from model.scrapers.patterns import Selectors
+from model.scrapers.player_data_scraper import PlayerDataScraper
+from model.scrapers.club_data_scraper import ClubDataScraper
+
+PAGE = '''
+<div class="header"><h1 class="title">First</h1><h1 class="title">Second</h1></div>
+<ul class="tabs">
+    <li class="tab"><a href="/overview">Overview</a></li>
+    <li class="tab"><a href="/squad">Squad</a></li>
+</ul>
+<p class="info">12 June 1999  (25)</p>
+<img class="badge" src="/badge.png">
+'''
+
+@pytest.fixture
+def page():
+    return BeautifulSoup(PAGE, 'html.parser')
+
+def test_requires_fields():
+    with pytest.raises(ValueError):
+        ExtractionSchema({})
+
+def test_reads_text_attribute_transform_and_type(page):
+    schema = ExtractionSchema({
+        'title': SchemaField('.header h1.title'),
+        'squad': SchemaField('.tab:nth-child(2) a', attribute='href'),
+        'born': SchemaField('p.info', transform=lambda text: text.split('  ')[0]),
+        'age': SchemaField('p.info', transform=lambda text: text.split('  ')[1].strip('()'), type=int),
+        'badge': SchemaField('img.badge', attribute='src'),
+    })
+
+    assert schema.extract(page) == {
+        'title': 'First',
+        'squad': '/squad',
+        'born': '12 June 1999',
+        'age': 25,
+        'badge': '/badge.png',
+    }
+
+def test_many_collects_every_match_in_document_order(page):
+    schema = ExtractionSchema({'titles': SchemaField('h1', many=True, transform=lambda elements: [e.get_text() for e in elements], type=list)})
+
+    assert schema.extract(page) == {'titles': ['First', 'Second']}
+
+def test_missing_and_rejected_fields_are_none(page):
+    schema = ExtractionSchema({
+        'missing': SchemaField('.nowhere'),
+        'no_attribute': SchemaField('img.badge', attribute='alt'),
+        'bad_cast': SchemaField('h1.title', type=int),
+        'present': SchemaField('h1.title'),
+    })
+
+    assert schema.extract(page) == {'missing': None, 'no_attribute': None, 'bad_cast': None, 'present': 'First'}
+
+def test_shared_selectors_are_compiled_once():
+    first = ExtractionSchema({'a': SchemaField('p.info'), 'b': SchemaField('p.info', type=len)})
+    second = ExtractionSchema({'c': SchemaField('p.info')})
+
+    assert first._single == {'p.info'}
+    assert Selectors.compile('p.info') is second._by_class['info'][0][1]
+
+@pytest.mark.parametrize("selector, key", [
+    ('.playerSidebar .player-overview__col:nth-child(3) .player-overview__info', ('class', 'player-overview__info')),
+    ('.player-header div.player-header__player-number', ('class', 'player-header__player-number')),
+    ('.club-profile-bio__metadata-item--established p', ('tag', 'p')),
+    ('ul.club-navigation__nav a.club-navigation__link[data-text="Squad Page"]', ('class', 'club-navigation__link')),
+    ('.widget > :first-child', (None, None)),
+])
+def test_index_key_uses_rightmost_compound(selector, key):
+    assert ExtractionSchema.index_key(selector) == key
+
+@pytest.mark.parametrize("schema, fixture", [
+    (PlayerDataScraper.PLAYER_PAGE_SCHEMA, 'player_page.html'),
+    (ClubDataScraper.MAIN_PAGE_SCHEMA, 'club_main_page.html'),
+    (ClubDataScraper.DIRECTORY_PAGE_SCHEMA, 'club_directory_page_1.html'),
+])
+def test_single_pass_matches_select_one(schema, fixture):
+    page = BeautifulSoup(load_fixture(fixture), 'html.parser')
+    record = schema.extract(page)
+
+    for name, field in schema.fields.items():
+        found = page.select(field.selector) if field.many else page.select_one(field.selector)
+        try:
+            expected = field.read(found)
+        except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+            expected = None
+        assert record[name] == expected, name
@@ -0,0 +1,49 @@
+import pytest
+from unittest.mock import MagicMock, AsyncMock
+from model.scrapers.extraction_spec import ExtractionSpec, Field
+
+def page_returning(record):
+    page = MagicMock()
+    page.url = "https://www.premierleague.com/match/116057"
+    page.evaluate = AsyncMock(return_value=record)
+    return page
+
+def test_spec_requires_fields():
+    with pytest.raises(ValueError):
+        ExtractionSpec({})
+
+@pytest.mark.asyncio
+async def test_extract_sends_every_field_in_one_evaluate():
+    spec = ExtractionSpec({
+        'score': Field('.mc-summary__score'),
+        'kickoff': Field('.renderKOContainer', attribute='data-kickoff'),
+        'links': Field('a.match-fixture', attribute='href', many=True),
+    })
+    page = page_returning({'score': '5 - 1', 'kickoff': '1738513800000', 'links': ['/match/1', '/match/2']})
+
+    record = await spec.extract(page)
+
+    assert record == {'score': '5 - 1', 'kickoff': '1738513800000', 'links': ['/match/1', '/match/2']}
+    page.evaluate.assert_awaited_once_with(ExtractionSpec.SCRIPT, [
+        {"name": "score", "selector": ".mc-summary__score", "attribute": None, "many": False},
+        {"name": "kickoff", "selector": ".renderKOContainer", "attribute": "data-kickoff", "many": False},
+        {"name": "links", "selector": "a.match-fixture", "attribute": "href", "many": True},
+    ])
+
+@pytest.mark.asyncio
+async def test_extract_raises_for_missing_required_fields():
+    spec = ExtractionSpec({'score': Field('.mc-summary__score'), 'referee': Field('.referee')})
+
+    with pytest.raises(ValueError, match="score, referee"):
+        await spec.extract(page_returning({'score': None, 'referee': None}))
+
+@pytest.mark.asyncio
+async def test_extract_allows_optional_and_empty_list_fields():
+    spec = ExtractionSpec({
+        'attendance': Field('.attendance', optional=True),
+        'links': Field('a.match-fixture', attribute='href', many=True),
+    })
+
+    record = await spec.extract(page_returning({'attendance': None, 'links': []}))
+
+    assert record == {'attendance': None, 'links': []}
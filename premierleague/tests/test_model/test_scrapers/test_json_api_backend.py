@@ -0,0 +1,154 @@
+import json
+import asyncio
+import aiohttp
+import pytest
+from unittest.mock import MagicMock, AsyncMock
+from model.scrapers.json_api_backend import EndpointStore, JsonResponseCapture, JsonApiBackend
+
+FIXTURE_URL = "https://footballapi.pulselive.com/football/fixtures/116057"
+
+@pytest.fixture(autouse=True)
+def reset_singleton():
+    JsonApiBackend.reset()
+    yield
+    JsonApiBackend.reset()
+
+@pytest.fixture
+def store(tmp_path):
+    return EndpointStore(tmp_path / "api_endpoints.json")
+
+def fake_response(url, payload, content_type="application/json"):
+    response = MagicMock()
+    response.url = url
+    response.headers = {"content-type": content_type}
+    response.json = AsyncMock(return_value=payload)
+    response.request.all_headers = AsyncMock(return_value={
+        "origin": "https://www.premierleague.com",
+        "referer": "https://www.premierleague.com/",
+        "cookie": "session=secret",
+    })
+    return response
+
+def test_store_learns_templates_and_persists_them(store):
+    endpoint = store.learn("fixture", FIXTURE_URL, "116057", "match_id", {"Origin": "https://www.premierleague.com", "Cookie": "x"})
+
+    assert endpoint == {
+        "template": "https://footballapi.pulselive.com/football/fixtures/{match_id}",
+        "headers": {"Origin": "https://www.premierleague.com"},
+    }
+    assert EndpointStore(store.path).get("fixture") == endpoint
+
+    store.forget("fixture")
+    assert EndpointStore(store.path).get("fixture") is None
+
+def test_store_ignores_urls_without_the_identifier(store):
+    assert store.learn("fixture", FIXTURE_URL, "999999", "match_id") is None
+    assert store.get("fixture") is None
+
+def test_store_templates_only_the_path_segment_holding_the_identifier(store):
+    url = "https://footballapi.pulselive.com/football/compseasons/21/gameweeks/21/fixtures?comps=1&altIds=21"
+
+    endpoint = store.learn("week_fixtures", url, "21", "week_id")
+
+    assert endpoint["template"] == "https://footballapi.pulselive.com/football/compseasons/21/gameweeks/{week_id}/fixtures?comps=1&altIds=21"
+    assert store.learn("week_fixtures", "https://footballapi.pulselive.com/football/fixtures/1160570", "116057", "match_id") is None
+
+def test_store_survives_a_corrupt_file(store):
+    store.path.write_text("{not json")
+    assert store.get("fixture") is None
+
+@pytest.mark.asyncio
+async def test_capture_keeps_json_responses_only():
+    page = MagicMock()
+    capture = JsonResponseCapture(page)
+    on_response = page.on.call_args.args[1]
+    on_response(fake_response("https://www.premierleague.com/app.js", None, "application/javascript"))
+    on_response(fake_response("https://footballapi.pulselive.com/football/broadcasting", {"content": []}))
+    on_response(fake_response(FIXTURE_URL, {"id": 116057.0, "teams": []}))
+
+    response, payload = await capture.find(lambda payload: "teams" in payload)
+
+    assert response.url == FIXTURE_URL
+    assert payload == {"id": 116057.0, "teams": []}
+    assert await capture.find(lambda payload: "missing" in payload) is None
+
+@pytest.mark.asyncio
+async def test_discover_learns_endpoint_with_forwarded_headers(store):
+    page = MagicMock()
+    capture = JsonResponseCapture(page)
+    page.on.call_args.args[1](fake_response(FIXTURE_URL, {"id": 116057.0, "teams": []}))
+    backend = JsonApiBackend()
+    backend.configure(endpoints=store)
+
+    assert await backend.discover("fixture", capture, lambda payload: "teams" in payload, "116057", "match_id")
+    assert backend.knows("fixture")
+    assert store.get("fixture")["headers"] == {"origin": "https://www.premierleague.com", "referer": "https://www.premierleague.com/"}
+
+@pytest.mark.asyncio
+async def test_fetch_uses_request_handler_with_learned_headers(store):
+    store.learn("fixture", FIXTURE_URL, "116057", "match_id", {"Origin": "https://www.premierleague.com"})
+    handler = MagicMock()
+    handler.configure = AsyncMock()
+    handler.get = AsyncMock(return_value=json.dumps({"id": 116058.0}))
+    backend = JsonApiBackend()
+    backend.configure(endpoints=store, request_handler=handler)
+
+    result = await backend.fetch("fixture", lambda payload: int(payload["id"]), match_id="116058")
+
+    assert result == 116058
+    handler.get.assert_awaited_once_with(
+        "https://footballapi.pulselive.com/football/fixtures/116058", headers={"Origin": "https://www.premierleague.com"}, raise_for_status=True
+    )
+    assert backend.snapshot() == {"api_hits": 1, "fallbacks": 0}
+
+@pytest.mark.asyncio
+async def test_fetch_without_endpoint_returns_none(store):
+    handler = MagicMock()
+    backend = JsonApiBackend()
+    backend.configure(endpoints=store, request_handler=handler)
+
+    assert await backend.fetch("fixture", json.loads, match_id="116057") is None
+    handler.get.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_fetch_failure_falls_back_and_forgets_endpoint(store):
+    store.learn("fixture", FIXTURE_URL, "116057", "match_id")
+    handler = MagicMock()
+    handler.configure = AsyncMock()
+    handler.get = AsyncMock(return_value="<html>Access denied</html>")
+    backend = JsonApiBackend()
+    backend.configure(endpoints=store, request_handler=handler)
+
+    assert await backend.fetch("fixture", lambda payload: payload, match_id="116057") is None
+    assert not backend.knows("fixture")
+    assert backend.snapshot() == {"api_hits": 0, "fallbacks": 1}
+
+def response_error(status):
+    return aiohttp.ClientResponseError(MagicMock(), (), status=status)
+
+@pytest.mark.parametrize("error", [asyncio.TimeoutError(), aiohttp.ClientConnectionError(), response_error(503), response_error(429)])
+@pytest.mark.asyncio
+async def test_transient_fetch_failure_falls_back_and_keeps_endpoint(store, error):
+    store.learn("fixture", FIXTURE_URL, "116057", "match_id")
+    handler = MagicMock()
+    handler.configure = AsyncMock()
+    handler.get = AsyncMock(side_effect=error)
+    backend = JsonApiBackend()
+    backend.configure(endpoints=store, request_handler=handler)
+
+    assert await backend.fetch("fixture", lambda payload: payload, match_id="116057") is None
+    assert backend.knows("fixture")
+    assert backend.snapshot() == {"api_hits": 0, "fallbacks": 1}
+
+@pytest.mark.parametrize("status", [404, 410])
+@pytest.mark.asyncio
+async def test_gone_endpoint_is_forgotten(store, status):
+    store.learn("fixture", FIXTURE_URL, "116057", "match_id")
+    handler = MagicMock()
+    handler.configure = AsyncMock()
+    handler.get = AsyncMock(side_effect=response_error(status))
+    backend = JsonApiBackend()
+    backend.configure(endpoints=store, request_handler=handler)
+
+    assert await backend.fetch("fixture", lambda payload: payload, match_id="116057") is None
+    assert not backend.knows("fixture")
@@ -1,7 +1,9 @@
+import json
 import pytest
 from unittest.mock import patch, MagicMock, AsyncMock
 
-from model.scrapers.match_data_scraper import MatchDataScraper, PlaywrightRequestHandler
+from model.scrapers.match_data_scraper import MatchDataScraper, PlaywrightRequestHandler, ClubNameResolver, JsonApiBackend
+from model.scrapers.json_api_backend import EndpointStore
 
 VALID_URL = "https://www.premierleague.com/match/116057"
 INVALID_URL = "https://google.com"
@@ -20,6 +22,34 @@ EXPECTED = {
     }
 }
 
+@pytest.fixture(autouse=True)
+def reset_club_names():
+    ClubNameResolver.reset()
+    yield
+    ClubNameResolver.reset()
+
+@pytest.fixture(autouse=True)
+def api_endpoints(tmp_path):
+    JsonApiBackend.reset()
+    endpoints = EndpointStore(tmp_path / "api_endpoints.json")
+    JsonApiBackend().configure(endpoints=endpoints)
+    yield endpoints
+    JsonApiBackend.reset()
+
+FIXTURE_PAYLOAD = {
+    "id": 116057.0,
+    "gameweek": {"id": 18413.0, "gameweek": 24},
+    "kickoff": {"millis": 1738513800000, "label": "Sun 2 Feb 2025, 16:30 GMT"},
+    "teams": [
+        {"team": {"name": "Arsenal", "club": {"name": "Arsenal"}}, "score": 5.0},
+        {"team": {"name": "Manchester City", "club": {"name": "Manchester City"}}, "score": 1.0},
+    ],
+    "matchOfficials": [
+        {"name": {"display": "Dan Cook"}, "role": "ASSISTANT"},
+        {"name": {"display": "Peter Bankes"}, "role": "REFEREE"},
+    ],
+}
+
 GET_METHODS = [
     "get_all_data",
     "get_timestamp",
@@ -134,7 +164,7 @@ async def test_get_methods_uses_cache(method_name, data_key):
         assert result == expected
         mock_callback.assert_not_called()  # Ensure _create_context_then_callback was not called
 
-async def goto_side_effect(page, url):
+async def goto_side_effect(page, url, **kwargs):
     await page.goto(url)
 
 @pytest.mark.asyncio
@@ -198,3 +228,130 @@ async def test_get_away_team_data():
     assert "name" in result and "score" in result
     assert result == EXPECTED["away_team_data"]
     assert scraper.match_data["away_team_data"] == result
+
+@pytest.mark.asyncio
+async def test_create_context_then_callback_uses_pooled_page():
+    scraper = MatchDataScraper(VALID_URL)
+    page = MagicMock()
+    lease = MagicMock()
+    lease.__aenter__ = AsyncMock(return_value=page)
+    lease.__aexit__ = AsyncMock(return_value=None)
+    scraper._request_handler = MagicMock(spec=PlaywrightRequestHandler)
+    scraper._request_handler.page.return_value = lease
+    scraper._request_handler.goto = AsyncMock()
+    callback = AsyncMock(return_value="scraped")
+
+    result = await scraper._create_context_then_callback(callback)
+
+    assert result == "scraped"
+    scraper._request_handler.goto.assert_awaited_once_with(page, VALID_URL, wait_for=MatchDataScraper.MATCH_PAGE_READY_SELECTOR)
+    callback.assert_awaited_once_with(page)
+    lease.__aexit__.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_get_all_data_extracts_summary_in_one_round_trip():
+    scraper = MatchDataScraper(VALID_URL)
+    page = MagicMock()
+    page.evaluate = AsyncMock(side_effect=[
+        {
+            "round_number": "Matchweek 24",
+            "timestamp": "1738513800000",
+            "referee_name": "\n  Ref: Peter Bankes ",
+            "score": "5 - 1",
+            "home_team_url": "/clubs/1/Arsenal/overview",
+            "away_team_url": "/clubs/11/Manchester-City/overview",
+        },
+        {"name": " Arsenal "},
+        {"name": "Manchester City"},
+    ])
+    lease = MagicMock()
+    lease.__aenter__ = AsyncMock(return_value=page)
+    lease.__aexit__ = AsyncMock(return_value=None)
+    scraper._request_handler = MagicMock(spec=PlaywrightRequestHandler)
+    scraper._request_handler.page.return_value = lease
+    scraper._request_handler.goto = AsyncMock()
+    scraper._initialized = True
+
+    result = await scraper.get_all_data()
+
+    assert result == EXPECTED
+    assert page.evaluate.await_count == 3
+    scraper._request_handler.goto.assert_any_await(
+        page, "https://www.premierleague.com/clubs/1/Arsenal/overview", wait_for=MatchDataScraper.CLUB_PAGE_READY_SELECTOR
+    )
+    scraper._request_handler.goto.assert_any_await(
+        page, "https://www.premierleague.com/clubs/11/Manchester-City/overview", wait_for=MatchDataScraper.CLUB_PAGE_READY_SELECTOR
+    )
+
+@pytest.mark.asyncio
+async def test_known_club_names_skip_club_page_navigation():
+    ClubNameResolver().remember("/clubs/1/Arsenal/overview", "Arsenal")
+    scraper = MatchDataScraper(VALID_URL)
+    page = MagicMock()
+    page.evaluate = AsyncMock(side_effect=[
+        {
+            "round_number": "Matchweek 24",
+            "timestamp": "1738513800000",
+            "referee_name": "Ref: Peter Bankes",
+            "score": "5 - 1",
+            "home_team_url": "/clubs/1/Arsenal/overview",
+            "away_team_url": "/clubs/11/Manchester-City/overview",
+        },
+        {"name": "Manchester City"},
+    ])
+    scraper._request_handler = MagicMock(spec=PlaywrightRequestHandler)
+    scraper._request_handler.goto = AsyncMock()
+
+    await scraper._scrape_summary(page)
+    home = await scraper._scrape_club_name(page, "https://www.premierleague.com/clubs/1/Arsenal/overview")
+    away = await scraper._scrape_club_name(page, "https://www.premierleague.com/clubs/11/Manchester-City/overview")
+    away_again = await scraper._scrape_club_name(page, "https://www.premierleague.com/clubs/11/Manchester-City/overview")
+
+    assert (home, away, away_again) == ("Arsenal", "Manchester City", "Manchester City")
+    scraper._request_handler.goto.assert_awaited_once_with(
+        page, "https://www.premierleague.com/clubs/11/Manchester-City/overview", wait_for=MatchDataScraper.CLUB_PAGE_READY_SELECTOR
+    )
+
+@pytest.mark.asyncio
+async def test_get_all_data_uses_json_api_when_endpoint_is_known(api_endpoints):
+    api_endpoints.learn(MatchDataScraper.FIXTURE_ENDPOINT, "https://footballapi.pulselive.com/football/fixtures/1", "1", "match_id")
+    api_handler = MagicMock()
+    api_handler.configure = AsyncMock()
+    api_handler.get = AsyncMock(return_value=json.dumps(FIXTURE_PAYLOAD))
+    JsonApiBackend().configure(request_handler=api_handler)
+    scraper = MatchDataScraper(VALID_URL)
+    scraper._request_handler = MagicMock(spec=PlaywrightRequestHandler)
+    scraper._initialized = True
+
+    result = await scraper.get_all_data()
+
+    assert result == EXPECTED
+    assert await scraper.get_referee_name() == "Peter Bankes"
+    api_handler.get.assert_awaited_once_with("https://footballapi.pulselive.com/football/fixtures/116057", headers={}, raise_for_status=True)
+    scraper._request_handler.page.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_browser_visit_discovers_fixture_endpoint(api_endpoints):
+    scraper = MatchDataScraper(VALID_URL)
+    page = MagicMock()
+    lease = MagicMock()
+    lease.__aenter__ = AsyncMock(return_value=page)
+    lease.__aexit__ = AsyncMock(return_value=None)
+    api_response = MagicMock()
+    api_response.url = "https://footballapi.pulselive.com/football/fixtures/116057?altIds=true"
+    api_response.headers = {"content-type": "application/json"}
+    api_response.json = AsyncMock(return_value=FIXTURE_PAYLOAD)
+    api_response.request.all_headers = AsyncMock(return_value={"origin": "https://www.premierleague.com"})
+
+    async def goto(page, url, **kwargs):
+        page.on.call_args.args[1](api_response)
+
+    scraper._request_handler = MagicMock(spec=PlaywrightRequestHandler)
+    scraper._request_handler.page.return_value = lease
+    scraper._request_handler.goto = AsyncMock(side_effect=goto)
+
+    assert await scraper._create_context_then_callback(AsyncMock(return_value="scraped")) == "scraped"
+    assert api_endpoints.get(MatchDataScraper.FIXTURE_ENDPOINT) == {
+        "template": "https://footballapi.pulselive.com/football/fixtures/{match_id}?altIds=true",
+        "headers": {"origin": "https://www.premierleague.com"},
+    }
@@ -0,0 +1,83 @@
+import asyncio
+import pytest
+from unittest.mock import patch, MagicMock, AsyncMock
+from model.scrapers.match_scraping_pipeline import MatchScrapingPipeline
+
+URLS = [f"https://www.premierleague.com/match/{match_id}" for match_id in range(116000, 116010)]
+
+@pytest.fixture
+def mock_handler():
+    with patch('model.scrapers.match_scraping_pipeline.PlaywrightRequestHandler') as handler_class:
+        handler_class.return_value.configure = AsyncMock()
+        yield handler_class.return_value
+
+def scraper_factory(delay=0.0, failing=()):
+    state = {"running": 0, "peak": 0}
+
+    def create(url):
+        scraper = MagicMock()
+        scraper.initialize = AsyncMock()
+
+        async def get_all_data():
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+            await asyncio.sleep(delay)
+            state["running"] -= 1
+            if url in failing:
+                raise RuntimeError("page crashed")
+            return {"url": url}
+
+        scraper.get_all_data = get_all_data
+        return scraper
+
+    return create, state
+
+def test_pipeline_requires_a_worker():
+    with pytest.raises(ValueError):
+        MatchScrapingPipeline(workers=0)
+
+@pytest.mark.asyncio
+async def test_pipeline_streams_every_result_with_bounded_concurrency(mock_handler):
+    create, state = scraper_factory(delay=0.01)
+    saved = []
+    pipeline = MatchScrapingPipeline(workers=3, on_result=lambda url, data: saved.append(data["url"]))
+
+    with patch('model.scrapers.match_scraping_pipeline.MatchDataScraper', side_effect=create):
+        stats = await pipeline.run(URLS + URLS[:2])
+
+    assert sorted(saved) == sorted(URLS)
+    assert state["peak"] == 3
+    assert stats["total"] == 10 and stats["completed"] == 10 and stats["failed"] == 0
+    assert stats["matches_per_minute"] > 0
+    mock_handler.configure.assert_awaited_once_with(browser_pool=None)
+
+@pytest.mark.asyncio
+async def test_pipeline_keeps_going_after_failures(mock_handler):
+    create, _ = scraper_factory(failing={URLS[0], URLS[5]})
+    on_result = AsyncMock()
+    on_error = MagicMock()
+    pipeline = MatchScrapingPipeline(workers=2, on_result=on_result, on_error=on_error)
+
+    with patch('model.scrapers.match_scraping_pipeline.MatchDataScraper', side_effect=create):
+        stats = await pipeline.run(URLS)
+
+    assert stats["completed"] == 8 and stats["failed"] == 2
+    assert on_result.await_count == 8
+    assert {call.args[0] for call in on_error.call_args_list} == {URLS[0], URLS[5]}
+
+@pytest.mark.asyncio
+async def test_pipeline_counts_failed_saves(mock_handler):
+    create, _ = scraper_factory()
+    pipeline = MatchScrapingPipeline(workers=2, on_result=MagicMock(side_effect=ValueError("Missing required columns")))
+
+    with patch('model.scrapers.match_scraping_pipeline.MatchDataScraper', side_effect=create):
+        stats = await pipeline.run(URLS[:3])
+
+    assert stats["completed"] == 0 and stats["failed"] == 3
+
+@pytest.mark.asyncio
+async def test_pipeline_with_no_urls_does_nothing(mock_handler):
+    stats = await MatchScrapingPipeline().run([])
+
+    assert stats == {"total": 0, "completed": 0, "failed": 0, "elapsed": 0.0, "matches_per_minute": 0.0}
+    mock_handler.configure.assert_not_awaited()
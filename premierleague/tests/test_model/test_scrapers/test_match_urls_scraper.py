@@ -42,7 +42,7 @@ async def test_initilizer_sets_state(mock_handler_cls):
     assert scraper._initialized == True
 
 
-async def goto_side_effect(page, url):
+async def goto_side_effect(page, url, **kwargs):
     await page.goto(url)
 
 
@@ -182,3 +182,23 @@ async def test_get_match_urls_builds_correct_result(mock_async_playwright):
 
     # Browser was closed
     mock_browser.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_anchors_without_href_are_skipped():
+    scraper = MatchUrlsScraper()
+    scraper._request_handler = MagicMock(spec=PlaywrightRequestHandler)
+    scraper._request_handler.goto = AsyncMock()
+    scraper._api_backend = MagicMock()
+    scraper._api_backend.fetch = AsyncMock(return_value=None)
+    scraper._api_backend.knows.return_value = True
+    browser = AsyncMock()
+    browser.new_page.return_value = AsyncMock()
+
+    with patch.object(MatchUrlsScraper.WEEK_MATCHES_SPEC, 'extract', AsyncMock(return_value={'round': 'Matchweek 3', 'urls': ['/match/1', None]})):
+        result = await scraper._get_week_match_urls(browser, 'https://www.premierleague.com/matchweek/18392/blog?match=true')
+    with patch.object(MatchUrlsScraper.WEEK_LINKS_SPEC, 'extract', AsyncMock(return_value={'urls': [None, '/matchweek/18390/blog', '/matchweek/18391/blog']})):
+        week_page_urls = await scraper._get_week_page_urls(browser)
+
+    assert result == {'round': 3, 'urls': {'https://www.premierleague.com/match/1'}}
+    assert week_page_urls == ['https://www.premierleague.com/matchweek/18390/blog']
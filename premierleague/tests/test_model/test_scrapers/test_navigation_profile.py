@@ -0,0 +1,58 @@
+import pytest
+from unittest.mock import MagicMock, AsyncMock
+from model.scrapers.navigation_profile import NavigationProfile
+
+def route_for(resource_type, url):
+    route = MagicMock()
+    route.request.resource_type = resource_type
+    route.request.url = url
+    route.abort = AsyncMock()
+    route.continue_ = AsyncMock()
+    return route
+
+@pytest.mark.parametrize("resource_type, url", [
+    ("image", "https://resources.premierleague.com/premierleague/badges/t3.png"),
+    ("font", "https://www.premierleague.com/resources/fonts/premierleague.woff2"),
+    ("script", "https://www.googletagmanager.com/gtm.js?id=GTM-1"),
+    ("xhr", "https://www.google-analytics.com/g/collect?v=2"),
+])
+def test_default_profile_blocks_assets_and_trackers(resource_type, url):
+    assert NavigationProfile().should_block(resource_type, url)
+
+@pytest.mark.parametrize("resource_type, url", [
+    ("document", "https://www.premierleague.com/match/116057"),
+    ("script", "https://www.premierleague.com/resources/prod/app.js"),
+    ("xhr", "https://footballapi.pulselive.com/football/fixtures/116057"),
+])
+def test_default_profile_keeps_what_the_page_needs(resource_type, url):
+    assert not NavigationProfile().should_block(resource_type, url)
+
+def test_profile_accepts_custom_rules():
+    profile = NavigationProfile(blocked_resource_types=("stylesheet",), blocked_url_patterns=(r"/ads/",))
+
+    assert profile.should_block("stylesheet", "https://example.com/site.css")
+    assert profile.should_block("script", "https://example.com/ads/banner.js")
+    assert not profile.should_block("image", "https://example.com/logo.png")
+
+def test_unrestricted_profile_does_not_intercept():
+    profile = NavigationProfile.unrestricted()
+
+    assert not profile.intercepts
+    assert profile.wait_until == "load"
+
+def test_profile_rejects_unknown_wait_until():
+    with pytest.raises(ValueError):
+        NavigationProfile(wait_until="whenever")
+
+@pytest.mark.asyncio
+async def test_handle_route_aborts_or_continues_and_counts():
+    profile = NavigationProfile()
+    blocked = route_for("image", "https://example.com/photo.jpg")
+    allowed = route_for("document", "https://www.premierleague.com/tables")
+
+    await profile.handle_route(blocked)
+    await profile.handle_route(allowed)
+
+    blocked.abort.assert_awaited_once()
+    allowed.continue_.assert_awaited_once()
+    assert profile.snapshot() == {"blocked": 1, "allowed": 1, "wait_until": "domcontentloaded"}
@@ -0,0 +1,123 @@
+import pytest
+from concurrent.futures import Executor, Future
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import patch
+from tests.utils import load_fixture
+from model.scrapers.parse_executor import ParseExecutor
+from model.scrapers.player_data_scraper import extract_player_page
+from model.scrapers.club_data_scraper import extract_club_pages
+
+@pytest.fixture(autouse=True)
+def reset_executor():
+    ParseExecutor.reset()
+    yield
+    ParseExecutor.reset()
+
+class BreakingExecutor(Executor):
+    def __init__(self, breaks):
+        self.breaks = breaks
+        self.calls = 0
+
+    def submit(self, function, *args):
+        self.calls += 1
+        if self.calls <= self.breaks:
+            raise BrokenProcessPool("worker died")
+        future = Future()
+        future.set_result(function(*args))
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        pass
+
+@pytest.mark.parametrize("cores, workers", [(2, 2), (16, ParseExecutor.MAX_WORKERS)])
+def test_defaults_to_one_worker_per_core_up_to_the_cap(cores, workers):
+    with patch('model.scrapers.parse_executor.os.cpu_count', return_value=cores):
+        ParseExecutor.reset()
+        assert ParseExecutor().workers == workers
+
+def test_configure_caps_workers():
+    executor = ParseExecutor()
+    executor.configure(workers=ParseExecutor.MAX_WORKERS + 10)
+
+    assert executor.workers == ParseExecutor.MAX_WORKERS
+
+def test_pool_does_not_fork_from_a_threaded_process():
+    executor = ParseExecutor()
+    executor.configure(workers=1)
+    try:
+        assert executor._pool()._mp_context.get_start_method() in ('forkserver', 'spawn')
+    finally:
+        executor.shutdown()
+
+def test_configure_rejects_negative_workers():
+    with pytest.raises(ValueError):
+        ParseExecutor().configure(workers=-1)
+
+def test_configure_drops_pool_when_size_changes():
+    executor = ParseExecutor()
+    executor.configure(workers=2)
+    pool = executor._pool()
+
+    executor.configure(workers=3)
+
+    assert executor._executor is None
+    assert executor._pool() is not pool
+
+@pytest.mark.asyncio
+async def test_inline_mode_runs_on_the_loop():
+    executor = ParseExecutor()
+    executor.configure(workers=0)
+
+    result = await executor.run(extract_player_page, load_fixture('player_page.html'))
+
+    assert (result['firstname'], result['lastname']) == ('Declan', 'Rice')
+    assert executor._executor is None
+    assert executor.snapshot()['submitted'] == 1
+
+@pytest.mark.asyncio
+async def test_small_pages_parse_on_the_loop():
+    executor = ParseExecutor()
+    executor.configure(workers=2)
+
+    with patch.object(ParseExecutor, '_pool') as pool:
+        assert await executor.run(len, 'abc') == 3
+
+    pool.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_worker_processes_return_the_same_record_as_inline():
+    player_page = load_fixture('player_page.html')
+    main_page, directory_page = load_fixture('club_main_page.html'), load_fixture('club_directory_page_1.html')
+
+    executor = ParseExecutor()
+    executor.configure(workers=2, inline_limit=0)
+    try:
+        player = await executor.run(extract_player_page, player_page)
+        club = await executor.run(extract_club_pages, main_page, directory_page)
+    finally:
+        executor.shutdown()
+
+    assert player == extract_player_page(player_page)
+    assert club == extract_club_pages(main_page, directory_page)
+
+@pytest.mark.asyncio
+async def test_broken_pool_is_replaced_and_the_call_retried():
+    executor = ParseExecutor()
+    executor.configure(workers=1, inline_limit=0)
+    first, second = BreakingExecutor(breaks=1), BreakingExecutor(breaks=0)
+
+    with patch.object(ParseExecutor, '_pool', side_effect=[first, second]):
+        result = await executor.run(len, 'abc')
+
+    assert result == 3
+    assert executor.restarts == 1
+    assert second.calls == 1
+
+@pytest.mark.asyncio
+async def test_pool_breaking_twice_raises():
+    executor = ParseExecutor()
+    executor.configure(workers=1, inline_limit=0)
+
+    with patch.object(ParseExecutor, '_pool', side_effect=[BreakingExecutor(breaks=1), BreakingExecutor(breaks=1)]):
+        with pytest.raises(BrokenProcessPool):
+            await executor.run(len, 'abc')
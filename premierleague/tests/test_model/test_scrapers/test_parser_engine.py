@@ -0,0 +1,171 @@
+import pytest
+from unittest.mock import patch, AsyncMock
+from bs4 import BeautifulSoup, ParserRejectedMarkup
+from tests.utils import load_fixture
+from model.scrapers.parser_engine import ParserEngine
+from model.scrapers.club_data_scraper import ClubDataScraper
+from model.scrapers.player_data_scraper import PlayerDataScraper
+from model.scrapers.player_urls_scraper import PlayerUrlsScraper
+from model.scrapers.club_urls_scraper import ClubUrlsScraper
+from model.scrapers.tables_data_scraper import TablesDataScraper
+
+CLUB_URL = "https://www.premierleague.com/clubs/1/Arsenal/overview"
+PLAYER_URL = "https://www.premierleague.com/players/63123/Declan-Rice/overview"
+
+@pytest.fixture(autouse=True)
+def restore_backend():
+    backend = ParserEngine.backend
+    yield
+    ParserEngine.backend = backend
+    ParserEngine.fallbacks = 0
+    ParserEngine.region_misses = 0
+
+def regions_of(regions, strained):
+    return regions if strained else None
+
+async def scrape_club(backend, directory_fixture, strained=False):
+    with patch('model.scrapers.club_data_scraper.UrlValidator.validate_club_page_url', return_value=True):
+        scraper = ClubDataScraper(CLUB_URL)
+    scraper._initialized = True
+    scraper._page = {
+        **ClubDataScraper.MAIN_PAGE_SCHEMA.extract(ParserEngine.parse(load_fixture('club_main_page.html'), backend, regions_of(ClubDataScraper.MAIN_PAGE_REGIONS, strained))),
+        **ClubDataScraper.DIRECTORY_PAGE_SCHEMA.extract(ParserEngine.parse(load_fixture(directory_fixture), backend, regions_of(ClubDataScraper.DIRECTORY_PAGE_REGIONS, strained))),
+    }
+    getters = ('get_club_name', 'get_establishment_year', 'get_manager_name', 'get_city_name', 'get_stadium_name', 'get_squad_page_url')
+    return {getter: await getattr(scraper, getter)() for getter in getters}
+
+async def scrape_player(backend, strained=False):
+    with patch('model.scrapers.player_data_scraper.UrlValidator.validate_player_page_url', return_value=True):
+        scraper = PlayerDataScraper(PLAYER_URL)
+    scraper._initialized = True
+    scraper._page = PlayerDataScraper.PLAYER_PAGE_SCHEMA.extract(ParserEngine.parse(load_fixture('player_page.html'), backend, regions_of(PlayerDataScraper.PLAYER_PAGE_REGIONS, strained)))
+    return {
+        'firstname': await scraper.get_firstname(),
+        'lastname': await scraper.get_lastname(),
+        'club_name': await scraper.get_club_name(),
+        'position': await scraper.get_position(),
+        'nationality': await scraper.get_nationality(),
+        'date_of_birth': await scraper.get_date_of_birth(),
+        'shirt_number': await scraper.get_shirt_number(),
+        'age': await scraper.get_age(),
+        'height': await scraper.get_height(),
+    }
+
+async def scrape_squad_page_url(backend, strained=False):
+    ParserEngine.backend = backend
+    scraper = PlayerUrlsScraper()
+    scraper.CLUB_PAGE_REGIONS = regions_of(PlayerUrlsScraper.CLUB_PAGE_REGIONS, strained)
+    scraper._request_handler = AsyncMock()
+    scraper._request_handler.get.return_value = load_fixture('club_main_page.html')
+    return await scraper._scrap_squad_page_url(club_page_url=CLUB_URL)
+
+async def scrape_club_urls(backend, strained=False):
+    scraper = ClubUrlsScraper()
+    scraper._structure = ParserEngine.parse(load_fixture('clubs_page.html'), backend, regions_of(ClubUrlsScraper.CLUBS_PAGE_REGIONS, strained))
+    return await scraper.get_club_urls()
+
+async def scrape_tables(backend, strained=False):
+    scraper = TablesDataScraper()
+    scraper._initialized = True
+    scraper._structure = ParserEngine.parse(load_fixture('tables_page.html'), backend, regions_of(TablesDataScraper.TABLES_PAGE_REGIONS, strained))
+    return await scraper.get_tables_data()
+
+def test_fast_backend_is_used_when_lxml_is_installed():
+    pytest.importorskip('lxml')
+    assert ParserEngine.backend == ParserEngine.FAST_BACKEND
+
+def test_configure_rejects_unknown_backend():
+    with pytest.raises(ValueError):
+        ParserEngine.configure('html5lib')
+
+def test_configure_switches_backend():
+    ParserEngine.configure(ParserEngine.FALLBACK_BACKEND)
+    assert ParserEngine.backend == ParserEngine.FALLBACK_BACKEND
+    assert ParserEngine.parse('<p>x</p>').builder.NAME == 'html.parser'
+
+def test_parse_falls_back_when_fast_backend_rejects_markup():
+    real_soup = BeautifulSoup
+
+    def fake_soup(markup, backend, parse_only=None):
+        if backend == ParserEngine.FAST_BACKEND:
+            raise ParserRejectedMarkup("boom")
+        return real_soup(markup, backend, parse_only=parse_only)
+
+    with patch('model.scrapers.parser_engine.BeautifulSoup', side_effect=fake_soup):
+        soup = ParserEngine.parse('<p>x</p>', ParserEngine.FAST_BACKEND)
+
+    assert soup.select_one('p').get_text() == 'x'
+    assert ParserEngine.fallbacks == 1
+
+def test_parse_raises_when_fallback_backend_rejects_markup():
+    with patch('model.scrapers.parser_engine.BeautifulSoup', side_effect=ParserRejectedMarkup("boom")):
+        with pytest.raises(ParserRejectedMarkup):
+            ParserEngine.parse('<p>x</p>', ParserEngine.FALLBACK_BACKEND)
+
+def test_regions_keep_only_matching_subtrees():
+    soup = ParserEngine.parse('<div class="header wide"><p>kept</p></div><div class="footer"><p>dropped</p></div>', regions=('header',))
+
+    assert [p.get_text() for p in soup.select('p')] == ['kept']
+    assert soup.select_one('.header p') is not None
+
+def test_regions_missing_from_page_fall_back_to_whole_page():
+    soup = ParserEngine.parse('<div class="footer"><p>only</p></div>', regions=('header',))
+
+    assert soup.select_one('.footer p').get_text() == 'only'
+    assert ParserEngine.region_misses == 1
+
+def test_strainers_are_reused_for_the_same_regions():
+    assert ParserEngine.strainer(('a', 'b')) is ParserEngine.strainer(['b', 'a'])
+
+# every scraper must extract the same record whichever tree builder produced the soup, and whether it holds the whole
+# page or only the regions the scraper declared. html.parser over the whole page is the reference
+PARSES = [
+    (ParserEngine.FAST_BACKEND, False),
+    (ParserEngine.FAST_BACKEND, True),
+    (ParserEngine.FALLBACK_BACKEND, True),
+]
+
+@pytest.mark.parametrize("backend, strained", PARSES)
+@pytest.mark.parametrize("directory_fixture", [
+    'club_directory_page_1.html',
+    'club_directory_page_2.html',
+    'club_directory_page_3.html',
+])
+@pytest.mark.asyncio
+async def test_club_data_parity(backend, strained, directory_fixture):
+    pytest.importorskip('lxml')
+    record = await scrape_club(backend, directory_fixture, strained)
+    assert record == await scrape_club(ParserEngine.FALLBACK_BACKEND, directory_fixture)
+    assert (record['get_club_name'], record['get_establishment_year']) == ('Arsenal', '1886')
+    assert record['get_stadium_name'] == 'Emirates Stadium'
+
+@pytest.mark.parametrize("backend, strained", PARSES)
+@pytest.mark.asyncio
+async def test_player_data_parity(backend, strained):
+    pytest.importorskip('lxml')
+    record = await scrape_player(backend, strained)
+    assert record == await scrape_player(ParserEngine.FALLBACK_BACKEND)
+    assert (record['firstname'], record['lastname']) == ('Declan', 'Rice')
+
+@pytest.mark.parametrize("backend, strained", PARSES)
+@pytest.mark.asyncio
+async def test_squad_page_url_parity(backend, strained):
+    pytest.importorskip('lxml')
+    url = await scrape_squad_page_url(backend, strained)
+    assert url == await scrape_squad_page_url(ParserEngine.FALLBACK_BACKEND)
+
+@pytest.mark.parametrize("backend, strained", PARSES)
+@pytest.mark.asyncio
+async def test_club_urls_parity(backend, strained):
+    pytest.importorskip('lxml')
+    records = await scrape_club_urls(backend, strained)
+    assert records == await scrape_club_urls(ParserEngine.FALLBACK_BACKEND)
+    assert len(records) == 2
+
+@pytest.mark.parametrize("backend, strained", PARSES)
+@pytest.mark.asyncio
+async def test_tables_data_parity(backend, strained):
+    pytest.importorskip('lxml')
+    records = await scrape_tables(backend, strained)
+    assert records == await scrape_tables(ParserEngine.FALLBACK_BACKEND)
+    assert len(records) == 2
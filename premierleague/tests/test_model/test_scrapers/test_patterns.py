@@ -0,0 +1,41 @@
+import re
+import pytest
+from model.scrapers.patterns import Patterns, Selectors
+from model.scrapers.club_urls_scraper import ClubUrlsScraper
+from model.scrapers.tables_data_scraper import TablesDataScraper
+from tests.benchmarks import bench_patterns
+
+def test_patterns_are_compiled_at_import():
+    patterns = [value for name, value in vars(Patterns).items() if name.isupper()]
+
+    assert patterns
+    assert all(isinstance(pattern, re.Pattern) for pattern in patterns)
+
+@pytest.mark.parametrize("pattern, text, expected", [
+    (Patterns.CLUB_ID, "https://www.premierleague.com/clubs/12/Liverpool/overview", "12"),
+    (Patterns.MATCHWEEK_ID, "https://www.premierleague.com/matchweek/7/blog", "7"),
+    (Patterns.NUMBER, "Matchweek 31", "31"),
+])
+def test_extraction_patterns(pattern, text, expected):
+    match = pattern.search(text)
+    assert (match.group(1) if match.re.groups else match.group()) == expected
+
+def test_referee_prefix_is_removed():
+    assert Patterns.REFEREE_PREFIX.sub('', '  Ref: Michael Oliver') == 'Michael Oliver'
+
+@pytest.mark.parametrize("title", ["Head Coach", "first-team manager", "MANAGER"])
+def test_manager_title_matches_whole_titles_only(title):
+    assert Patterns.MANAGER_TITLE.match(title)
+    assert not Patterns.MANAGER_TITLE.match("Assistant " + title)
+
+def test_selectors_are_compiled_once():
+    assert Selectors.compile('td:nth-child(3)') is Selectors.compile('td:nth-child(3)')
+    assert TablesDataScraper.COLUMN_SELECTORS['played'] is Selectors.compile('td:nth-child(3)')
+    assert ClubUrlsScraper.CLUB_LINK_SELECTOR is Selectors.compile('.club-cards-wrapper .club-list .club-card-wrapper a')
+
+def test_benchmark_runs_on_a_small_batch():
+    results = bench_patterns.run(batch_size=50)
+
+    assert set(results) == {'validate', 'extract_ids', 'select_cell'}
+    for result in results.values():
+        assert result['inline_ns'] > 0 and result['precompiled_ns'] > 0
@@ -2,8 +2,18 @@ import pytest
 from unittest.mock import patch, AsyncMock, MagicMock
 from bs4 import BeautifulSoup
 from model.scrapers.player_data_scraper import PlayerDataScraper
+from model.scrapers.parse_executor import ParseExecutor
+from model.scrapers.request_queue import Priority
 from tests.utils import load_fixture
 
+@pytest.fixture(autouse=True)
+def parse_inline():
+    # the parse pool would have to pickle the patched extractor, parsing on the loop keeps the mocks in this process
+    ParseExecutor.reset()
+    ParseExecutor().configure(workers=0)
+    yield
+    ParseExecutor.reset()
+
 @pytest.fixture
 def player_page():
     return load_fixture('player_page.html')
@@ -31,10 +41,10 @@ def test_invalid_url_raises_exception(mock_validator):
         PlayerDataScraper("invalid_url")
 
 @pytest.mark.asyncio
-@patch('model.scrapers.player_data_scraper.BeautifulSoup')
+@patch('model.scrapers.player_data_scraper.extract_player_page')
 @patch('model.scrapers.player_data_scraper.RequestHandler.__new__')
 @patch('model.scrapers.player_data_scraper.UrlValidator')
-async def test_initialize_sets_up_scraper(mock_validator, mock_request_handler_cls, mock_beautifulsoup):
+async def test_initialize_sets_up_scraper(mock_validator, mock_request_handler_cls, mock_extract):
     # Mock URL validation
     mock_validator.validate_player_page_url.return_value = True
 
@@ -44,9 +54,9 @@ async def test_initialize_sets_up_scraper(mock_validator, mock_request_handler_c
     mock_handler.get.return_value = fake_html
     mock_request_handler_cls.return_value = mock_handler
 
-    # Setup mock BeautifulSoup
-    mock_soup_instance = MagicMock(spec=BeautifulSoup)
-    mock_beautifulsoup.return_value = mock_soup_instance
+    # Setup mock extractor
+    extracted_page = {'firstname': 'John'}
+    mock_extract.return_value = extracted_page
 
     # Create and initialize the scraper
     scraper = PlayerDataScraper("https://valid-url.com/player")
@@ -57,11 +67,10 @@ async def test_initialize_sets_up_scraper(mock_validator, mock_request_handler_c
     mock_request_handler_cls.assert_called_once()
     mock_handler.configure.assert_awaited_once()
     mock_handler.get.assert_awaited_once_with("https://valid-url.com/player")
-    mock_beautifulsoup.assert_called_once_with(fake_html, 'html.parser')
+    mock_extract.assert_called_once_with(fake_html)
 
     assert scraper._initialized is True
-    assert 'main' in scraper._structures
-    assert scraper._structures['main'] is mock_soup_instance
+    assert scraper._page is extracted_page
 
 
 @pytest.mark.asyncio
@@ -160,9 +169,7 @@ async def test_get_methods_return_cached_value(key, method_name, fake_value):
 def setup_scraper(player_page_html):
     scraper = PlayerDataScraper("https://valid.com/player")
     scraper._initialized = True
-    scraper._structures = {
-        'main': BeautifulSoup(player_page_html, 'html.parser'),
-    }
+    scraper._page = PlayerDataScraper.PLAYER_PAGE_SCHEMA.extract(BeautifulSoup(player_page_html, 'html.parser'))
     return scraper
 
 @pytest.mark.asyncio
@@ -269,4 +276,12 @@ async def test_get_picture(mock_request_handler, player_page):
         picture = await scraper.get_picture()
         assert picture == b"fakebytes"
         assert scraper.player_data['picture'] == b"fakebytes"
-        mock_handler_instance.get.assert_awaited_once_with(url="https://resources.premierleague.com/premierleague/photos/players/250x250/p204480.png", raw=True)
\ No newline at end of file
+        mock_handler_instance.get.assert_awaited_once_with(url="https://resources.premierleague.com/premierleague/photos/players/250x250/p204480.png", raw=True, priority=Priority.BULK, max_size=PlayerDataScraper.MAX_PICTURE_SIZE)
+
+@pytest.mark.asyncio
+async def test_missing_field_raises_value_error():
+    with patch('model.scrapers.player_data_scraper.UrlValidator.validate_player_page_url', return_value=True):
+        scraper = setup_scraper('<html><body></body></html>')
+
+        with pytest.raises(ValueError, match="firstname"):
+            await scraper.get_firstname()
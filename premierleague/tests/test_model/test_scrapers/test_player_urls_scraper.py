@@ -3,6 +3,7 @@ import pytest
 from unittest.mock import patch, AsyncMock, Mock, MagicMock
 from bs4 import BeautifulSoup
 from model.scrapers.player_urls_scraper import PlayerUrlsScraper
+from model.scrapers.parser_engine import ParserEngine
 from tests.utils import load_fixture
 
 @pytest.fixture
@@ -11,7 +12,7 @@ def club_page():
 
 @pytest.mark.asyncio
 @patch('model.scrapers.player_urls_scraper.UrlValidator.validate_squad_page_url', return_value=True)
-@patch('model.scrapers.player_urls_scraper.BeautifulSoup')
+@patch('model.scrapers.parser_engine.BeautifulSoup')
 @patch('model.scrapers.player_urls_scraper.RequestHandler')
 async def test_initialize_behavior(mock_request_handler_class, mock_bs_constructor, mock_validate_url):
     HTML_WITH_PLAYERS = '''
@@ -42,7 +43,7 @@ async def test_initialize_behavior(mock_request_handler_class, mock_bs_construct
     mock_validate_url.assert_called_once_with(url)
     mock_request_handler.configure.assert_awaited_once()
     mock_request_handler.get.assert_awaited_once_with(url)
-    mock_bs_constructor.assert_called_once_with(HTML_WITH_PLAYERS, 'html.parser')
+    mock_bs_constructor.assert_called_once_with(HTML_WITH_PLAYERS, ParserEngine.backend, parse_only=ParserEngine.strainer(PlayerUrlsScraper.SQUAD_PAGE_REGIONS))
     assert scraper._initialized is True
     assert scraper.structure == mock_soup
     assert scraper._request_handler is mock_request_handler
@@ -1,7 +1,8 @@
 import pytest, random, asyncio
 # import asyncio
 from unittest.mock import MagicMock, AsyncMock, patch, call
-from model.scrapers.request_handler import PlaywrightRequestHandler, signal
+from model.scrapers.request_handler import PlaywrightRequestHandler, PlaywrightError, signal
+from model.scrapers.browser_pool import PooledBrowser, PooledPage
 
 @pytest.fixture(autouse=True)
 def reset_singleton():
@@ -34,9 +35,8 @@ async def test_configure_sets_required_attributes():
     assert hasattr(handler, "queue"), "Queue not initialized"
     assert isinstance(handler.queue, asyncio.Queue), "Queue is not an instance of asyncio.Queue"
     
-    assert hasattr(handler, "_schedular_task"), "Scheduler task not created"
-    assert hasattr(handler, "_batch_size"), "_batch_size not initialized"
-    assert 3 <= handler._batch_size <= 5, "_batch_size not in expected range"
+    assert hasattr(handler, "_scheduler_task"), "Scheduler task not created"
+    assert handler.max_concurrency == handler.browser_pool.capacity, "Concurrency not sized to the browser pool"
 
     assert hasattr(handler, "_shutdown_started"), "_shutdown_started not set"
     assert handler._shutdown_started is False, "_shutdown_started should initially be False"
@@ -57,7 +57,7 @@ async def test_goto_raises_error_if_not_configured():
 async def test_goto_adds_task_and_executes_it():
     handler = PlaywrightRequestHandler()
     await handler.configure()
-    handler._schedular_task.cancel()
+    handler._scheduler_task.cancel()
 
     page = AsyncMock()
     page.goto = AsyncMock()
@@ -71,20 +71,20 @@ async def test_goto_adds_task_and_executes_it():
 
     await task  # Ensure final await resolves
 
-    page.goto.assert_awaited_once_with("http://example.com")
+    page.goto.assert_awaited_once_with("http://example.com", wait_until="domcontentloaded")
 
 
 @pytest.mark.asyncio
 async def test_goto_waits_until_page_load_completes():
     handler = PlaywrightRequestHandler()    
     await handler.configure()
-    handler._schedular_task.cancel()
+    handler._scheduler_task.cancel()
 
     page = AsyncMock()
 
     signal = asyncio.Event()
 
-    async def fake_goto(url):
+    async def fake_goto(url, **kwargs):
         await signal.wait()  # Pause until we say so
         return None
 
@@ -107,90 +107,76 @@ async def test_goto_waits_until_page_load_completes():
     await task
 
     assert task.done()
-    page.goto.assert_awaited_once_with("http://example.com")
+    page.goto.assert_awaited_once_with("http://example.com", wait_until="domcontentloaded")
 
 # =================== Test _scheduler() method ====================
 
 @pytest.mark.asyncio
-async def test_scheduler_processes_batch_and_sleeps():
+async def test_scheduler_runs_navigations_up_to_max_concurrency_without_pausing():
     handler = PlaywrightRequestHandler()
-    await handler.configure()
-    handler._batch_size = 3
-    handler._schedular_task.cancel()
-
-    executed = []
-
-    def mock_task_maker(index):
-        async def task():
-            executed.append(index)
-        return task
-
-    # Add 3 mock coroutines to the queue
-    for i in range(3):
-        coro = mock_task_maker(i)
-        handler.queue.put_nowait(coro())
-
-    # Patch batch size and delay to fixed values
-    with patch("random.randint", side_effect=[3, 5]), \
-         patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
-
-        # Run scheduler in a background task and cancel after one cycle
-        try:
-            await asyncio.wait_for(handler._scheduler(), timeout=0.1)
-        except:
-            pass
-
-        # Validate task execution
-        assert set(executed) == {0, 1, 2}
-        assert mock_sleep.call_args_list[-1] == call(5)
+    await handler.configure(browser_pool=MagicMock(), max_concurrency=2)
+
+    release = asyncio.Event()
+    started = []
+
+    def navigation(index):
+        async def run():
+            started.append(index)
+            await release.wait()
+        return run
+
+    for index in range(3):
+        handler.queue.put_nowait(navigation(index)())
+    await asyncio.sleep(0.05)
+    assert started == [0, 1]
+
+    # a finished navigation frees its slot for the next one straight away, no sleep between batches
+    with patch("model.scrapers.request_handler.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        release.set()
+        await asyncio.wait_for(handler.queue.join(), timeout=1)
+    assert started == [0, 1, 2]
+    mock_sleep.assert_not_awaited()
+    handler._scheduler_task.cancel()
 
 @pytest.mark.asyncio
-async def test_scheduler_handles_timeout_gracefully():
+async def test_configure_falls_back_to_default_concurrency_without_pool_capacity():
     handler = PlaywrightRequestHandler()
-    await handler.configure()
-
-    with patch("asyncio.wait_for", side_effect=asyncio.TimeoutError), \
-     patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep, \
-     patch("random.randint", return_value=3):
-
-        scheduler_task = asyncio.create_task(handler._scheduler())
-        await asyncio.sleep(0.1)
-        if scheduler_task.done():
-            potential_exc = scheduler_task.exception()
-            if potential_exc and isinstance(potential_exc, asyncio.TimeoutError):
-                pytest.fail()
-        scheduler_task.cancel()
+    await handler.configure(browser_pool=MagicMock())
+    handler._scheduler_task.cancel()
 
-        # Verify it handled the timeout gracefully and tried to sleep briefly
-        mock_sleep.assert_called()
+    assert handler.max_concurrency == PlaywrightRequestHandler.DEFAULT_MAX_CONCURRENCY
 
 @pytest.mark.asyncio
-async def test_scheduler_random_batch_and_delay_every_cycle():
-    
+async def test_goto_waits_for_host_token_before_navigating():
     handler = PlaywrightRequestHandler()
-    handler._is_configured = True
-    handler._batch_size = 5
-    handler.queue = asyncio.Queue()
+    await handler.configure(browser_pool=MagicMock())
+    handler._scheduler_task.cancel()
+    gate = asyncio.Event()
 
-    for _ in range(5):
-        handler.queue.put_nowait(AsyncMock()())
+    async def acquire(url):
+        await gate.wait()
+    handler._rate_limiter = MagicMock()
+    handler._rate_limiter.acquire = AsyncMock(side_effect=acquire)
+    page = AsyncMock()
 
-    with patch("model.scrapers.request_handler.random.randint", side_effect=[4, 7, 3, 6]), \
-         patch("model.scrapers.request_handler.asyncio.sleep", new_callable=AsyncMock), \
-         patch("model.scrapers.request_handler.asyncio.gather", wraps=asyncio.gather, new_callable=AsyncMock):
+    task = asyncio.create_task(handler.goto(page, "http://example.com"))
+    navigation = asyncio.create_task(await handler.queue.get())
+    await asyncio.sleep(0.05)
+    page.goto.assert_not_awaited()
 
-        scheduler_task = asyncio.create_task(handler._scheduler())
+    gate.set()
+    await navigation
+    await task
+    handler._rate_limiter.acquire.assert_awaited_once_with("http://example.com")
+    page.goto.assert_awaited_once()
 
-        try:
-            await asyncio.wait_for(scheduler_task, timeout=0.05)
-        except asyncio.TimeoutError:
-            pass
+@pytest.mark.asyncio
+async def test_configure_can_disable_rate_limit():
+    handler = PlaywrightRequestHandler()
+    await handler.configure(browser_pool=MagicMock(), rate=False)
+    handler._scheduler_task.cancel()
 
-        # Check randint was used for batch size and delay
-        # Every cycle calls randint twice: once for batch size, once for delay
-        # So we expect randint to be called multiple times
-        
-        assert handler._batch_size in [3, 4]
+    assert handler._rate_limiter is None
 
 # ================= Test shutdown() method behavior ==================
 
@@ -332,3 +318,368 @@ async def test_sync_shutdown_fallback_runs_shutdown_directly():
         mock_run.assert_called_once()
         coroutine = mock_run.call_args[0][0]
         assert coroutine.cr_code == handler.shutdown().cr_code
+
+# =================== Test browser pool integration ====================
+
+def test_page_raises_error_if_not_configured():
+    handler = PlaywrightRequestHandler()
+    handler._is_configured = False
+
+    with pytest.raises(RuntimeError, match="not configured yet"):
+        handler.page()
+
+@pytest.mark.asyncio
+async def test_page_leases_from_browser_pool_and_applies_profile():
+    page = MagicMock()
+    page.route = AsyncMock()
+    pool = MagicMock()
+    pool.page.return_value.__aenter__ = AsyncMock(return_value=page)
+    pool.page.return_value.__aexit__ = AsyncMock(return_value=None)
+    handler = PlaywrightRequestHandler()
+    await handler.configure(browser_pool=pool)
+    handler._scheduler_task.cancel()
+
+    async with handler.page() as leased:
+        assert leased is page
+
+    page.route.assert_awaited_once()
+    page.set_default_navigation_timeout.assert_called_once_with(30000)
+    page.set_default_timeout.assert_called_once_with(15000)
+    pool.page.return_value.__aexit__.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_goto_records_navigation_in_browser_pool():
+    pool = MagicMock()
+    handler = PlaywrightRequestHandler()
+    await handler.configure(browser_pool=pool)
+    handler._scheduler_task.cancel()
+    page = AsyncMock()
+
+    task = asyncio.create_task(handler.goto(page, "http://example.com"))
+    await (await handler.queue.get())
+    await task
+
+    pool.record_navigation.assert_called_once_with(page)
+
+@pytest.mark.asyncio
+async def test_shutdown_closes_browser_pool():
+    pool = MagicMock()
+    pool.close = AsyncMock()
+    handler = PlaywrightRequestHandler()
+    await handler.configure(browser_pool=pool)
+    handler._scheduler_task.cancel()
+
+    await handler.shutdown()
+
+    pool.close.assert_awaited_once()
+
+# =================== Test navigation profile ====================
+
+@pytest.mark.asyncio
+async def test_apply_profile_routes_requests_through_profile():
+    handler = PlaywrightRequestHandler()
+    await handler.configure(browser_pool=MagicMock())
+    handler._scheduler_task.cancel()
+    page = AsyncMock()
+
+    await handler.apply_profile(page)
+
+    page.route.assert_awaited_once_with("**/*", handler.navigation_profile.handle_route)
+
+@pytest.mark.asyncio
+async def test_apply_profile_skips_routing_for_unrestricted_profile():
+    from model.scrapers.navigation_profile import NavigationProfile
+
+    handler = PlaywrightRequestHandler()
+    await handler.configure(browser_pool=MagicMock(), navigation_profile=NavigationProfile.unrestricted())
+    handler._scheduler_task.cancel()
+    page = AsyncMock()
+
+    await handler.apply_profile(page)
+
+    page.route.assert_not_awaited()
+
+@pytest.mark.asyncio
+async def test_goto_waits_for_selector_when_requested():
+    handler = PlaywrightRequestHandler()
+    await handler.configure(browser_pool=MagicMock())
+    handler._scheduler_task.cancel()
+    page = AsyncMock()
+
+    task = asyncio.create_task(handler.goto(page, "http://example.com", wait_for=".mc-summary__score"))
+    await (await handler.queue.get())
+    await task
+
+    page.goto.assert_awaited_once_with("http://example.com", wait_until="domcontentloaded")
+    page.wait_for_selector.assert_awaited_once_with(".mc-summary__score", state="attached")
+
+# =================== Test deadlines and crash recovery ====================
+
+@pytest.mark.asyncio
+async def test_configure_accepts_custom_deadlines():
+    handler = PlaywrightRequestHandler()
+    await handler.configure(browser_pool=MagicMock(), navigation_timeout=60, action_timeout=5)
+    handler._scheduler_task.cancel()
+    page = MagicMock()
+
+    handler.apply_deadlines(page)
+
+    page.set_default_navigation_timeout.assert_called_once_with(60000)
+    page.set_default_timeout.assert_called_once_with(5000)
+
+def leased_page(browser):
+    page = MagicMock()
+    page.goto = AsyncMock()
+    page.route = AsyncMock()
+    return PooledPage(page, PooledBrowser(browser))
+
+@pytest.mark.asyncio
+async def test_goto_requeues_navigation_interrupted_by_a_crash():
+    browser = MagicMock()
+    browser.is_connected.return_value = True
+    leased = leased_page(browser)
+    crashed_page = leased.page
+    crashed_page.goto.side_effect = PlaywrightError("Navigation failed because page crashed!")
+    fresh_page = MagicMock()
+    fresh_page.goto = AsyncMock()
+    fresh_page.route = AsyncMock()
+
+    pool = MagicMock()
+    pool.renew = AsyncMock(side_effect=lambda page: page._swap(fresh_page, page.entry))
+    handler = PlaywrightRequestHandler()
+    await handler.configure(browser_pool=pool)
+    handler._scheduler_task.cancel()
+
+    task = asyncio.create_task(handler.goto(leased, "http://example.com"))
+    await (await handler.queue.get())
+    assert not task.done()
+    await (await handler.queue.get())
+    await task
+
+    pool.renew.assert_awaited_once_with(leased)
+    fresh_page.goto.assert_awaited_once_with("http://example.com", wait_until="domcontentloaded")
+    fresh_page.set_default_timeout.assert_called_once_with(15000)
+    pool.record_navigation.assert_called_once_with(leased)
+    assert handler.recovered_navigations == 1
+
+@pytest.mark.asyncio
+async def test_goto_gives_up_after_max_recoveries():
+    browser = MagicMock()
+    browser.is_connected.return_value = False
+    leased = leased_page(browser)
+    leased.page.goto.side_effect = PlaywrightError("Target page, context or browser has been closed")
+
+    pool = MagicMock()
+    pool.renew = AsyncMock()
+    handler = PlaywrightRequestHandler()
+    await handler.configure(browser_pool=pool, max_recoveries=1)
+    handler._scheduler_task.cancel()
+
+    task = asyncio.create_task(handler.goto(leased, "http://example.com"))
+    await (await handler.queue.get())
+    await (await handler.queue.get())
+
+    with pytest.raises(PlaywrightError):
+        await task
+    pool.renew.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_crash_recovery_does_not_hold_up_navigations_queued_behind_it():
+    browser = MagicMock()
+    browser.is_connected.return_value = False
+    crashed = leased_page(browser)
+    crashed.page.goto.side_effect = PlaywrightError("Target page, context or browser has been closed")
+    # the other page on the dead browser is still leased, so no fresh page is free until it is returned
+    queued = leased_page(browser)
+    queued_returned = asyncio.Event()
+    queued.page.goto.side_effect = lambda *args, **kwargs: queued_returned.set()
+    fresh_page = MagicMock()
+    fresh_page.goto = AsyncMock()
+    fresh_page.route = AsyncMock()
+
+    async def renew(page):
+        await queued_returned.wait()
+        page._swap(fresh_page, PooledBrowser(MagicMock()))
+
+    pool = MagicMock()
+    pool.renew = AsyncMock(side_effect=renew)
+    handler = PlaywrightRequestHandler()
+    await handler.configure(browser_pool=pool)
+    handler._scheduler_task.cancel()
+
+    crashed_navigation = asyncio.create_task(handler.goto(crashed, "http://example.com/1"))
+    queued_navigation = asyncio.create_task(handler.goto(queued, "http://example.com/2"))
+    first, second = await handler.queue.get(), await handler.queue.get()
+
+    # the crashed navigation hands its error back instead of waiting for a fresh page in the scheduler
+    await asyncio.wait_for(first, timeout=1)
+    await asyncio.wait_for(second, timeout=1)
+    await queued_navigation
+    await asyncio.wait_for(await handler.queue.get(), timeout=1)
+    await crashed_navigation
+
+    fresh_page.goto.assert_awaited_once_with("http://example.com/1", wait_until="domcontentloaded")
+    assert handler.recovered_navigations == 1
+
+@pytest.mark.asyncio
+async def test_crash_recovery_gives_up_when_no_fresh_page_comes_in_time():
+    browser = MagicMock()
+    browser.is_connected.return_value = False
+    leased = leased_page(browser)
+    leased.page.goto.side_effect = PlaywrightError("Target page, context or browser has been closed")
+
+    async def renew(page):
+        await asyncio.Event().wait()
+
+    pool = MagicMock()
+    pool.renew = AsyncMock(side_effect=renew)
+    handler = PlaywrightRequestHandler()
+    await handler.configure(browser_pool=pool, navigation_timeout=0.05)
+    handler._scheduler_task.cancel()
+
+    task = asyncio.create_task(handler.goto(leased, "http://example.com"))
+    await (await handler.queue.get())
+
+    with pytest.raises(PlaywrightError):
+        await asyncio.wait_for(task, timeout=1)
+    assert handler.queue.empty()
+
+@pytest.mark.asyncio
+async def test_goto_does_not_recover_from_timeouts():
+    browser = MagicMock()
+    browser.is_connected.return_value = True
+    leased = leased_page(browser)
+    leased.page.goto.side_effect = PlaywrightError("Timeout 30000ms exceeded.")
+
+    pool = MagicMock()
+    pool.renew = AsyncMock()
+    handler = PlaywrightRequestHandler()
+    await handler.configure(browser_pool=pool)
+    handler._scheduler_task.cancel()
+
+    task = asyncio.create_task(handler.goto(leased, "http://example.com"))
+    await (await handler.queue.get())
+
+    with pytest.raises(PlaywrightError, match="Timeout"):
+        await task
+    pool.renew.assert_not_awaited()
+    assert handler.queue.empty()
+
+# =================== Test lifecycle across runs ====================
+
+def closing_pool():
+    pool = MagicMock()
+    pool.close = AsyncMock()
+    return pool
+
+def test_configure_rebuilds_on_a_new_event_loop():
+    handler = PlaywrightRequestHandler()
+
+    async def run():
+        await handler.configure()
+        return handler._scheduler_task, handler.browser_pool, handler.queue
+
+    first_task, first_pool, first_queue = asyncio.run(run())
+    second_task, second_pool, second_queue = asyncio.run(run())
+
+    assert first_task is not second_task
+    assert first_pool is not second_pool
+    assert first_queue is not second_queue
+    assert first_task.done()
+
+@pytest.mark.asyncio
+async def test_configure_on_the_same_loop_keeps_scheduler_and_settings():
+    pool = closing_pool()
+    handler = PlaywrightRequestHandler()
+    await handler.configure(browser_pool=pool, navigation_timeout=45)
+    task = handler._scheduler_task
+
+    await handler.configure()
+
+    assert handler._scheduler_task is task
+    assert handler.browser_pool is pool
+    assert handler.navigation_timeout == 45
+    await handler.shutdown()
+
+@pytest.mark.asyncio
+async def test_shutdown_drains_queued_navigations():
+    handler = PlaywrightRequestHandler()
+    await handler.configure(browser_pool=closing_pool())
+    page = AsyncMock()
+
+    navigation = asyncio.create_task(handler.goto(page, "http://example.com"))
+    await asyncio.sleep(0)
+    await handler.shutdown(drain_timeout=1)
+
+    await navigation
+    page.goto.assert_awaited_once_with("http://example.com", wait_until="domcontentloaded")
+    assert handler._scheduler_task.cancelled()
+    assert handler._is_configured is False
+
+@pytest.mark.asyncio
+async def test_shutdown_rejects_navigations_that_did_not_drain():
+    handler = PlaywrightRequestHandler()
+    await handler.configure(browser_pool=closing_pool())
+    handler._scheduler_task.cancel()
+    handler._scheduler_task = asyncio.create_task(asyncio.Event().wait())
+    page = AsyncMock()
+
+    navigation = asyncio.create_task(handler.goto(page, "http://example.com"))
+    await asyncio.sleep(0)
+    await handler.shutdown(drain_timeout=0.05)
+
+    with pytest.raises(RuntimeError, match="shut down before the navigation finished"):
+        await navigation
+    assert handler.queue.empty()
+    page.goto.assert_not_awaited()
+
+@pytest.mark.asyncio
+async def test_goto_is_refused_during_shutdown():
+    handler = PlaywrightRequestHandler()
+    await handler.configure(browser_pool=closing_pool())
+    handler._shutdown_started = True
+
+    with pytest.raises(RuntimeError, match="shutting down"):
+        await handler.goto(AsyncMock(), "http://example.com")
+    handler._scheduler_task.cancel()
+
+@pytest.mark.asyncio
+async def test_configure_after_shutdown_starts_a_new_scheduler():
+    handler = PlaywrightRequestHandler()
+    await handler.configure(browser_pool=closing_pool())
+    await handler.shutdown()
+
+    await handler.configure(browser_pool=closing_pool())
+
+    assert handler._is_configured is True
+    assert handler._shutdown_started is False
+    assert not handler._scheduler_task.done()
+    await handler.shutdown()
+
+@pytest.mark.asyncio
+async def test_handler_can_be_configured_again_after_shutdown():
+    handler = PlaywrightRequestHandler()
+    first_pool = closing_pool()
+    await handler.configure(browser_pool=first_pool)
+    await handler.shutdown()
+
+    with patch("model.scrapers.request_handler.BrowserPool", return_value=closing_pool()) as pool_class:
+        await handler.configure()
+
+    assert handler.browser_pool is pool_class.return_value
+    first_pool.close.assert_awaited_once()
+    await handler.shutdown()
+
+@pytest.mark.asyncio
+async def test_async_context_manager_configures_and_shuts_down():
+    pool = closing_pool()
+
+    with patch("model.scrapers.request_handler.BrowserPool", return_value=pool):
+        async with PlaywrightRequestHandler() as handler:
+            assert handler is PlaywrightRequestHandler()
+            assert handler._is_configured is True
+            task = handler._scheduler_task
+
+    assert task.cancelled()
+    assert handler._is_configured is False
+    pool.close.assert_awaited_once()
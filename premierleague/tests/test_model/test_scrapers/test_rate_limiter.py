@@ -0,0 +1,87 @@
+import pytest
+from unittest.mock import patch
+from model.scrapers.rate_limiter import TokenBucket, HostRateLimiter
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, delay):
+        self.now += delay
+
+@pytest.fixture
+def clock():
+    fake_clock = FakeClock()
+    with patch("model.scrapers.rate_limiter.time.monotonic", side_effect=fake_clock.monotonic), \
+         patch("model.scrapers.rate_limiter.asyncio.sleep", side_effect=fake_clock.sleep):
+        yield fake_clock
+
+@pytest.mark.parametrize("rate, burst", [(0, 1), (-1, 1), (1, 0)])
+def test_token_bucket_rejects_invalid_parameters(rate, burst):
+    with pytest.raises(ValueError):
+        TokenBucket(rate, burst)
+
+@pytest.mark.asyncio
+async def test_token_bucket_allows_burst_without_waiting(clock):
+    bucket = TokenBucket(rate=1, burst=3)
+
+    for _ in range(3):
+        await bucket.acquire()
+
+    assert clock.now == 0
+    assert bucket.tokens == pytest.approx(0)
+
+@pytest.mark.asyncio
+async def test_token_bucket_waits_for_steady_rate_after_burst(clock):
+    bucket = TokenBucket(rate=2, burst=1)
+
+    await bucket.acquire()
+    await bucket.acquire()
+    await bucket.acquire()
+
+    assert clock.now == pytest.approx(1.0)
+
+@pytest.mark.asyncio
+async def test_token_bucket_refills_up_to_burst_only(clock):
+    bucket = TokenBucket(rate=1, burst=2)
+    await bucket.acquire()
+    await bucket.acquire()
+
+    clock.now += 100
+
+    assert bucket.tokens == pytest.approx(2)
+
+def test_host_rate_limiter_creates_one_bucket_per_host():
+    limiter = HostRateLimiter(rate=1, burst=2)
+
+    first = limiter.bucket_for("https://www.premierleague.com/clubs")
+    second = limiter.bucket_for("https://www.premierleague.com/tables")
+    other = limiter.bucket_for("https://resources.premierleague.com/badge.png")
+
+    assert first is second
+    assert first is not other
+
+def test_host_rate_limiter_uses_host_specific_limits():
+    limiter = HostRateLimiter(rate=1, burst=2, host_limits={"resources.premierleague.com": (5, 10)})
+
+    bucket = limiter.bucket_for("https://resources.premierleague.com/badge.png")
+    default_bucket = limiter.bucket_for("https://www.premierleague.com/clubs")
+
+    assert (bucket.rate, bucket.burst) == (5, 10)
+    assert (default_bucket.rate, default_bucket.burst) == (1, 2)
+
+def test_host_rate_limiter_validates_host_limits_eagerly():
+    with pytest.raises(ValueError):
+        HostRateLimiter(rate=1, burst=2, host_limits={"example.com": (0, 1)})
+
+@pytest.mark.asyncio
+async def test_host_rate_limiter_hosts_do_not_share_tokens(clock):
+    limiter = HostRateLimiter(rate=1, burst=1)
+
+    await limiter.acquire("https://www.premierleague.com/clubs")
+    await limiter.acquire("https://resources.premierleague.com/badge.png")
+
+    assert clock.now == 0
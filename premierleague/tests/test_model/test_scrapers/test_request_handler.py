@@ -2,8 +2,15 @@ import pytest
 import signal
 import asyncio
 import concurrent.futures
+import aiohttp
 from unittest.mock import patch, MagicMock, AsyncMock, ANY
-from model.scrapers.request_handler import RequestHandler
+from model.scrapers.request_handler import RequestHandler, QueuedRequest, ResponseTooLargeError
+from model.scrapers.rate_limiter import HostRateLimiter
+from model.scrapers.response_cache import ResponseCache
+from model.scrapers.retry_policy import RetryPolicy
+from model.scrapers.concurrency_limiter import AdaptiveConcurrencyLimiter
+from model.scrapers.request_metrics import RequestMetrics
+from model.scrapers.request_queue import Priority, PriorityRequestQueue, request_priority
 
 # Fixture to reset singleton before each test
 @pytest.fixture(autouse=True)
@@ -47,10 +54,11 @@ async def test_configure_initializes_attributes():
         await handler.configure()
 
         assert handler._is_configured is True
-        assert isinstance(handler.queue, asyncio.Queue)
+        assert isinstance(handler.queue, PriorityRequestQueue)
         assert handler.session is mock_session.return_value
-        assert isinstance(handler._batch_size, int)
-        assert 3 <= handler._batch_size <= 5
+        assert isinstance(handler._rate_limiter, HostRateLimiter)
+        assert handler._rate_limiter.rate == RequestHandler.DEFAULT_RATE
+        assert handler._rate_limiter.burst == RequestHandler.DEFAULT_BURST
         assert isinstance(handler._scheduler_task, asyncio.Task)
         assert not handler._scheduler_task.done()
 
@@ -64,7 +72,7 @@ async def test_configure_does_not_reconfigure_on_second_call():
         session = handler.session
         queue = handler.queue
         scheduler_task = handler._scheduler_task
-        _batch_size = handler._batch_size
+        rate_limiter = handler._rate_limiter
 
         await handler.configure()  # Call again
 
@@ -72,7 +80,29 @@ async def test_configure_does_not_reconfigure_on_second_call():
         assert handler.session is session
         assert handler.queue is queue
         assert handler._scheduler_task is scheduler_task
-        assert handler._batch_size == _batch_size
+        assert handler._rate_limiter is rate_limiter
+
+@pytest.mark.asyncio
+async def test_configure_applies_rate_limit_parameters():
+    with patch("model.scrapers.request_handler.aiohttp.ClientSession", return_value=MagicMock()):
+        handler = RequestHandler()
+        await handler.configure(rate=2, burst=10, host_limits={"resources.premierleague.com": (4, 8)})
+
+        assert handler._rate_limiter.rate == 2
+        assert handler._rate_limiter.burst == 10
+        assert handler._rate_limiter.bucket_for("https://resources.premierleague.com/a.png").rate == 4
+
+@pytest.mark.asyncio
+async def test_configure_keeps_rate_limit_parameters_on_reconfigure():
+    with patch("model.scrapers.request_handler.aiohttp.ClientSession", return_value=AsyncMock()):
+        handler = RequestHandler()
+        await handler.configure(rate=3, burst=7)
+        handler._scheduler_loop = None  # simulate a new event loop
+
+        await handler.configure()
+
+        assert handler._rate_limiter.rate == 3
+        assert handler._rate_limiter.burst == 7
 
 @pytest.mark.asyncio
 async def test_configure_only_runs_once_even_with_multiple_calls():
@@ -81,7 +111,7 @@ async def test_configure_only_runs_once_even_with_multiple_calls():
 
         await asyncio.gather(handler.configure(), handler.configure(), handler.configure())
         assert handler._is_configured is True
-        assert isinstance(handler.queue, asyncio.Queue)
+        assert isinstance(handler.queue, PriorityRequestQueue)
         assert handler.session is mock_session.return_value
 
 # ====================== Test _register_shutdown_hooks() method ======================
@@ -228,79 +258,124 @@ async def test_shutdown_skips_if_session_missing():
     await handler.shutdown()  # Should not raise
 
 # ======================== Test _schedular() method behavior ========================
-    
+
+def queued_request(url, coro):
+    request = QueuedRequest(url, asyncio.get_running_loop().create_future())
+    request.coro = coro
+    return request
+
 @pytest.mark.asyncio
-async def test_scheduler_processes_batch_correctly():
+async def test_scheduler_dispatches_without_waiting_for_previous_requests():
     handler = RequestHandler()
     handler.queue = asyncio.Queue()
-    handler._batch_size = 3
+    handler._in_flight = set()
+    handler.concurrency = AdaptiveConcurrencyLimiter()
+    handler.metrics = RequestMetrics()
+    handler._rate_limiter = HostRateLimiter(rate=100, burst=3)
+
+    release = asyncio.Event()
+    started = []
+
+    async def slow_request(index):
+        started.append(index)
+        await release.wait()
+
+    for index in range(3):
+        handler.queue.put_nowait(queued_request(f"http://example.com/{index}", slow_request(index)))
+
+    task = asyncio.create_task(handler._scheduler())
+    await asyncio.sleep(0.05)
 
-    indexes = []
-    async def mock_task(index):
-        indexes.append(index)
+    # every request started although none of them has finished yet
+    assert started == [0, 1, 2]
+    assert len(handler._in_flight) == 3
 
-    mock_coros = [mock_task(index) for index in range(3)]
+    release.set()
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
 
-    for coro in mock_coros:
-        # These return a coroutine when called
-        await handler.queue.put(coro)
+@pytest.mark.asyncio
+async def test_scheduler_waits_for_token_before_dispatching():
+    handler = RequestHandler()
+    handler.queue = asyncio.Queue()
+    handler._in_flight = set()
+    handler.concurrency = AdaptiveConcurrencyLimiter()
+    handler.metrics = RequestMetrics()
+    handler._rate_limiter = MagicMock()
+    gate = asyncio.Event()
 
-    with patch("model.scrapers.request_handler.random.randint", side_effect=[3, 6]), \
-         patch("model.scrapers.request_handler.asyncio.sleep", new=AsyncMock()) as mock_sleep, \
-         patch("model.scrapers.request_handler.asyncio.gather", new=AsyncMock()) as mock_gather:
+    async def acquire(url):
+        await gate.wait()
+    handler._rate_limiter.acquire = acquire
 
-        # Run only 1 iteration using timeout to exit loop
-        async def limited_scheduler():
-            await asyncio.wait_for(handler._scheduler(), timeout=0.5)
+    executed = []
+    async def request():
+        executed.append(True)
 
-        with pytest.raises(asyncio.TimeoutError):
-            await limited_scheduler()
+    handler.queue.put_nowait(queued_request("http://example.com", request()))
+    task = asyncio.create_task(handler._scheduler())
+    await asyncio.sleep(0.05)
+    assert executed == []
 
-        assert mock_gather.called
-        assert mock_gather.call_count == 1
-        assert set(indexes) == {0, 1, 2}
-        assert mock_sleep.call_args_list[-1][0][0] == 6  # final delay sleep
+    gate.set()
+    await asyncio.sleep(0.05)
+    assert executed == [True]
 
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
 
 @pytest.mark.asyncio
-async def test_scheduler_handles_timeout_and_sleeps():
+async def test_scheduler_throttled_host_does_not_block_other_hosts():
     handler = RequestHandler()
     handler.queue = asyncio.Queue()
-    handler._batch_size = 3
+    handler._in_flight = set()
+    handler.concurrency = AdaptiveConcurrencyLimiter()
+    handler.metrics = RequestMetrics()
+    handler._rate_limiter = MagicMock()
+    gate = asyncio.Event()
 
-    with patch("model.scrapers.request_handler.asyncio.sleep", new_callable=AsyncMock) as mock_sleep, \
-         patch("model.scrapers.request_handler.random.randint", return_value=3), \
-         patch("model.scrapers.request_handler.asyncio.wait_for", side_effect=asyncio.TimeoutError):
+    async def acquire(url):
+        if "throttled.com" in url:
+            await gate.wait()
+    handler._rate_limiter.acquire = acquire
 
-        # Run _scheduler in background and let it hit the timeout path
-        task = asyncio.create_task(handler._scheduler())
+    executed = []
+    async def request(url):
+        executed.append(url)
 
-        # Give the event loop a chance to run the scheduler and hit sleep
-        await asyncio.sleep(0.1)
+    for url in ("http://throttled.com/1", "http://throttled.com/2", "http://example.com/1"):
+        handler.queue.put_nowait(queued_request(url, request(url)))
+    task = asyncio.create_task(handler._scheduler())
+    await asyncio.sleep(0.05)
 
-        task.cancel()
-        try:
-            await task
-        except asyncio.CancelledError:
-            pass
+    # the request queued behind the throttled host went out without waiting for its token
+    assert executed == ["http://example.com/1"]
+
+    gate.set()
+    await asyncio.sleep(0.05)
+    assert executed == ["http://example.com/1", "http://throttled.com/1", "http://throttled.com/2"]
 
-        mock_sleep.assert_any_call(0.1)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
 
 @pytest.mark.asyncio
 async def test_scheduler_cancellation():
     handler = RequestHandler()
     handler.queue = asyncio.Queue()
-    handler._batch_size = 2
+    handler._in_flight = set()
+    handler.concurrency = AdaptiveConcurrencyLimiter()
+    handler.metrics = RequestMetrics()
+    handler._rate_limiter = HostRateLimiter(rate=1, burst=1)
 
-    await handler.queue.put(lambda: AsyncMock())
-
-    with patch("model.scrapers.request_handler.asyncio.gather", new=AsyncMock()), \
-         patch("model.scrapers.request_handler.asyncio.sleep", new=AsyncMock()):
-        task = asyncio.create_task(handler._scheduler())
-        await asyncio.sleep(0.05)
-        task.cancel()
-        with pytest.raises(asyncio.CancelledError):
-            await task
+    task = asyncio.create_task(handler._scheduler())
+    await asyncio.sleep(0.05)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
 
 # ========================== Test get() method behavior ==========================
 
@@ -312,14 +387,23 @@ async def test_get_raises_before_configure():
 
 @pytest.mark.asyncio
 class MockResponse:
-    def __init__(self, data):
+    def __init__(self, data, status=200, headers=None):
         self._data = data
+        self.status = status
+        self.headers = headers or {}
+
+    def get_encoding(self):
+        return 'utf-8'
 
     async def text(self):
         return self._data
 
     async def read(self):
-        return self._data
+        return self._data.encode() if isinstance(self._data, str) else self._data
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise aiohttp.ClientResponseError(MagicMock(), (), status=self.status)
 
 class MockContextManager:
     def __init__(self, response):
@@ -334,7 +418,8 @@ class MockContextManager:
 @pytest.mark.asyncio
 async def test_get_returns_text_response():
     handler = RequestHandler()
-    await handler.configure()
+    await handler.configure(response_cache=False)
+    handler._scheduler_task.cancel()
 
     mock_response = MockResponse("mock page")
 
@@ -344,7 +429,7 @@ async def test_get_returns_text_response():
 
     # Trigger the request manually
     result_future = asyncio.create_task(handler.get("http://example.com"))
-    fetch = await handler.queue.get()
+    fetch = (await handler.queue.get()).coro
     await fetch  # Manually run the coroutine
 
     assert await result_future == "mock page"
@@ -352,7 +437,7 @@ async def test_get_returns_text_response():
 @pytest.mark.asyncio
 async def test_get_returns_raw_response():
     handler = RequestHandler()
-    await handler.configure()
+    await handler.configure(response_cache=False)
     handler._scheduler_task.cancel()
 
     mock_response = MockResponse(b"binary content")
@@ -361,7 +446,7 @@ async def test_get_returns_raw_response():
     handler.session = mock_session
 
     result_future = asyncio.create_task(handler.get("http://example.com", raw=True))
-    fetch = await handler.queue.get()
+    fetch = (await handler.queue.get()).coro
     await fetch
 
     assert await result_future == b"binary content"
@@ -378,7 +463,7 @@ class FailingContextManager:
 @pytest.mark.asyncio
 async def test_get_sets_exception_on_failure():
     handler = RequestHandler()
-    await handler.configure()
+    await handler.configure(response_cache=False)
     handler._scheduler_task.cancel()
 
     mock_session = MagicMock()
@@ -386,7 +471,7 @@ async def test_get_sets_exception_on_failure():
     handler.session = mock_session
 
     result_future = asyncio.create_task(handler.get("http://example.com"))
-    fetch = await handler.queue.get()
+    fetch = (await handler.queue.get()).coro
     await fetch
 
     with pytest.raises(Exception) as exc:
@@ -398,7 +483,7 @@ async def test_get_sets_exception_on_failure():
 @pytest.mark.asyncio
 async def test_multiple_concurrent_get_requests():
     handler = RequestHandler()
-    await handler.configure()
+    await handler.configure(response_cache=False)
     handler._scheduler_task.cancel()
 
     mock_response = MockResponse("OK")
@@ -409,9 +494,616 @@ async def test_multiple_concurrent_get_requests():
     urls = [f"http://example.com/{i}" for i in range(5)]
     tasks = [asyncio.create_task(handler.get(url)) for url in urls]
 
-    fetches = [await handler.queue.get() for _ in range(5)]
+    fetches = [(await handler.queue.get()).coro for _ in range(5)]
     for fetch in fetches:
         await fetch
 
     results = await asyncio.gather(*tasks)
-    assert results == ["OK"] * 5
\ No newline at end of file
+    assert results == ["OK"] * 5
+
+# ---- Test: response cache ----
+
+@pytest.fixture
+def response_cache(tmp_path):
+    cache = ResponseCache(tmp_path)
+    yield cache
+    cache.close()
+
+async def run_next_fetch(handler, request):
+    fetch = (await handler.queue.get()).coro
+    await fetch
+    return await request
+
+@pytest.mark.asyncio
+async def test_get_stores_response_with_validators(response_cache):
+    handler = RequestHandler()
+    await handler.configure(response_cache=response_cache)
+    handler._scheduler_task.cancel()
+
+    mock_session = MagicMock()
+    mock_session.get.return_value = MockContextManager(MockResponse("page", headers={"ETag": '"v1"'}))
+    handler.session = mock_session
+
+    result = await run_next_fetch(handler, asyncio.create_task(handler.get("http://example.com")))
+
+    assert result == "page"
+    entry = response_cache.lookup("http://example.com")
+    assert entry['etag'] == '"v1"'
+    assert response_cache.read_body(entry) == b"page"
+
+@pytest.mark.asyncio
+async def test_get_sends_conditional_request_and_serves_304_from_cache(response_cache):
+    response_cache.store("http://example.com", b"cached page", {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}, 'utf-8')
+
+    handler = RequestHandler()
+    await handler.configure(response_cache=response_cache)
+    handler._scheduler_task.cancel()
+
+    mock_session = MagicMock()
+    mock_session.get.return_value = MockContextManager(MockResponse("", status=304))
+    handler.session = mock_session
+
+    result = await run_next_fetch(handler, asyncio.create_task(handler.get("http://example.com")))
+
+    assert result == "cached page"
+    sent_headers = mock_session.get.call_args.kwargs['headers']
+    assert sent_headers['If-None-Match'] == '"v1"'
+    assert sent_headers['If-Modified-Since'] == "Mon, 01 Jan 2024 00:00:00 GMT"
+    assert response_cache.revalidated == 1
+
+@pytest.mark.asyncio
+async def test_get_serves_fresh_entry_without_request(tmp_path):
+    cache = ResponseCache(tmp_path, fresh_for=60)
+    cache.store("http://example.com", b"\x89PNG", {})
+
+    handler = RequestHandler()
+    await handler.configure(response_cache=cache)
+    handler._scheduler_task.cancel()
+    handler.session = MagicMock()
+
+    result = await handler.get("http://example.com", raw=True)
+
+    assert result == b"\x89PNG"
+    assert handler.queue.empty()
+    handler.session.get.assert_not_called()
+    cache.close()
+
+@pytest.mark.asyncio
+async def test_get_does_not_cache_error_responses(response_cache):
+    handler = RequestHandler()
+    await handler.configure(response_cache=response_cache)
+    handler._scheduler_task.cancel()
+
+    mock_session = MagicMock()
+    mock_session.get.return_value = MockContextManager(MockResponse("not found", status=404))
+    handler.session = mock_session
+
+    await run_next_fetch(handler, asyncio.create_task(handler.get("http://example.com")))
+
+    assert response_cache.lookup("http://example.com") is None
+
+@pytest.mark.asyncio
+async def test_get_raises_for_error_status_when_asked():
+    handler = RequestHandler()
+    await handler.configure(response_cache=False)
+    handler._scheduler_task.cancel()
+    handler.session = MagicMock()
+    handler.session.get.return_value = MockContextManager(MockResponse("not found", status=404))
+
+    assert await run_next_fetch(handler, asyncio.create_task(handler.get("http://example.com"))) == "not found"
+    with pytest.raises(aiohttp.ClientResponseError):
+        await run_next_fetch(handler, asyncio.create_task(handler.get("http://example.com", raise_for_status=True)))
+
+# ---- Test: request coalescing ----
+
+@pytest.mark.asyncio
+async def test_concurrent_gets_for_same_url_share_one_request():
+    handler = RequestHandler()
+    await handler.configure(response_cache=False)
+    handler._scheduler_task.cancel()
+
+    mock_session = MagicMock()
+    mock_session.get.return_value = MockContextManager(MockResponse("shared"))
+    handler.session = mock_session
+
+    tasks = [asyncio.create_task(handler.get("http://example.com")) for _ in range(3)]
+    await asyncio.sleep(0)
+
+    assert handler.queue.qsize() == 1
+    fetch = (await handler.queue.get()).coro
+    await fetch
+
+    assert await asyncio.gather(*tasks) == ["shared"] * 3
+    assert mock_session.get.call_count == 1
+    assert handler.coalesced_requests == 2
+
+@pytest.mark.asyncio
+async def test_get_after_completion_is_not_coalesced():
+    handler = RequestHandler()
+    await handler.configure(response_cache=False)
+    handler._scheduler_task.cancel()
+
+    mock_session = MagicMock()
+    mock_session.get.return_value = MockContextManager(MockResponse("OK"))
+    handler.session = mock_session
+
+    for _ in range(2):
+        task = asyncio.create_task(handler.get("http://example.com"))
+        fetch = (await handler.queue.get()).coro
+        await fetch
+        await task
+
+    assert mock_session.get.call_count == 2
+    assert handler.coalesced_requests == 0
+
+@pytest.mark.asyncio
+async def test_raw_and_text_gets_are_not_coalesced():
+    handler = RequestHandler()
+    await handler.configure(response_cache=False)
+    handler._scheduler_task.cancel()
+
+    text_task = asyncio.create_task(handler.get("http://example.com"))
+    raw_task = asyncio.create_task(handler.get("http://example.com", raw=True))
+    await asyncio.sleep(0)
+
+    assert handler.queue.qsize() == 2
+    text_task.cancel()
+    raw_task.cancel()
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_shared_request():
+    handler = RequestHandler()
+    await handler.configure(response_cache=False)
+    handler._scheduler_task.cancel()
+
+    mock_session = MagicMock()
+    mock_session.get.return_value = MockContextManager(MockResponse("OK"))
+    handler.session = mock_session
+
+    first = asyncio.create_task(handler.get("http://example.com"))
+    second = asyncio.create_task(handler.get("http://example.com"))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    fetch = (await handler.queue.get()).coro
+    await fetch
+
+    assert await second == "OK"
+
+# ---- Test: retries ----
+
+class SequenceSession:
+    closed = True
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def get(self, url, headers=None, timeout=None):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            class Failing:
+                async def __aenter__(self):
+                    raise outcome
+                async def __aexit__(self, *args):
+                    return None
+            return Failing()
+        return MockContextManager(outcome)
+
+@pytest.mark.asyncio
+async def test_get_retries_retryable_status_through_queue():
+    handler = RequestHandler()
+    await handler.configure(response_cache=False)
+    handler.retry_policy.compute_delay = MagicMock(return_value=0)
+    handler._scheduler_task.cancel()
+    handler.session = SequenceSession(MockResponse("busy", status=503), MockResponse("OK"))
+
+    task = asyncio.create_task(handler.get("http://example.com"))
+    fetch = (await handler.queue.get()).coro
+    await fetch
+    assert not task.done()
+
+    # the retry is put back on the queue instead of running inside the first fetch
+    retry = (await asyncio.wait_for(handler.queue.get(), timeout=1)).coro
+    await retry
+
+    assert await task == "OK"
+    assert handler.retries_used == 1
+    assert handler.session.calls == 2
+
+@pytest.mark.asyncio
+async def test_get_retries_transient_exceptions():
+    handler = RequestHandler()
+    await handler.configure(response_cache=False)
+    handler.retry_policy.compute_delay = MagicMock(return_value=0)
+    handler.session = SequenceSession(asyncio.TimeoutError(), MockResponse("OK"))
+
+    assert await asyncio.wait_for(handler.get("http://example.com"), timeout=2) == "OK"
+    await handler.shutdown()
+
+@pytest.mark.asyncio
+async def test_get_passes_retry_after_to_policy():
+    handler = RequestHandler()
+    await handler.configure(response_cache=False)
+    handler.retry_policy.compute_delay = MagicMock(return_value=0)
+    handler._scheduler_task.cancel()
+    handler.session = SequenceSession(MockResponse("slow down", status=429, headers={"Retry-After": "7"}), MockResponse("OK"))
+
+    task = asyncio.create_task(handler.get("http://example.com"))
+    fetch = (await handler.queue.get()).coro
+    await fetch
+
+    handler.retry_policy.compute_delay.assert_called_once_with(1, status=429, retry_after="7")
+    retry = (await handler.queue.get()).coro
+    await retry
+    await task
+
+@pytest.mark.asyncio
+async def test_get_raises_when_retry_budget_exhausted():
+    handler = RequestHandler()
+    await handler.configure(response_cache=False, retry_policy=RetryPolicy(budget=0))
+    handler._scheduler_task.cancel()
+    handler.session = SequenceSession(aiohttp.ClientConnectionError("reset"))
+
+    task = asyncio.create_task(handler.get("http://example.com"))
+    fetch = (await handler.queue.get()).coro
+    await fetch
+
+    with pytest.raises(aiohttp.ClientConnectionError):
+        await task
+    assert handler.retries_used == 0
+
+@pytest.mark.asyncio
+async def test_shutdown_cancels_pending_retry_timers():
+    handler = RequestHandler()
+    await handler.configure(response_cache=False)
+    handler.retry_policy.compute_delay = MagicMock(return_value=60)
+    handler._scheduler_task.cancel()
+    handler.session = SequenceSession(MockResponse("busy", status=503))
+
+    task = asyncio.create_task(handler.get("http://example.com"))
+    fetch = (await handler.queue.get()).coro
+    await fetch
+    timer = next(iter(handler._retry_timers))
+
+    handler.session = AsyncMock()
+    await handler.shutdown()
+
+    assert timer.cancelled()
+    task.cancel()
+
+# ---- Test: connection pool ----
+
+@pytest.mark.asyncio
+async def test_configure_builds_session_from_connection_pool():
+    pool = MagicMock()
+    handler = RequestHandler()
+
+    await handler.configure(response_cache=False, connection_pool=pool)
+
+    pool.create_session.assert_called_once()
+    assert handler.session is pool.create_session.return_value
+    handler._scheduler_task.cancel()
+
+# ---- Test: size-capped bodies ----
+
+class MockStreamContent:
+    def __init__(self, chunks):
+        self._chunks = chunks
+
+    async def iter_chunked(self, size):
+        for chunk in self._chunks:
+            yield chunk
+
+class MockStreamResponse(MockResponse):
+    def __init__(self, chunks, status=200, content_length=None):
+        super().__init__(b"".join(chunks), status=status)
+        self.content = MockStreamContent(chunks)
+        self.content_length = content_length
+
+@pytest.mark.asyncio
+async def test_get_with_max_size_reads_body_within_limit():
+    handler = RequestHandler()
+    await handler.configure(response_cache=False)
+    handler._scheduler_task.cancel()
+    handler.session = MagicMock()
+    handler.session.get.return_value = MockContextManager(MockStreamResponse([b"ab", b"cd", b"e"]))
+
+    body = await run_next_fetch(handler, asyncio.create_task(handler.get("http://example.com/image.png", raw=True, max_size=5)))
+
+    assert body == b"abcde"
+
+@pytest.mark.asyncio
+async def test_get_rejects_declared_content_length_over_limit():
+    handler = RequestHandler()
+    await handler.configure(response_cache=False)
+    handler._scheduler_task.cancel()
+    handler.session = MagicMock()
+    response = MockStreamResponse([b"x" * 10], content_length=10)
+    response.content = MagicMock()
+    handler.session.get.return_value = MockContextManager(response)
+
+    with pytest.raises(ResponseTooLargeError):
+        await run_next_fetch(handler, asyncio.create_task(handler.get("http://example.com/image.png", raw=True, max_size=5)))
+    response.content.iter_chunked.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_get_stops_reading_when_limit_exceeded():
+    handler = RequestHandler()
+    await handler.configure(response_cache=False)
+    handler._scheduler_task.cancel()
+    handler.session = MagicMock()
+    read = []
+
+    class CountingContent:
+        async def iter_chunked(self, size):
+            for chunk in (b"aaa", b"bbb", b"ccc"):
+                read.append(chunk)
+                yield chunk
+
+    response = MockStreamResponse([])
+    response.content = CountingContent()
+    handler.session.get.return_value = MockContextManager(response)
+
+    with pytest.raises(ResponseTooLargeError):
+        await run_next_fetch(handler, asyncio.create_task(handler.get("http://example.com/image.png", raw=True, max_size=5)))
+    assert read == [b"aaa", b"bbb"]
+
+@pytest.mark.asyncio
+async def test_get_applies_max_size_to_cached_bodies(tmp_path):
+    cache = ResponseCache(tmp_path, fresh_for=60)
+    cache.store("http://example.com/image.png", b"x" * 10, {})
+    handler = RequestHandler()
+    await handler.configure(response_cache=cache)
+    handler._scheduler_task.cancel()
+
+    with pytest.raises(ResponseTooLargeError):
+        await handler.get("http://example.com/image.png", raw=True, max_size=5)
+    assert await handler.get("http://example.com/image.png", raw=True) == b"x" * 10
+    cache.close()
+
+
+# ---- Test: timeouts and cancellation ----
+
+@pytest.mark.asyncio
+async def test_configure_sets_default_timeout():
+    handler = RequestHandler()
+    await handler.configure(response_cache=False, timeout=20)
+    handler._scheduler_task.cancel()
+
+    assert handler.timeout.total == 20
+    assert handler.timeout.connect == RequestHandler.DEFAULT_TIMEOUT.connect
+
+@pytest.mark.asyncio
+async def test_get_passes_per_request_timeout_to_session():
+    handler = RequestHandler()
+    await handler.configure(response_cache=False)
+    handler._scheduler_task.cancel()
+    handler.session = MagicMock()
+    handler.session.get.return_value = MockContextManager(MockResponse("OK"))
+
+    custom_timeout = aiohttp.ClientTimeout(total=5, connect=1, sock_read=2)
+    task = asyncio.create_task(handler.get("http://example.com/a", timeout=custom_timeout))
+    await (await handler.queue.get()).coro
+    await task
+    assert handler.session.get.call_args.kwargs['timeout'] is custom_timeout
+
+    task = asyncio.create_task(handler.get("http://example.com/b", timeout=3))
+    await (await handler.queue.get()).coro
+    await task
+    sent_timeout = handler.session.get.call_args.kwargs['timeout']
+    assert sent_timeout.total == 3
+    assert sent_timeout.sock_read == RequestHandler.DEFAULT_TIMEOUT.sock_read
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_removes_queued_request():
+    handler = RequestHandler()
+    await handler.configure(response_cache=False)
+    handler._scheduler_task.cancel()
+    handler._rate_limiter = HostRateLimiter(rate=100, burst=10)
+    handler.session = MagicMock()
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(handler.get("http://example.com"), timeout=0.01)
+
+    request = handler.queue.get_nowait()
+    assert request.future.cancelled()
+    assert "http://example.com" not in [key[0] for key in handler._pending_requests]
+
+    # the scheduler drops the abandoned request without sending it
+    handler.queue.put_nowait(request)
+    scheduler = asyncio.create_task(handler._scheduler())
+    await asyncio.sleep(0.05)
+    handler.session.get.assert_not_called()
+    scheduler.cancel()
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_aborts_in_flight_request():
+    handler = RequestHandler()
+    await handler.configure(response_cache=False)
+    handler._scheduler_task.cancel()
+    handler._rate_limiter = HostRateLimiter(rate=100, burst=10)
+
+    started = asyncio.Event()
+    aborted = asyncio.Event()
+
+    class HangingContextManager:
+        async def __aenter__(self):
+            started.set()
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                aborted.set()
+                raise
+
+        async def __aexit__(self, *args):
+            return None
+
+    handler.session = MagicMock()
+    handler.session.get.return_value = HangingContextManager()
+    handler._scheduler_task = asyncio.create_task(handler._scheduler())
+
+    caller = asyncio.create_task(handler.get("http://example.com"))
+    await asyncio.wait_for(started.wait(), timeout=1)
+    caller.cancel()
+
+    await asyncio.wait_for(aborted.wait(), timeout=1)
+    assert not handler._in_flight or all(task.done() for task in handler._in_flight)
+    handler._scheduler_task.cancel()
+
+@pytest.mark.asyncio
+async def test_request_continues_while_another_waiter_remains():
+    handler = RequestHandler()
+    await handler.configure(response_cache=False)
+    handler._scheduler_task.cancel()
+    handler.session = MagicMock()
+    handler.session.get.return_value = MockContextManager(MockResponse("OK"))
+
+    first = asyncio.create_task(handler.get("http://example.com"))
+    second = asyncio.create_task(handler.get("http://example.com"))
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+
+    request = await handler.queue.get()
+    assert not request.future.done()
+    await request.coro
+    assert await second == "OK"
+
+# ---- Test: priority scheduling ----
+
+@pytest.mark.asyncio
+async def test_requests_are_queued_with_their_priority():
+    handler = RequestHandler()
+    await handler.configure(response_cache=False)
+    handler._scheduler_task.cancel()
+    handler.session = MagicMock()
+
+    page = asyncio.create_task(handler.get("http://example.com/page"))
+    asset = asyncio.create_task(handler.get("http://example.com/logo.png", raw=True, priority=Priority.BULK))
+    await asyncio.sleep(0)
+
+    assert handler.queue.sizes() == {Priority.INTERACTIVE: 0, Priority.PAGE: 1, Priority.BULK: 1}
+    page.cancel()
+    asset.cancel()
+
+@pytest.mark.asyncio
+async def test_request_priority_context_overrides_defaults():
+    handler = RequestHandler()
+    await handler.configure(response_cache=False)
+    handler._scheduler_task.cancel()
+    handler.session = MagicMock()
+
+    token = request_priority.set(Priority.INTERACTIVE)
+    try:
+        task = asyncio.create_task(handler.get("http://example.com/logo.png", raw=True))
+    finally:
+        request_priority.reset(token)
+    await asyncio.sleep(0)
+
+    assert handler.queue.sizes()[Priority.INTERACTIVE] == 1
+    task.cancel()
+
+@pytest.mark.asyncio
+async def test_interactive_get_is_dispatched_ahead_of_bulk_backlog():
+    handler = RequestHandler()
+    await handler.configure(response_cache=False)
+    handler._scheduler_task.cancel()
+    handler.session = MagicMock()
+
+    backlog = [asyncio.create_task(handler.get(f"http://example.com/{index}.png", raw=True, priority=Priority.BULK)) for index in range(50)]
+    interactive = asyncio.create_task(handler.get("http://example.com/club", priority=Priority.INTERACTIVE))
+    await asyncio.sleep(0)
+
+    assert (await handler.queue.get()).url == "http://example.com/club"
+    for task in backlog + [interactive]:
+        task.cancel()
+
+@pytest.mark.asyncio
+async def test_coalesced_interactive_get_promotes_queued_request():
+    handler = RequestHandler()
+    await handler.configure(response_cache=False)
+    handler._scheduler_task.cancel()
+    handler.session = MagicMock()
+    handler.session.get.return_value = MockContextManager(MockResponse("OK"))
+
+    background = asyncio.create_task(handler.get("http://example.com", priority=Priority.BULK))
+    await asyncio.sleep(0)
+    foreground = asyncio.create_task(handler.get("http://example.com", priority=Priority.INTERACTIVE))
+    await asyncio.sleep(0)
+
+    assert handler.queue.sizes()[Priority.INTERACTIVE] == 1
+    await (await handler.queue.get()).coro
+    assert await asyncio.gather(background, foreground) == ["OK", "OK"]
+
+# ---- Test: adaptive concurrency ----
+
+@pytest.mark.asyncio
+async def test_scheduler_holds_requests_beyond_concurrency_limit():
+    handler = RequestHandler()
+    handler.queue = asyncio.Queue()
+    handler._in_flight = set()
+    handler.concurrency = AdaptiveConcurrencyLimiter(initial=2)
+    handler.metrics = RequestMetrics()
+    handler._rate_limiter = HostRateLimiter(rate=100, burst=10)
+
+    release = asyncio.Event()
+    started = []
+
+    async def slow_request(index):
+        started.append(index)
+        await release.wait()
+
+    for index in range(3):
+        handler.queue.put_nowait(queued_request(f"http://example.com/{index}", slow_request(index)))
+
+    task = asyncio.create_task(handler._scheduler())
+    await asyncio.sleep(0.05)
+    assert started == [0, 1]
+
+    release.set()
+    await asyncio.sleep(0.05)
+    assert started == [0, 1, 2]
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+@pytest.mark.asyncio
+async def test_throttled_response_lowers_concurrency_limit():
+    handler = RequestHandler()
+    await handler.configure(response_cache=False, concurrency=AdaptiveConcurrencyLimiter(initial=8), retry_policy=RetryPolicy(status_rules={}))
+    handler._rate_limiter = HostRateLimiter(rate=100, burst=10)
+    handler.session = MagicMock()
+    handler.session.get.return_value = MockContextManager(MockResponse("slow down", status=429))
+
+    await asyncio.wait_for(handler.get("http://example.com"), timeout=1)
+    await asyncio.sleep(0)
+
+    assert handler.concurrency.current_limit == 4
+    assert handler.concurrency.in_flight == 0
+    await handler.shutdown()
+
+# ---- Test: request metrics ----
+
+@pytest.mark.asyncio
+async def test_get_records_request_metrics():
+    handler = RequestHandler()
+    await handler.configure(response_cache=False, metrics=RequestMetrics())
+    handler._rate_limiter = HostRateLimiter(rate=100, burst=10)
+    handler.session = MagicMock()
+    handler.session.get.return_value = MockContextManager(MockResponse("<html></html>"))
+
+    await asyncio.wait_for(handler.get("https://www.premierleague.com/clubs/1/Arsenal/overview"), timeout=1)
+    await asyncio.sleep(0)
+
+    snapshot = handler.metrics.snapshot()
+    assert snapshot["requests"] == 1
+    assert snapshot["status_counts"] == {"200": 1}
+    assert snapshot["bytes_by_pattern"] == {"club": len("<html></html>")}
+    assert snapshot["queue_wait"]["count"] == 1
+    assert snapshot["latency_by_host"]["www.premierleague.com"]["count"] == 1
+    assert snapshot["gauges"]["in_flight"] == 0
+    assert snapshot["gauges"]["queued"] == {Priority.INTERACTIVE: 0, Priority.PAGE: 0, Priority.BULK: 0}
+    await handler.shutdown()
@@ -0,0 +1,92 @@
+import json
+import pytest
+import asyncio
+from model.scrapers.request_metrics import Histogram, RequestMetrics
+
+def test_histogram_counts_values_into_buckets():
+    histogram = Histogram(bounds=(0.1, 1))
+    for value in (0.05, 0.5, 0.7, 3):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+    assert snapshot["buckets"] == {"le_0.1": 1, "le_1": 2, "le_inf": 1}
+    assert snapshot["count"] == 4
+    assert snapshot["min"] == 0.05
+    assert snapshot["max"] == 3
+
+def test_histogram_quantiles_use_bucket_bounds_capped_by_max():
+    histogram = Histogram(bounds=(0.1, 1, 10))
+    for _ in range(9):
+        histogram.observe(0.05)
+    histogram.observe(4)
+
+    assert histogram.quantile(0.5) == 0.1
+    assert histogram.quantile(0.95) == 4
+    assert Histogram().quantile(0.5) is None
+
+@pytest.mark.parametrize("url, pattern", [
+    ("https://www.premierleague.com/clubs/1/Arsenal/overview", "club"),
+    ("https://www.premierleague.com/players/13286/Alisson/overview", "player"),
+    ("https://www.premierleague.com/match/93330", "match"),
+    ("https://www.premierleague.com/tables", "table"),
+    ("https://resources.premierleague.com/badges/t3.png", "other"),
+])
+def test_classify_groups_urls_by_site_section(url, pattern):
+    assert RequestMetrics.classify(url) == pattern
+
+def test_observe_response_records_latency_bytes_and_status():
+    metrics = RequestMetrics()
+    metrics.observe_response("https://www.premierleague.com/clubs/1/Arsenal/overview", latency=0.2, network_time=0.3, status=200, size=1000)
+    metrics.observe_response("https://www.premierleague.com/match/1", latency=0.4, status=503)
+    metrics.observe_response("https://www.premierleague.com/match/2", error=asyncio.TimeoutError())
+    metrics.observe_response("https://www.premierleague.com/match/3")
+
+    snapshot = metrics.snapshot()
+    assert snapshot["requests"] == 4
+    assert snapshot["status_counts"] == {"200": 1, "503": 1, "error:TimeoutError": 1, "cancelled": 1}
+    assert snapshot["bytes_received"] == 1000
+    assert snapshot["bytes_by_pattern"] == {"club": 1000}
+    assert snapshot["latency_by_host"]["www.premierleague.com"]["count"] == 2
+    assert snapshot["latency_by_pattern"]["match"]["count"] == 1
+    assert snapshot["network_time"]["count"] == 1
+
+def test_queue_wait_is_tracked_separately():
+    metrics = RequestMetrics()
+    metrics.observe_queue_wait(2.0)
+
+    snapshot = metrics.snapshot()
+    assert snapshot["queue_wait"]["count"] == 1
+    assert snapshot["network_time"]["count"] == 0
+
+def test_gauges_are_read_at_snapshot_time():
+    metrics = RequestMetrics()
+    in_flight = []
+    metrics.register_gauge("in_flight", lambda: len(in_flight))
+    metrics.register_gauge("broken", lambda: 1 / 0)
+
+    in_flight.append(object())
+
+    assert metrics.snapshot()["gauges"] == {"in_flight": 1, "broken": None}
+
+def test_reset_clears_observations_but_keeps_gauges():
+    metrics = RequestMetrics()
+    metrics.register_gauge("answer", lambda: 42)
+    metrics.observe_response("https://www.premierleague.com/tables", latency=0.1, status=200, size=10)
+
+    metrics.reset()
+
+    snapshot = metrics.snapshot()
+    assert snapshot["requests"] == 0
+    assert snapshot["latency_by_host"] == {}
+    assert snapshot["gauges"] == {"answer": 42}
+
+def test_export_writes_a_json_snapshot(tmp_path):
+    metrics = RequestMetrics()
+    metrics.observe_response("https://www.premierleague.com/tables", latency=0.1, status=200, size=10)
+
+    path = metrics.export(tmp_path / "metrics" / "snapshot.json")
+
+    exported = json.loads(path.read_text())
+    assert exported["requests"] == 1
+    assert exported["latency_by_pattern"]["table"]["count"] == 1
+    assert not list(path.parent.glob("*.tmp"))
@@ -0,0 +1,84 @@
+import pytest
+import asyncio
+from types import SimpleNamespace
+from model.scrapers.request_queue import Priority, PriorityRequestQueue
+
+def item(name, priority):
+    return SimpleNamespace(name=name, priority=priority)
+
+def drain(queue):
+    names = []
+    while not queue.empty():
+        names.append(queue.get_nowait().name)
+    return names
+
+def test_queue_is_fifo_within_a_class():
+    queue = PriorityRequestQueue()
+    for index in range(3):
+        queue.put_nowait(item(index, Priority.PAGE))
+
+    assert drain(queue) == [0, 1, 2]
+
+def test_queue_serves_classes_in_proportion_to_their_weights():
+    queue = PriorityRequestQueue({Priority.INTERACTIVE: 3, Priority.PAGE: 2, Priority.BULK: 1})
+    for index in range(12):
+        queue.put_nowait(item(f"i{index}", Priority.INTERACTIVE))
+        queue.put_nowait(item(f"p{index}", Priority.PAGE))
+        queue.put_nowait(item(f"b{index}", Priority.BULK))
+
+    first_round = [name[0] for name in drain(queue)[:12]]
+    assert first_round.count("i") == 6
+    assert first_round.count("p") == 4
+    assert first_round.count("b") == 2
+
+def test_queue_does_not_starve_bulk_requests():
+    queue = PriorityRequestQueue()
+    queue.put_nowait(item("bulk", Priority.BULK))
+    for index in range(20):
+        queue.put_nowait(item(index, Priority.INTERACTIVE))
+
+    served = drain(queue)
+    assert served.index("bulk") < 10
+
+def test_interactive_request_jumps_ahead_of_a_bulk_backlog():
+    queue = PriorityRequestQueue()
+    for index in range(1000):
+        queue.put_nowait(item(index, Priority.BULK))
+    queue.put_nowait(item("interactive", Priority.INTERACTIVE))
+
+    assert queue.get_nowait().name == "interactive"
+    assert queue.sizes() == {Priority.INTERACTIVE: 0, Priority.PAGE: 0, Priority.BULK: 1000}
+
+def test_queue_rejects_unknown_priority():
+    queue = PriorityRequestQueue()
+    with pytest.raises(ValueError):
+        queue.put_nowait(item("x", "urgent"))
+
+def test_queue_rejects_non_positive_weights():
+    with pytest.raises(ValueError):
+        PriorityRequestQueue({Priority.PAGE: 1, Priority.BULK: 0})
+
+def test_promote_moves_a_queued_item_to_another_class():
+    queue = PriorityRequestQueue()
+    queued = item("logo", Priority.BULK)
+    queue.put_nowait(item("page", Priority.PAGE))
+    queue.put_nowait(queued)
+
+    assert queue.promote(queued, Priority.INTERACTIVE) is True
+    assert queued.priority == Priority.INTERACTIVE
+    assert queue.get_nowait() is queued
+    assert queue.promote(queued, Priority.INTERACTIVE) is False
+
+def test_get_nowait_on_empty_queue_raises():
+    with pytest.raises(asyncio.QueueEmpty):
+        PriorityRequestQueue().get_nowait()
+
+@pytest.mark.asyncio
+async def test_get_waits_for_an_item():
+    queue = PriorityRequestQueue()
+    getter = asyncio.create_task(queue.get())
+    await asyncio.sleep(0)
+    assert not getter.done()
+
+    queue.put_nowait(item("late", Priority.PAGE))
+    assert (await asyncio.wait_for(getter, timeout=1)).name == "late"
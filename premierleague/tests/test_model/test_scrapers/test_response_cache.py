@@ -0,0 +1,94 @@
+import pytest
+from unittest.mock import patch
+from model.scrapers.response_cache import ResponseCache
+
+@pytest.fixture
+def cache(tmp_path):
+    response_cache = ResponseCache(tmp_path, ttl=100, max_size=10)
+    yield response_cache
+    response_cache.close()
+
+def test_lookup_returns_none_for_unknown_url(cache):
+    assert cache.lookup("http://example.com") is None
+    assert cache.misses == 1
+
+def test_store_and_read_body_roundtrip(cache):
+    cache.store("http://example.com", b"body", {"ETag": '"abc"', "Last-Modified": "yesterday"}, 'utf-8')
+
+    entry = cache.lookup("http://example.com")
+
+    assert cache.read_body(entry) == b"body"
+    assert entry['encoding'] == 'utf-8'
+    assert ResponseCache.conditional_headers(entry) == {"If-None-Match": '"abc"', "If-Modified-Since": "yesterday"}
+
+def test_identical_bodies_are_stored_once(cache, tmp_path):
+    cache.store("http://example.com/a", b"same", {})
+    cache.store("http://example.com/b", b"same", {})
+
+    assert len(list((tmp_path / 'bodies').glob('*/*'))) == 1
+    assert cache.size() == 4
+
+def test_mark_revalidated_refreshes_validators(cache):
+    cache.store("http://example.com", b"body", {"ETag": '"old"'})
+
+    cache.mark_revalidated("http://example.com", {"ETag": '"new"'})
+
+    assert cache.lookup("http://example.com")['etag'] == '"new"'
+    assert cache.revalidated == 1
+
+def test_entries_past_ttl_are_evicted(cache):
+    with patch("model.scrapers.response_cache.time.time", return_value=1000):
+        cache.store("http://example.com", b"body", {})
+
+    with patch("model.scrapers.response_cache.time.time", return_value=1101):
+        assert cache.lookup("http://example.com") is None
+
+def test_is_fresh_respects_fresh_for(tmp_path):
+    cache = ResponseCache(tmp_path, fresh_for=10)
+    with patch("model.scrapers.response_cache.time.time", return_value=1000):
+        cache.store("http://example.com", b"body", {})
+        entry = cache.lookup("http://example.com")
+
+    with patch("model.scrapers.response_cache.time.time", return_value=1005):
+        assert cache.is_fresh(entry)
+    with patch("model.scrapers.response_cache.time.time", return_value=1011):
+        assert not cache.is_fresh(entry)
+    cache.close()
+
+def test_size_limit_evicts_least_recently_used(tmp_path):
+    cache = ResponseCache(tmp_path, max_size=10)
+    clock = iter(range(100))
+    with patch("model.scrapers.response_cache.time.time", side_effect=lambda: 1000 + next(clock)):
+        cache.store("http://example.com/a", b"aaaa", {})
+        cache.store("http://example.com/b", b"bbbb", {})
+        cache.read_body(cache.lookup("http://example.com/a"))
+        cache.store("http://example.com/c", b"cccc", {})
+
+        assert cache.lookup("http://example.com/b") is None
+        assert cache.lookup("http://example.com/a") is not None
+        assert cache.lookup("http://example.com/c") is not None
+    assert len(list((tmp_path / 'bodies').glob('*/*'))) == 2
+    cache.close()
+
+def test_expiring_an_entry_keeps_bodies_other_urls_share(cache, tmp_path):
+    with patch("model.scrapers.response_cache.time.time", return_value=1000):
+        cache.store("http://example.com/a", b"same", {})
+    with patch("model.scrapers.response_cache.time.time", return_value=1050):
+        cache.store("http://example.com/b", b"same", {})
+
+    with patch("model.scrapers.response_cache.time.time", return_value=1101):
+        assert cache.lookup("http://example.com/a") is None
+        assert cache.read_body(cache.lookup("http://example.com/b")) == b"same"
+
+def test_only_explicit_evict_sweeps_unreferenced_bodies(cache, tmp_path):
+    stray = tmp_path / 'bodies' / 'ab' / 'abcdef'
+    cache.store("http://example.com", b"body", {})
+    stray.parent.mkdir(parents=True, exist_ok=True)
+    stray.write_bytes(b"left by an interrupted run")
+
+    with patch.object(ResponseCache, '_remove_orphan_bodies') as sweep:
+        cache.store("http://example.com/other", b"more", {})
+    sweep.assert_not_called()
+
+    cache.evict()
+    assert not stray.exists()
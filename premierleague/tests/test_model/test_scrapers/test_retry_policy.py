@@ -0,0 +1,74 @@
+import pytest
+import asyncio
+import aiohttp
+from unittest.mock import patch
+from model.scrapers.retry_policy import RetryPolicy
+
+def test_rejects_invalid_max_attempts():
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
+
+@pytest.mark.parametrize("exception, expected", [
+    (aiohttp.ClientConnectionError(), True),
+    (asyncio.TimeoutError(), True),
+    (ConnectionResetError(), True),
+    (ValueError("parse error"), False),
+])
+def test_should_retry_only_transient_exceptions(exception, expected):
+    policy = RetryPolicy(max_attempts=3)
+    assert policy.should_retry(1, exception=exception) is expected
+
+def test_should_retry_response_errors_by_status():
+    policy = RetryPolicy(status_rules={503: 3})
+    assert policy.should_retry(1, exception=aiohttp.ClientResponseError(None, (), status=503))
+    assert not policy.should_retry(1, exception=aiohttp.ClientResponseError(None, (), status=404))
+
+def test_should_retry_stops_at_max_attempts():
+    policy = RetryPolicy(max_attempts=3)
+    assert policy.should_retry(2, exception=asyncio.TimeoutError())
+    assert not policy.should_retry(3, exception=asyncio.TimeoutError())
+
+def test_should_retry_uses_per_status_rules():
+    policy = RetryPolicy(status_rules={503: 2, 404: 1})
+
+    assert policy.should_retry(1, status=503)
+    assert not policy.should_retry(2, status=503)
+    assert not policy.should_retry(1, status=404)
+    assert not policy.should_retry(1, status=200)
+    assert not policy.should_retry(1, status=500)
+
+def test_compute_delay_grows_exponentially_and_is_capped():
+    policy = RetryPolicy(base_delay=1, max_delay=5)
+
+    with patch("model.scrapers.retry_policy.random.uniform", side_effect=lambda low, high: high):
+        delays = [policy.compute_delay(attempt) for attempt in range(1, 6)]
+
+    assert delays == [1, 2, 4, 5, 5]
+
+def test_compute_delay_applies_jitter():
+    policy = RetryPolicy(base_delay=1, max_delay=60)
+
+    with patch("model.scrapers.retry_policy.random.uniform", return_value=0.25) as mock_uniform:
+        assert policy.compute_delay(3) == 0.25
+
+    mock_uniform.assert_called_once_with(0, 4)
+
+@pytest.mark.parametrize("status", [429, 503])
+def test_compute_delay_respects_retry_after_seconds(status):
+    policy = RetryPolicy(base_delay=1)
+    assert policy.compute_delay(1, status=status, retry_after="30") >= 30
+
+def test_compute_delay_ignores_retry_after_for_other_statuses():
+    policy = RetryPolicy(base_delay=1)
+    assert policy.compute_delay(1, status=500, retry_after="30") <= 1
+
+def test_compute_delay_caps_retry_after():
+    policy = RetryPolicy(max_retry_after=10)
+    assert policy.compute_delay(1, status=429, retry_after="3600") == 10
+
+def test_parse_retry_after_http_date():
+    with patch("model.scrapers.retry_policy.time.time", return_value=1704067200):  # 2024-01-01 00:00:00 GMT
+        assert RetryPolicy.parse_retry_after("Mon, 01 Jan 2024 00:01:00 GMT") == pytest.approx(60)
+
+def test_parse_retry_after_invalid_value():
+    assert RetryPolicy.parse_retry_after("soon") is None
@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import patch, MagicMock, AsyncMock
 from model.scrapers.tables_data_scraper import TablesDataScraper
+from model.scrapers.parser_engine import ParserEngine
 from model.scrapers.premierleague_website_scraper import PremierleagueWebsiteScraper
 from tests.utils import load_fixture
 from collections import Counter
@@ -93,7 +94,7 @@ async def test_initialize_method_behavior(mock_request_handler, tables_page):
 
     # Assert _structure is a BeautifulSoup object created from the returned HTML
     assert isinstance(scraper._structure, BeautifulSoup)
-    assert scraper._structure.decode() == BeautifulSoup(tables_page, 'html.parser').decode()
+    assert scraper._structure.decode() == ParserEngine.parse(tables_page, regions=TablesDataScraper.TABLES_PAGE_REGIONS).decode()
     
 
 @pytest.mark.asyncio
@@ -0,0 +1,150 @@
+import pytest
+import asyncio
+import aiohttp
+from unittest.mock import patch, MagicMock
+from model.scrapers.request_handler import RequestHandler
+from model.scrapers.transport import ResponseArchive, ArchivedResponse, LiveTransport, RecordingTransport, ReplayTransport
+
+@pytest.fixture(autouse=True)
+def reset_singleton():
+    RequestHandler.reset()
+    yield
+    RequestHandler.reset()
+
+@pytest.fixture
+def archive(tmp_path):
+    return ResponseArchive(tmp_path / "archive")
+
+class LiveResponse:
+    def __init__(self, body, status=200, headers=None):
+        self.status = status
+        self.headers = headers or {}
+        self._body = body
+
+    async def read(self):
+        return self._body
+
+    def get_encoding(self):
+        return 'utf-8'
+
+class LiveContextManager:
+    def __init__(self, response):
+        self.response = response
+
+    async def __aenter__(self):
+        return self.response
+
+    async def __aexit__(self, *args):
+        return None
+
+def test_archive_round_trip_drops_transfer_headers(archive):
+    archive.save("https://www.premierleague.com/tables", 200, {"ETag": '"v1"', "content-encoding": "gzip", "Content-Length": "3"}, b"<table/>", "utf-8")
+
+    entry, body = archive.load("https://www.premierleague.com/tables")
+    assert body == b"<table/>"
+    assert entry["status"] == 200
+    assert entry["headers"] == [["ETag", '"v1"']]
+    assert archive.urls() == ["https://www.premierleague.com/tables"]
+    assert archive.load("https://www.premierleague.com/clubs") is None
+
+@pytest.mark.asyncio
+async def test_archived_response_streams_in_chunks():
+    response = ArchivedResponse("https://example.com/logo.png", 200, [], b"abcdefg")
+
+    chunks = [chunk async for chunk in response.content.iter_chunked(3)]
+
+    assert chunks == [b"abc", b"def", b"g"]
+    assert response.content_length == 7
+
+def test_archived_response_raises_for_error_status():
+    with pytest.raises(aiohttp.ClientResponseError) as error:
+        ArchivedResponse("https://example.com/missing", 404, [], b"").raise_for_status()
+    assert error.value.status == 404
+
+def test_live_transport_uses_connection_pool():
+    pool = MagicMock()
+    assert LiveTransport().create_session(pool) is pool.create_session.return_value
+
+@pytest.mark.asyncio
+async def test_recording_session_archives_responses(archive):
+    pool = MagicMock()
+    pool.create_session.return_value.get.return_value = LiveContextManager(LiveResponse(b"<html/>", headers={"ETag": "x"}))
+    session = RecordingTransport(archive).create_session(pool)
+
+    async with session.get("https://www.premierleague.com/clubs") as response:
+        assert response.status == 200
+        assert await response.read() == b"<html/>"
+
+    entry, body = archive.load("https://www.premierleague.com/clubs")
+    assert body == b"<html/>"
+    assert entry["encoding"] == "utf-8"
+
+@pytest.mark.asyncio
+async def test_recording_session_drops_conditional_headers(archive):
+    pool = MagicMock()
+    pool.create_session.return_value.get.return_value = LiveContextManager(LiveResponse(b"<html/>"))
+    session = RecordingTransport(archive).create_session(pool)
+
+    headers = {"User-Agent": "agent", "If-None-Match": '"abc"', "If-Modified-Since": "yesterday"}
+    async with session.get("https://www.premierleague.com/clubs", headers=headers):
+        pass
+
+    pool.create_session.return_value.get.assert_called_once_with("https://www.premierleague.com/clubs", headers={"User-Agent": "agent"})
+    assert archive.load("https://www.premierleague.com/clubs") is not None
+
+@pytest.mark.asyncio
+async def test_replay_serves_archived_responses_with_simulated_latency(archive):
+    archive.save("https://www.premierleague.com/tables", 200, {}, b"<table/>", "utf-8")
+    transport = ReplayTransport(archive, latency=0.25)
+    session = transport.create_session(MagicMock())
+
+    with patch("model.scrapers.transport.asyncio.sleep") as sleep:
+        async with session.get("https://www.premierleague.com/tables") as response:
+            assert await response.read() == b"<table/>"
+
+    sleep.assert_awaited_once_with(0.25)
+    assert transport.served == 1
+
+@pytest.mark.asyncio
+async def test_replay_answers_unknown_urls_with_missing_status(archive):
+    transport = ReplayTransport(archive)
+
+    response = await transport.replay("https://www.premierleague.com/unknown")
+
+    assert response.status == 404
+    assert transport.missing == 1
+
+def test_replay_rejects_negative_latency(archive):
+    with pytest.raises(ValueError):
+        ReplayTransport(archive, latency=-1)
+
+@pytest.mark.asyncio
+async def test_request_handler_runs_offline_on_replay_transport(archive):
+    archive.save("https://www.premierleague.com/tables", 200, {}, "<table>ü</table>".encode(), "utf-8")
+    archive.save("https://resources.premierleague.com/badge.png", 200, {}, b"\x89PNG", None)
+
+    handler = RequestHandler()
+    await handler.configure(response_cache=False, transport=ReplayTransport(archive))
+
+    # the offline run isn't held to the live site's request rate
+    assert handler._rate_limiter is None
+    pages = [handler.get(f"https://www.premierleague.com/tables?page={page}") for page in range(RequestHandler.DEFAULT_BURST + 3)]
+    await asyncio.wait_for(asyncio.gather(*pages, return_exceptions=True), timeout=1)
+    html = await asyncio.wait_for(handler.get("https://www.premierleague.com/tables"), timeout=1)
+    badge = await asyncio.wait_for(handler.get("https://resources.premierleague.com/badge.png", raw=True, max_size=1024), timeout=1)
+
+    assert html == "<table>ü</table>"
+    assert badge == b"\x89PNG"
+    await handler.shutdown()
+
+@pytest.mark.asyncio
+async def test_changing_transport_reopens_the_session(archive):
+    handler = RequestHandler()
+    await handler.configure(response_cache=False, transport=ReplayTransport(archive))
+    first_session = handler.session
+
+    await handler.configure(transport=ReplayTransport(archive))
+
+    assert handler.session is not first_session
+    assert first_session.closed
+    await handler.shutdown()